@@ -0,0 +1,48 @@
+"""
+Per-request overhead of a compiled dispatch plan versus a direct method call.
+
+Run from the repository root:
+
+    python -m benchmarks.dispatch_overhead
+"""
+import timeit
+from typing import Optional
+from nest_py.common import controller, get
+from nest_py.core import NestPyApplicationContext
+
+NUMBER = 200_000
+REPEAT = 5
+
+
+@controller("/bench")
+class BenchController:
+
+    @get("/{id}")
+    def get_item(self, id: int, search: Optional[str] = None):
+        return id
+
+
+def best_of(stmt) -> float:
+    return min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e9
+
+
+def main() -> None:
+    ctx_app = NestPyApplicationContext()
+    instance = BenchController()
+    plan = ctx_app.compile_controller("BenchController", instance)[0]
+    endpoint = plan.endpoint
+    raw = {"id": "42"}
+
+    results = {
+        "direct method call": best_of(lambda: instance.get_item(id=42)),
+        "plan endpoint": best_of(lambda: endpoint(id=42)),
+        "plan build_kwargs + endpoint": best_of(lambda: endpoint(**plan.build_kwargs(raw))),
+    }
+
+    baseline = results["direct method call"]
+    for name, ns in results.items():
+        print(f"{name:<30} {ns:8.1f} ns/call  (+{ns - baseline:6.1f} ns)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Per-request cost of validation pipes for the `UserCreate`/`EmployeeCreate`
+payloads of the example application, imported from `models.py` so that
+no application is built.
+
+Compares a compiled `ValidationPipe` (one cached `TypeAdapter` per
+annotation) with building the adapter on every call, the pass-through for
+already validated models, and the `trusted()` fast path that skips pipes.
+The route pipes are awaited in a loop inside one coroutine, so the figures
+do not include starting the event loop for every call.
+Requires pydantic (and email-validator for `EmailStr`). Run from the
+repository root:
+
+    python -m benchmarks.pipe_overhead
+"""
+import asyncio
+import time
+import timeit
+from pydantic import TypeAdapter
+from models import EmployeeCreate, UserCreate
+from nest_py.common.pipes import ValidationPipe
+from nest_py.core.constants import ParamKind
+from nest_py.core.pipes import compile_argument_pipes, trusted
+from nest_py.core.structures import ArgumentMetadata, ParameterPlan
+
+NUMBER = 20_000
+REPEAT = 5
+
+PAYLOADS = {
+    "UserCreate": (UserCreate, {"username": "alice", "email": "alice@example.com"}),
+    "EmployeeCreate": (EmployeeCreate, {"name": "John Doe", "role": "Manager", "salary": 55000}),
+}
+
+
+def best_of(stmt) -> float:
+    return min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e9
+
+
+def best_of_async(loop: asyncio.AbstractEventLoop, run) -> float:
+    return min(loop.run_until_complete(run()) for _ in range(REPEAT)) / NUMBER * 1e9
+
+
+def main() -> None:
+    loop = asyncio.new_event_loop()
+    pipe = ValidationPipe()
+
+    for name, (model, payload) in PAYLOADS.items():
+        metadata = ArgumentMetadata(ParamKind.BODY, model, "body")
+        validate = pipe.compile(metadata)
+        instance = validate(dict(payload))
+        param = ParameterPlan("body", ParamKind.BODY, model, None, True, None)
+        apply = compile_argument_pipes((param,), (pipe,))
+
+        async def run_pipes() -> float:
+            start = time.perf_counter()
+            for _ in range(NUMBER):
+                await apply({"body": payload})
+            return time.perf_counter() - start
+
+        async def run_trusted() -> float:
+            start = time.perf_counter()
+            for _ in range(NUMBER):
+                with trusted():
+                    await apply({"body": payload})
+            return time.perf_counter() - start
+
+        results = {
+            "TypeAdapter built per call": best_of(lambda: TypeAdapter(model).validate_python(payload)),
+            "compiled ValidationPipe": best_of(lambda: validate(payload)),
+            "validated instance passthrough": best_of(lambda: validate(instance)),
+            "route pipes (dict payload)": best_of_async(loop, run_pipes),
+            "route pipes, trusted()": best_of_async(loop, run_trusted),
+        }
+
+        print(name)
+        for label, ns in results.items():
+            print(f"  {label:<32} {ns:10.1f} ns/request")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Route match latency of the radix router versus the linear (regex scan) router.
+
+Run from the repository root:
+
+    python -m benchmarks.router_match
+"""
+import random
+import timeit
+from nest_py.core.router import LinearRouter, RadixRouter, compile_route
+from nest_py.core.structures import RouteDefinition
+
+SIZES = (10, 100, 1000)
+LOOKUPS = 2_000
+REPEAT = 5
+TEMPLATES = (
+    ("GET", "/resource{i}/"),
+    ("POST", "/resource{i}/"),
+    ("GET", "/resource{i}/{{id}}"),
+    ("PUT", "/resource{i}/{{id}}"),
+    ("GET", "/resource{i}/{{id}}/items/{{item_id}}"),
+)
+
+
+class BenchController:
+
+    def handler(self, id: int = 0, item_id: int = 0):
+        return id
+
+
+def build_plans(size: int):
+    controller = BenchController()
+    method = controller.handler
+    plans = []
+    for index in range(size):
+        http_method, template = TEMPLATES[index % len(TEMPLATES)]
+        route = RouteDefinition(
+            handler=BenchController.handler,
+            metadata={"args": (template.format(i=index // len(TEMPLATES)),), "kwargs": {"methods": [http_method]}}
+        )
+        plans.append(compile_route(BenchController, method, route))
+    return plans
+
+
+def sample_requests(plans, count: int):
+    rng = random.Random(7)
+    requests = []
+    for _ in range(count):
+        plan = rng.choice(plans)
+        path = plan.path.replace("{id}", str(rng.randint(1, 9999))).replace("{item_id}", "42")
+        requests.append((plan.methods[0], path))
+    return requests
+
+
+def measure(router, requests) -> float:
+    match = router.match
+
+    def run():
+        for method, path in requests:
+            match(method, path)
+
+    return min(timeit.repeat(run, number=1, repeat=REPEAT)) / len(requests) * 1e9
+
+
+def main() -> None:
+    print(f"{'routes':>7} {'linear ns/match':>16} {'radix ns/match':>15} {'speedup':>8}")
+    for size in SIZES:
+        plans = build_plans(size)
+        linear, radix = LinearRouter(), RadixRouter()
+        for plan in plans:
+            linear.add(plan)
+            radix.add(plan)
+
+        requests = sample_requests(plans, LOOKUPS)
+        assert all(radix.match(*request) is not None for request in requests)
+        linear_ns, radix_ns = measure(linear, requests), measure(radix, requests)
+        print(f"{size:>7} {linear_ns:>16.1f} {radix_ns:>15.1f} {linear_ns / radix_ns:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
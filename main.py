@@ -1,49 +1,12 @@
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
-from nest_py.common import controller, get, post, put, delete, module, injectable
-from nest_py.core import NestPyApplicationContext
-from fastapi_adapter import FastAPIAdapter
-
-
-# =========================
-# MODELOS
-# =========================
-class UserBase(BaseModel):
-    username: str = Field(..., min_length=3, max_length=50)
-    email: EmailStr
-
-
-class UserCreate(UserBase):
-    pass
-
-
-class UserUpdate(BaseModel):
-    username: Optional[str] = Field(None, min_length=3, max_length=50)
-    email: Optional[EmailStr] = None
-
-
-class User(UserBase):
-    id: int
-
-
-class EmployeeBase(BaseModel):
-    name: str = Field(..., min_length=3, max_length=100)
-    role: str
-    salary: float = Field(..., ge=0)
-
-
-class EmployeeCreate(EmployeeBase):
-    pass
-
-
-class EmployeeUpdate(BaseModel):
-    name: Optional[str] = Field(None, min_length=3, max_length=100)
-    role: Optional[str] = None
-    salary: Optional[float] = Field(None, ge=0)
-
-
-class Employee(EmployeeBase):
-    id: int
+from typing import List, Optional
+from nest_py.common import (
+    catch, controller, get, post, put, delete, module, injectable, serialize, stream, use_filters
+)
+from nest_py.common.exceptions import BadRequestException, ExceptionFilter, NotFoundException
+from nest_py.core.constants import StreamMode
+from nest_py.core import NestPyFactory
+from nest_py.core.adapters.fastapi_adapter import FastAPIAdapter
+from models import Employee, EmployeeCreate, EmployeeUpdate, User, UserCreate, UserUpdate
 
 
 # =========================
@@ -67,6 +30,11 @@ class UserService:
             result = [u for u in result if search.lower() in u.username.lower()]
         return result
 
+    def iter_users(self, search: Optional[str] = None):
+        for k, v in list(self.users.items()):
+            if not search or search.lower() in v["username"].lower():
+                yield User(id=k, **v)
+
     def get_user(self, id: int):
         if id not in self.users:
             return None
@@ -138,67 +106,81 @@ class EmployeeService:
         del self.employees[id]
 
 
+# =========================
+# FILTROS
+# =========================
+
+@catch(KeyError)
+class NotFoundFilter(ExceptionFilter):
+    def catch(self, exception, context):
+        return NotFoundException(exception.args[0] if exception.args else None)
+
+
+@catch(ValueError)
+class BadRequestFilter(ExceptionFilter):
+    def catch(self, exception, context):
+        return BadRequestException(str(exception))
+
+
 # =========================
 # CONTROLADORES
 # =========================
 
 @controller("/users")
+@use_filters(NotFoundFilter, BadRequestFilter)
 class UserController:
     
-    def __init__(self, service: UserService = UserService()):
+    def __init__(self, service: UserService):
         self.service = service
 
     @get("/")
-    def get_users(self, search: Optional[str] = None):
+    @serialize()
+    def get_users(self, search: Optional[str] = None) -> List[User]:
         return self.service.list_users(search)
 
+    @get("/export")
+    @stream(StreamMode.NDJSON)
+    def export_users(self, search: Optional[str] = None):
+        yield from self.service.iter_users(search)
+
     @get("/{id}")
     def get_user(self, id: int):
         user = self.service.get_user(id)
         if not user:
-            return {"error": "User not found"}, 404
+            raise NotFoundException("User not found")
         return user
 
     @post("/")
     def create_user(self, user: UserCreate):
-        try:
-            return self.service.create_user(user)
-        except ValueError as e:
-            return {"error": str(e)}, 400
+        return self.service.create_user(user)
 
     @put("/{id}")
     def update_user(self, id: int, user: UserUpdate):
-        try:
-            return self.service.update_user(id, user)
-        except KeyError:
-            return {"error": "User not found"}, 404
-        except ValueError as e:
-            return {"error": str(e)}, 400
+        return self.service.update_user(id, user)
 
     @delete("/{id}")
     def delete_user(self, id: int):
-        try:
-            self.service.delete_user(id)
-            return {"message": "User deleted successfully"}
-        except KeyError:
-            return {"error": "User not found"}, 404
+        self.service.delete_user(id)
+        return {"message": "User deleted successfully"}
 
 
 @controller("/employees")
+@use_filters(NotFoundFilter)
 class EmployeeController:
     
-    def __init__(self, service: EmployeeService = EmployeeService()):
+    def __init__(self, service: EmployeeService):
         self.service = service
 
     @get("/")
-    def get_employees(self, min_salary: Optional[float] = None):
+    @serialize()
+    def get_employees(self, min_salary: Optional[float] = None) -> List[Employee]:
         return self.service.list_employees(min_salary)
 
     @get("/{id}")
     def get_employee(self, id: int):
         emp = self.service.get_employee(id)
         if not emp:
-            return {"error": "Employee not found"}, 404
+            raise NotFoundException("Employee not found")
         return emp
 
     @post("/")
@@ -207,18 +189,12 @@ class EmployeeController:
 
     @put("/{id}")
     def update_employee(self, id: int, employee: EmployeeUpdate):
-        try:
-            return self.service.update_employee(id, employee)
-        except KeyError:
-            return {"error": "Employee not found"}, 404
+        return self.service.update_employee(id, employee)
 
     @delete("/{id}")
     def delete_employee(self, id: int):
-        try:
-            self.service.delete_employee(id)
-            return {"message": "Employee deleted successfully"}
-        except KeyError:
-            return {"error": "Employee not found"}, 404
+        self.service.delete_employee(id)
+        return {"message": "Employee deleted successfully"}
 
 
 @module(
@@ -235,35 +211,21 @@ class AppModule:
     pass
 
 
-nestpy = NestPyApplicationContext()
-
-app = FastAPIAdapter()
-app.is_async(True)
-app.conf.set_debug(False)
-app.conf.set_description("NestPy Core App")
-app.conf.set_title("NestPy")
-app.conf.set_version("1.0")
-app.conf.set_contact({
-    "name": "Brandon Jared Molina Vázquez",
-    "email": "jaredbrandon970@gmail.com"
-})
-
-
-for name, params in nestpy.get_controllers().items():
-    app.comp.add_router_group(name, prefix=params.get("params").get("args")[0])
-    controller_class = params.get("controller_class")
-
-    for route in params.get("routes"):
-        handler = route.get("handler")
-
-        app.comp.add_route_in_router_group(
-            name,
-            endpoint=nestpy.wrap_handler(controller_class(), handler),
-            tags=[name],
-            path=route.get("metadata").get("args")[0],
-            **route.get("metadata").get("kwargs")
-        )
+app = NestPyFactory.create(
+    AppModule,
+    adapter=FastAPIAdapter(
+        debug=False,
+        description="NestPy Core App",
+        title="NestPy",
+        version="1.0",
+        contact={
+            "name": "Brandon Jared Molina Vázquez",
+            "email": "jaredbrandon970@gmail.com"
+        }
+    )
+)
+app.enable_batch(max_concurrency=8)
 
 
 if __name__ == "__main__":
-    app.lif.start_server("127.0.0.1", 5000)
+    app.listen("127.0.0.1", 5000)
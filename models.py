@@ -0,0 +1,43 @@
+from typing import Optional
+from pydantic import BaseModel, EmailStr, Field
+
+
+# =========================
+# MODELOS
+# =========================
+class UserBase(BaseModel):
+    username: str = Field(..., min_length=3, max_length=50)
+    email: EmailStr
+
+
+class UserCreate(UserBase):
+    pass
+
+
+class UserUpdate(BaseModel):
+    username: Optional[str] = Field(None, min_length=3, max_length=50)
+    email: Optional[EmailStr] = None
+
+
+class User(UserBase):
+    id: int
+
+
+class EmployeeBase(BaseModel):
+    name: str = Field(..., min_length=3, max_length=100)
+    role: str
+    salary: float = Field(..., ge=0)
+
+
+class EmployeeCreate(EmployeeBase):
+    pass
+
+
+class EmployeeUpdate(BaseModel):
+    name: Optional[str] = Field(None, min_length=3, max_length=100)
+    role: Optional[str] = None
+    salary: Optional[float] = Field(None, ge=0)
+
+
+class Employee(EmployeeBase):
+    id: int
@@ -0,0 +1,5 @@
+import sys
+from nest_py.cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,65 @@
+import argparse
+import os
+import sys
+from typing import List, Optional
+from nest_py.core.discovery.discovery import DISCOVERY_CACHE_PATH
+from nest_py.core.manifest import MANIFEST_ENV, MANIFEST_PATH, build_manifest, write_manifest
+
+
+def build_manifest_command(args: argparse.Namespace) -> int:
+    from nest_py.core import NestPyFactory
+
+    os.environ[MANIFEST_ENV] = ""
+    app = NestPyFactory.create(args.module)
+    manifest = build_manifest(app.context)
+    path = write_manifest(manifest, args.output)
+
+    print(
+        f"Wrote {path}: {len(manifest['controllers'])} controllers, "
+        f"{len(manifest['modules'])} modules, {len(manifest['injectables'])} injectables"
+    )
+    return 0
+
+
+def list_routes_command(args: argparse.Namespace) -> int:
+    from nest_py.core.discovery import ComponentDiscovery
+
+    discovery = ComponentDiscovery(args.source, None if args.no_cache else args.cache, args.workers)
+    routes = discovery.routes(args.module)
+    width = max((len(methods) for methods, _, _ in routes), default=6)
+    for methods, path, handler in routes:
+        print(f"{methods:<{width}}  {path:<40} {handler}")
+    print(f"{len(routes)} routes")
+    return 0
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="nest_py", description="NestPy command line tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    manifest = commands.add_parser(
+        "manifest",
+        help="precompile the controller/module/injectable registry into a manifest"
+    )
+    manifest.add_argument("module", help="root module reference, e.g. app.app_module:AppModule")
+    manifest.add_argument("-o", "--output", default=MANIFEST_PATH, help=f"output path (default: {MANIFEST_PATH})")
+    manifest.set_defaults(func=build_manifest_command)
+
+    routes = commands.add_parser(
+        "routes",
+        help="list routes by parsing the source tree, without importing it"
+    )
+    routes.add_argument("module", nargs="?", help="only list routes reachable from this root module")
+    routes.add_argument("-s", "--source", default=".", help="source directory to scan (default: .)")
+    routes.add_argument("--cache", default=DISCOVERY_CACHE_PATH, help=f"parse cache (default: {DISCOVERY_CACHE_PATH})")
+    routes.add_argument("--no-cache", action="store_true", help="parse every file and do not write the cache")
+    routes.add_argument("-w", "--workers", type=int, default=None, help="parser processes (0 parses inline)")
+    routes.set_defaults(func=list_routes_command)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    sys.path.insert(0, os.getcwd())
+    args = create_parser().parse_args(argv)
+    return args.func(args)
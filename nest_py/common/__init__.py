@@ -1,13 +1,35 @@
+from nest_py.common.decorators.core.cache import cache
+from nest_py.common.decorators.core.catch import catch
 from nest_py.common.decorators.core.controller import controller
 from nest_py.common.decorators.core.injectable import injectable
+from nest_py.common.decorators.core.offload import offload
+from nest_py.common.decorators.core.schedule import cron, interval, timeout
+from nest_py.common.decorators.core.stream import stream
+from nest_py.common.decorators.core.use_filters import use_filters
+from nest_py.common.decorators.core.use_guards import use_guards
+from nest_py.common.decorators.core.use_interceptors import use_interceptors
+from nest_py.common.decorators.core.use_pipes import use_pipes
 from nest_py.common.decorators.http.request_mapping import get, post, put, delete, head, patch, options
 from nest_py.common.decorators.modules.module import module
+from nest_py.common.serializer import serialize
 
 
 __all__ = [
+    "cache",
+    "catch",
     "controller",
     "injectable",
+    "offload",
+    "interval",
+    "timeout",
+    "cron",
+    "stream",
+    "use_filters",
+    "use_guards",
+    "use_interceptors",
+    "use_pipes",
     "module",
+    "serialize",
     "get",
     "post",
     "put",
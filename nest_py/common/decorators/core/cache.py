@@ -0,0 +1,15 @@
+from typing import Callable, Optional, TypeVar
+from nest_py.common.decorators.core.use_interceptors import use_interceptors
+from nest_py.core.interceptors import CacheBackend, CacheInterceptor
+from nest_py.core.interceptors.cache import CacheKey
+
+T = TypeVar("T")
+
+
+def cache(
+    ttl: Optional[float] = None,
+    key: Optional[CacheKey] = None,
+    backend: Optional[CacheBackend] = None,
+    max_size: int = 1024
+) -> Callable[[T], T]:
+    return use_interceptors(CacheInterceptor(ttl, key, backend, max_size))
@@ -0,0 +1,12 @@
+from typing import Callable, Type, TypeVar
+from nest_py.core import Reflect
+from nest_py.core.constants import MetadataKeys
+
+T = TypeVar("T")
+
+
+def catch(*exceptions: Type[BaseException]) -> Callable[[Type[T]], Type[T]]:
+    def wrapper(cls: Type[T]) -> Type[T]:
+        Reflect.defineMetadata(MetadataKeys.CATCH_METADATA, exceptions, cls)
+        return cls
+    return wrapper
@@ -1,3 +1,4 @@
+from time import perf_counter
 from typing import Callable, Type, TypeVar
 from nest_py.core import NestPyApplicationContext, Reflect
 from nest_py.core.constants import MetadataKeys
@@ -10,17 +11,18 @@ T = TypeVar("T")
 
 def controller(*args, **kwargs) -> Callable[[Type[T]], Type[T]]:
     def wrapper(cls: Type[T]) -> Type[T]:
-        handlers = Reflect.getFunctions(cls)
+        start = perf_counter()
+        manifest = ctx_app.get_manifest()
+        names = manifest.get_route_handlers(cls) if manifest is not None else None
+        handlers = Reflect.getFunctions(cls) if names is None else [(name, getattr(cls, name)) for name in names]
         routes = []
 
         for name, handler in handlers:
-            if Reflect.has(handler, MetadataKeys.ROUTE_METADATA):
-                routes.append(RouteDefinition(
-                    handler=handler,
-                    metadata=Reflect.get(handler, MetadataKeys.ROUTE_METADATA)
-                ))
-                Reflect.deleteProperty(handler, MetadataKeys.ROUTE_METADATA)
+            metadata = Reflect.getMetadata(MetadataKeys.ROUTE_METADATA, handler)
+            if metadata is not None:
+                routes.append(RouteDefinition(handler=handler, metadata=metadata))
 
         ctx_app.register_controller(cls, routes, (args, kwargs))
+        ctx_app.record_registration(cls.__module__, perf_counter() - start)
         return cls
     return wrapper
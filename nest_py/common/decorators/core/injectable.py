@@ -1,4 +1,6 @@
+from time import perf_counter
 from typing import Type, TypeVar, Callable
+from nest_py.core.constants import Scope
 from nest_py.core.nestpy_application_context import NestPyApplicationContext
 
 
@@ -6,8 +8,10 @@ ctx_app = NestPyApplicationContext()
 T = TypeVar("T")
 
 
-def injectable(*args, **kwargs) -> Callable[[Type[T]], Type[T]]:
+def injectable(scope: str = Scope.SINGLETON, pool_size: int = 0) -> Callable[[Type[T]], Type[T]]:
     def wrapper(cls: Type[T]):
-        ctx_app.register_injectable(cls)
+        start = perf_counter()
+        ctx_app.register_injectable(cls, scope=scope, pool_size=pool_size)
+        ctx_app.record_registration(cls.__module__, perf_counter() - start)
         return cls
     return wrapper
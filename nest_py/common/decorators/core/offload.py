@@ -0,0 +1,39 @@
+from concurrent.futures import Executor
+from functools import wraps
+from typing import Any, Callable, Optional, Union
+from nest_py.core import NestPyApplicationContext, Reflect
+from nest_py.core.constants import MetadataKeys, OffloadPolicy
+from nest_py.core.reflect import IS_ASYNC_GEN_FUNC, IS_COROUTINE_FUNC, IS_GEN_FUNC
+
+ctx_app = NestPyApplicationContext()
+
+
+def process_method(func: Callable[..., Any]) -> Callable[..., Any]:
+    if IS_COROUTINE_FUNC(func) or IS_GEN_FUNC(func) or IS_ASYNC_GEN_FUNC(func):
+        raise ValueError(f"Only plain sync methods can be offloaded to a process, not '{func.__qualname__}'")
+    ctx_app.get_process_pool().register(func.__module__)
+
+    @wraps(func)
+    async def offloaded(self, *args, **kwargs) -> Any:
+        return await ctx_app.get_process_pool().call(self, func.__name__, args, kwargs)
+
+    return offloaded
+
+
+def offload(
+    policy: str = OffloadPolicy.THREADPOOL,
+    executor: Optional[Union[Executor, str]] = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    if executor == OffloadPolicy.PROCESS:
+        policy, executor = OffloadPolicy.PROCESS, None
+    elif executor is not None:
+        policy = OffloadPolicy.EXECUTOR
+    elif policy == OffloadPolicy.EXECUTOR:
+        raise ValueError("The executor offload policy requires an executor")
+
+    def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
+        if policy == OffloadPolicy.PROCESS:
+            func = process_method(func)
+        Reflect.defineMetadata(MetadataKeys.OFFLOAD_METADATA, {"policy": policy, "executor": executor}, func)
+        return func
+    return wrapper
@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import Any, Callable, Optional
+from nest_py.core import NestPyApplicationContext, Reflect
+from nest_py.core.constants import JobKind, MetadataKeys, OffloadPolicy
+from nest_py.core.reflect import IS_ASYNC_GEN_FUNC, IS_COROUTINE_FUNC, IS_GEN_FUNC
+from nest_py.core.services.cron import CronExpression
+from nest_py.core.structures import ScheduledJob
+
+ctx_app = NestPyApplicationContext()
+
+EXECUTORS = {
+    None: None,
+    "thread": OffloadPolicy.THREADPOOL,
+    OffloadPolicy.THREADPOOL: OffloadPolicy.THREADPOOL,
+    OffloadPolicy.INLINE: OffloadPolicy.INLINE,
+    OffloadPolicy.PROCESS: OffloadPolicy.PROCESS,
+}
+
+
+def schedule(job: ScheduledJob) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
+        if IS_GEN_FUNC(func) or IS_ASYNC_GEN_FUNC(func):
+            raise ValueError(f"Generators cannot be scheduled: '{func.__qualname__}'")
+        if job.policy == OffloadPolicy.PROCESS:
+            if IS_COROUTINE_FUNC(func):
+                raise ValueError(f"Only plain sync methods can run in a process, not '{func.__qualname__}'")
+            ctx_app.get_process_pool().register(func.__module__)
+        jobs = Reflect.getOwnMetadata(MetadataKeys.SCHEDULE_METADATA, func) or []
+        Reflect.defineMetadata(MetadataKeys.SCHEDULE_METADATA, jobs + [job], func)
+        return func
+    return wrapper
+
+
+def _job(kind: str, every: float, cron_expression: Optional[str], jitter: float, overlap: bool,
+         group: Optional[str], executor: Optional[str]) -> ScheduledJob:
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor '{executor}', expected one of 'thread', 'inline' or 'process'")
+    if every < 0 or jitter < 0:
+        raise ValueError("Schedule delays must not be negative")
+    return ScheduledJob(kind, every, cron_expression, jitter, overlap, group, EXECUTORS[executor])
+
+
+def interval(
+    seconds: float,
+    jitter: float = 0.0,
+    overlap: bool = False,
+    group: Optional[str] = None,
+    executor: Optional[str] = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    if seconds <= 0:
+        raise ValueError("An interval must be positive")
+    return schedule(_job(JobKind.INTERVAL, seconds, None, jitter, overlap, group, executor))
+
+
+def timeout(
+    seconds: float,
+    jitter: float = 0.0,
+    group: Optional[str] = None,
+    executor: Optional[str] = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    return schedule(_job(JobKind.TIMEOUT, seconds, None, jitter, False, group, executor))
+
+
+def cron(
+    expression: str,
+    jitter: float = 0.0,
+    overlap: bool = False,
+    group: Optional[str] = None,
+    executor: Optional[str] = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    CronExpression(expression).next_after(datetime.now())
+    return schedule(_job(JobKind.CRON, 0.0, expression, jitter, overlap, group, executor))
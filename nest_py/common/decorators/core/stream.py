@@ -0,0 +1,19 @@
+from typing import Any, Callable, Optional
+from nest_py.core import Reflect
+from nest_py.core.constants import MetadataKeys, StreamMode
+from nest_py.core.reflect import IS_ASYNC_GEN_FUNC, IS_GEN_FUNC
+
+
+def stream(
+    mode: str = StreamMode.RAW,
+    media_type: Optional[str] = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    if mode not in (StreamMode.RAW, StreamMode.NDJSON, StreamMode.SSE):
+        raise ValueError(f"Unknown stream mode '{mode}'")
+
+    def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
+        if not (IS_GEN_FUNC(func) or IS_ASYNC_GEN_FUNC(func)):
+            raise TypeError(f"Streaming handler '{func.__name__}' must be a generator function")
+        Reflect.defineMetadata(MetadataKeys.STREAM_METADATA, {"mode": mode, "media_type": media_type}, func)
+        return func
+    return wrapper
@@ -0,0 +1,13 @@
+from typing import Any, Callable, TypeVar
+from nest_py.core import Reflect
+from nest_py.core.constants import MetadataKeys
+
+T = TypeVar("T")
+
+
+def use_filters(*filters: Any) -> Callable[[T], T]:
+    def wrapper(target: T) -> T:
+        declared = Reflect.getMetadata(MetadataKeys.EXCEPTION_FILTER_METADATA, target) or []
+        Reflect.defineMetadata(MetadataKeys.EXCEPTION_FILTER_METADATA, list(filters) + list(declared), target)
+        return target
+    return wrapper
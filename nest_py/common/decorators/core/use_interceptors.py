@@ -0,0 +1,13 @@
+from typing import Any, Callable, TypeVar
+from nest_py.core import Reflect
+from nest_py.core.constants import MetadataKeys
+
+T = TypeVar("T")
+
+
+def use_interceptors(*interceptors: Any) -> Callable[[T], T]:
+    def wrapper(target: T) -> T:
+        declared = Reflect.getMetadata(MetadataKeys.INTERCEPTOR_METADATA, target) or []
+        Reflect.defineMetadata(MetadataKeys.INTERCEPTOR_METADATA, list(interceptors) + list(declared), target)
+        return target
+    return wrapper
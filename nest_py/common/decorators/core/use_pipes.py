@@ -0,0 +1,13 @@
+from typing import Any, Callable, TypeVar
+from nest_py.core import Reflect
+from nest_py.core.constants import MetadataKeys
+
+T = TypeVar("T")
+
+
+def use_pipes(*pipes: Any) -> Callable[[T], T]:
+    def wrapper(target: T) -> T:
+        declared = Reflect.getMetadata(MetadataKeys.PIPE_METADATA, target) or []
+        Reflect.defineMetadata(MetadataKeys.PIPE_METADATA, list(pipes) + list(declared), target)
+        return target
+    return wrapper
@@ -7,7 +7,7 @@ ctx_app = NestPyApplicationContext()
 
 def route(*args, **kwargs) -> Callable[[Callable[..., Any]], Callable]:
     def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
-        Reflect.set(func, MetadataKeys.ROUTE_METADATA, {"args": args, "kwargs": kwargs})
+        Reflect.defineMetadata(MetadataKeys.ROUTE_METADATA, {"args": args, "kwargs": kwargs}, func)
         return func
     return wrapper
 
@@ -1,3 +1,4 @@
+from time import perf_counter
 from typing import Callable, Optional, List, Type, TypeVar
 from nest_py.core import NestPyApplicationContext
 
@@ -13,6 +14,7 @@ def module(
     exports: Optional[List[str]] = None
 ) -> Callable[[Type[T]], Type[T]]:
     def wrapper(cls: Type[T]) -> Type[T]:
+        start = perf_counter()
         ctx_app.register_module(
             module_class=cls,
             imports=imports,
@@ -20,5 +22,6 @@ def module(
             providers=providers,
             exports=exports
         )
+        ctx_app.record_registration(cls.__module__, perf_counter() - start)
         return cls
     return wrapper
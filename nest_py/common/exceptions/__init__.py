@@ -0,0 +1,32 @@
+from nest_py.core.exceptions import (
+    ExceptionFilter,
+    HttpException,
+    BadRequestException,
+    UnauthorizedException,
+    ForbiddenException,
+    NotFoundException,
+    MethodNotAllowedException,
+    ConflictException,
+    PayloadTooLargeException,
+    UnprocessableEntityException,
+    TooManyRequestsException,
+    InternalServerErrorException,
+    ServiceUnavailableException,
+)
+
+
+__all__ = [
+    "ExceptionFilter",
+    "HttpException",
+    "BadRequestException",
+    "UnauthorizedException",
+    "ForbiddenException",
+    "NotFoundException",
+    "MethodNotAllowedException",
+    "ConflictException",
+    "PayloadTooLargeException",
+    "UnprocessableEntityException",
+    "TooManyRequestsException",
+    "InternalServerErrorException",
+    "ServiceUnavailableException",
+]
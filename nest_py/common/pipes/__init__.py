@@ -0,0 +1,11 @@
+from nest_py.common.pipes.parse_pipes import DefaultValuePipe, ParseEnumPipe, ParseIntPipe
+from nest_py.common.pipes.validation_pipe import ValidationPipe, get_type_adapter
+
+
+__all__ = [
+    "DefaultValuePipe",
+    "ParseEnumPipe",
+    "ParseIntPipe",
+    "ValidationPipe",
+    "get_type_adapter",
+]
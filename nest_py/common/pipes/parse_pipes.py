@@ -0,0 +1,44 @@
+from enum import Enum
+from typing import Any, Callable, Type
+from nest_py.core.exceptions import BadRequestException
+from nest_py.core.pipes import PipeTransform
+from nest_py.core.structures import ArgumentMetadata
+
+
+class ParseIntPipe(PipeTransform):
+
+    def transform(self, value: Any, metadata: ArgumentMetadata) -> int:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise BadRequestException(f"Validation failed for '{metadata.name}' (numeric string is expected)")
+
+
+class ParseEnumPipe(PipeTransform):
+
+    def __init__(self, enum_type: Type[Enum]) -> None:
+        self.enum_type = enum_type
+
+    def transform(self, value: Any, metadata: ArgumentMetadata) -> Enum:
+        if isinstance(value, self.enum_type):
+            return value
+        try:
+            return self.enum_type(value)
+        except ValueError:
+            allowed = ", ".join(str(member.value) for member in self.enum_type)
+            raise BadRequestException(f"Validation failed for '{metadata.name}' (expected one of: {allowed})")
+
+
+class DefaultValuePipe(PipeTransform):
+
+    def __init__(self, default: Any) -> None:
+        self.default = default
+
+    def transform(self, value: Any, metadata: ArgumentMetadata) -> Any:
+        return self.default if value is None else value
+
+    def compile(self, metadata: ArgumentMetadata) -> Callable[[Any], Any]:
+        default = self.default
+        return lambda value: default if value is None else value
@@ -0,0 +1,59 @@
+from inspect import Parameter
+from typing import Any, Callable, Dict
+from nest_py.core.exceptions import BadRequestException
+from nest_py.core.pipes import PipeTransform
+from nest_py.core.reflect import IS_CLASS
+from nest_py.core.structures import ArgumentMetadata
+
+try:
+    from pydantic import TypeAdapter, ValidationError
+except ImportError:
+    TypeAdapter = None
+    ValidationError = ValueError
+
+_adapters: Dict[Any, Any] = {}
+
+
+def get_type_adapter(annotation: Any) -> Any:
+    """Return the `TypeAdapter` for `annotation`, built once per annotation."""
+    try:
+        adapter = _adapters.get(annotation)
+    except TypeError:
+        return TypeAdapter(annotation)
+    if adapter is None:
+        adapter = _adapters[annotation] = TypeAdapter(annotation)
+    return adapter
+
+
+class ValidationPipe(PipeTransform):
+    """
+    Validate (and coerce) an argument against its annotation with pydantic.
+
+    The validator is compiled once per annotation. Values that already are
+    instances of a class annotation (models validated upstream, in-process
+    callers) are passed through; `strict` disables lax coercion.
+    """
+
+    def __init__(self, strict: bool = False) -> None:
+        self.strict = strict
+
+    def transform(self, value: Any, metadata: ArgumentMetadata) -> Any:
+        return self.compile(metadata)(value)
+
+    def compile(self, metadata: ArgumentMetadata) -> Callable[[Any], Any]:
+        annotation = metadata.annotation
+        if annotation is Parameter.empty or annotation is Any or TypeAdapter is None:
+            return lambda value: value
+
+        validate_python = get_type_adapter(annotation).validate_python
+        strict = self.strict
+        cls = annotation if IS_CLASS(annotation) else None
+
+        def validate(value: Any) -> Any:
+            if cls is not None and type(value) is cls:
+                return value
+            try:
+                return validate_python(value, strict=strict)
+            except ValidationError as error:
+                raise BadRequestException({"detail": error.errors(include_url=False)}) from error
+        return validate
@@ -0,0 +1,8 @@
+from nest_py.common.serializer.serialize import serialize
+from nest_py.common.serializer.serializer import Serializer
+
+
+__all__ = [
+    "Serializer",
+    "serialize",
+]
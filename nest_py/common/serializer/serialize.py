@@ -0,0 +1,39 @@
+from inspect import Parameter
+from typing import Any, Callable, Optional, get_type_hints
+from nest_py.common.serializer.serializer import Encoder, Fields, Serializer
+from nest_py.core import Reflect
+from nest_py.core.constants import MetadataKeys
+
+
+def return_annotation(func: Callable[..., Any]) -> Any:
+    return get_type_hints(func).get("return", Parameter.empty)
+
+
+def lazy_encoder(serializer_factory: Callable[[], Serializer]) -> Encoder:
+    encoder: Optional[Encoder] = None
+
+    def encode(value: Any) -> bytes:
+        nonlocal encoder
+        if encoder is None:
+            encoder = serializer_factory().compile()
+        return encoder(value)
+    return encode
+
+
+def serialize(
+    include: Fields = None,
+    exclude: Fields = None,
+    by_alias: bool = False,
+    exclude_none: bool = False
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
+        def build() -> Serializer:
+            return Serializer(return_annotation(func), include, exclude, by_alias, exclude_none)
+
+        try:
+            encoder = build().compile()
+        except NameError:
+            encoder = lazy_encoder(build)
+        Reflect.defineMetadata(MetadataKeys.SERIALIZER_METADATA, encoder, func)
+        return func
+    return wrapper
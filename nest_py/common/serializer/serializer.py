@@ -0,0 +1,94 @@
+from inspect import Parameter
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Sequence, Set, Tuple, Union, get_origin
+from nest_py.core.router.encoding import encode_json
+
+try:
+    from pydantic import TypeAdapter
+    from pydantic_core import to_json
+except ImportError:
+    TypeAdapter = None
+    to_json = None
+
+Fields = Optional[Union[Set[str], Dict[str, Any]]]
+Encoder = Callable[[Any], bytes]
+
+SEQUENCE_ORIGINS = (list, tuple, set, frozenset, List, Tuple, Set, FrozenSet, Sequence)
+
+_encoders: Dict[Hashable, Encoder] = {}
+
+
+def freeze(fields: Fields) -> Hashable:
+    if fields is None:
+        return None
+    if isinstance(fields, dict):
+        return tuple(sorted((key, freeze(value) if isinstance(value, (set, dict)) else value)
+                            for key, value in fields.items()))
+    return frozenset(fields)
+
+
+def for_items(annotation: Any, fields: Fields) -> Fields:
+    """Apply a flat field set to every item when the annotation is a collection of models."""
+    if fields is None or isinstance(fields, dict):
+        return fields
+    if get_origin(annotation) in SEQUENCE_ORIGINS:
+        return {"__all__": set(fields)}
+    return set(fields)
+
+
+class Serializer:
+    """
+    JSON encoder for one return annotation.
+
+    With pydantic available, the annotation is compiled into a `TypeAdapter`
+    whose `dump_json` writes bytes straight from the models; include/exclude
+    are applied while serializing, so models are never copied. Without an
+    annotation, `pydantic_core.to_json` serializes whatever the handler
+    returns; without pydantic, the orjson/json fallback of the router is used.
+    """
+
+    def __init__(
+            self,
+            annotation: Any = Parameter.empty,
+            include: Fields = None,
+            exclude: Fields = None,
+            by_alias: bool = False,
+            exclude_none: bool = False
+    ) -> None:
+        self.annotation = annotation
+        self.include = include
+        self.exclude = exclude
+        self.by_alias = by_alias
+        self.exclude_none = exclude_none
+
+    def cache_key(self) -> Hashable:
+        return (self.annotation, freeze(self.include), freeze(self.exclude), self.by_alias, self.exclude_none)
+
+    def compile(self) -> Encoder:
+        try:
+            key = self.cache_key()
+            encoder = _encoders.get(key)
+        except TypeError:
+            return self.build()
+        if encoder is None:
+            encoder = _encoders[key] = self.build()
+        return encoder
+
+    def build(self) -> Encoder:
+        annotation = self.annotation
+        include = for_items(annotation, self.include)
+        exclude = for_items(annotation, self.exclude)
+        options = {"by_alias": self.by_alias, "exclude_none": self.exclude_none}
+
+        if TypeAdapter is None:
+            return encode_json
+
+        if annotation is Parameter.empty or annotation is Any:
+            def encode(value: Any) -> bytes:
+                return to_json(value, include=include, exclude=exclude, **options)
+            return encode
+
+        dump_json = TypeAdapter(annotation).dump_json
+
+        def encode(value: Any) -> bytes:
+            return dump_json(value, include=include, exclude=exclude, **options)
+        return encode
@@ -0,0 +1,8 @@
+from nest_py.common.services.resource_pool import InMemoryPool, MemoryConnection, ResourcePool
+
+
+__all__ = [
+    "InMemoryPool",
+    "MemoryConnection",
+    "ResourcePool",
+]
@@ -0,0 +1,239 @@
+import asyncio
+import logging
+import os
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import partial
+from inspect import isawaitable
+from time import monotonic
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Generic, List, Optional, Tuple, TypeVar, Union
+from nest_py.core.errors import NestPyError, PoolTimeoutError
+
+T = TypeVar("T")
+R = TypeVar("R")
+MaybeAwaitable = Union[R, Awaitable[R]]
+
+logger = logging.getLogger("nest_py.pool")
+
+
+async def resolve(value: MaybeAwaitable[R]) -> R:
+    return await value if isawaitable(value) else value
+
+
+class ResourcePool(Generic[T]):
+    """
+    Bounded async pool of reusable resources (connections, clients, ...).
+
+    At most `max_size` resources are open at once; `acquire` waits up to
+    `acquire_timeout` seconds for one to be released, then raises
+    `PoolTimeoutError`. Idle resources are reused most recent first, so the
+    ones left over after a burst age out: those idle for more than
+    `max_idle` seconds are closed, down to `min_size`. A resource idle for
+    more than `check_after` seconds is passed to `check` before it is handed
+    out; a failed check closes and replaces it, and a check that raises
+    closes it before the error reaches `acquire`. A resource failing to
+    close in the idle reaper is logged on `nest_py.pool` and the reaper
+    keeps running.
+
+    Subclass it and register the subclass with `@injectable()` to share one
+    pool between the providers of a module. `on_module_init` opens
+    `min_size` resources and starts the idle reaper, `on_module_destroy`
+    closes the pool. A pool belongs to the process that opened it: after a
+    fork (see `WorkerSupervisor`), the worker forgets the inherited
+    resources without closing them and opens its own.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], MaybeAwaitable[T]],
+            close: Optional[Callable[[T], MaybeAwaitable[Any]]] = None,
+            check: Optional[Callable[[T], MaybeAwaitable[bool]]] = None,
+            min_size: int = 0,
+            max_size: int = 10,
+            max_idle: float = 300.0,
+            check_after: float = 30.0,
+            acquire_timeout: float = 10.0
+    ) -> None:
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError("ResourcePool needs 0 <= min_size <= max_size and max_size >= 1")
+        self._factory = factory
+        self._close = close
+        self._check = check
+        self._min_size = min_size
+        self._max_size = max_size
+        self._max_idle = max_idle
+        self._check_after = check_after
+        self._acquire_timeout = acquire_timeout
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._idle: Deque[Tuple[T, float]] = deque()
+        self._size = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._reaper: Optional["asyncio.Task[None]"] = None
+        self._closed = False
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        if self._pid != os.getpid():
+            self._reset()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_size)
+        return self._slots
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    async def acquire(self) -> T:
+        slots = self._get_slots()
+        if self._closed:
+            raise NestPyError(f"{type(self).__name__} is closed")
+        try:
+            await asyncio.wait_for(slots.acquire(), self._acquire_timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeoutError(
+                f"No resource released by {type(self).__name__} within {self._acquire_timeout}s "
+                f"({self._max_size} in use)"
+            ) from None
+
+        try:
+            return await self._checkout()
+        except BaseException:
+            slots.release()
+            raise
+
+    async def _checkout(self) -> T:
+        now = monotonic()
+        while self._idle:
+            resource, since = self._idle.pop()
+            if self._check is None or now - since < self._check_after:
+                return resource
+            try:
+                healthy = await resolve(self._check(resource))
+            except BaseException:
+                await self._discard(resource)
+                raise
+            if healthy:
+                return resource
+            await self._discard(resource)
+        return await self._open()
+
+    async def _open(self) -> T:
+        resource = await resolve(self._factory())
+        self._size += 1
+        return resource
+
+    async def _discard(self, resource: T) -> None:
+        self._size -= 1
+        if self._close is not None:
+            await resolve(self._close(resource))
+
+    async def release(self, resource: T, discard: bool = False) -> None:
+        """Return `resource` to the pool, or close it with `discard` (e.g. after a broken connection)."""
+        if self._pid != os.getpid():
+            return
+        try:
+            if discard or self._closed:
+                await self._discard(resource)
+            else:
+                self._idle.append((resource, monotonic()))
+        finally:
+            self._get_slots().release()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[T]:
+        resource = await self.acquire()
+        try:
+            yield resource
+        finally:
+            await self.release(resource)
+
+    async def fill(self) -> None:
+        """Open resources until `min_size` are available."""
+        self._get_slots()
+        while self._size < self._min_size:
+            self._idle.append((await self._open(), monotonic()))
+
+    async def evict(self) -> int:
+        """Close the resources idle for more than `max_idle`, keeping `min_size` open."""
+        evicted = 0
+        now = monotonic()
+        while self._idle and self._size > self._min_size and now - self._idle[0][1] > self._max_idle:
+            resource, _ = self._idle.popleft()
+            await self._discard(resource)
+            evicted += 1
+        return evicted
+
+    async def _reap(self) -> None:
+        while True:
+            await asyncio.sleep(self._max_idle / 2)
+            try:
+                await self.evict()
+            except Exception:
+                logger.exception("%s failed to close an idle resource", type(self).__name__)
+
+    async def close(self) -> None:
+        """Close the idle resources; the ones in use are closed when released."""
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        idle, self._idle = list(self._idle), deque()
+        for resource, _ in idle:
+            await self._discard(resource)
+
+    async def on_module_init(self) -> None:
+        await self.fill()
+        if self._reaper is None:
+            self._reaper = asyncio.ensure_future(self._reap())
+
+    async def on_module_destroy(self) -> None:
+        await self.close()
+
+
+class MemoryConnection:
+    """Connection to the dict of an `InMemoryPool`, standing in for a database client."""
+
+    def __init__(self, data: Dict[Any, Any]) -> None:
+        self._data = data
+        self.closed = False
+
+    async def get(self, key: Any, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    async def set(self, key: Any, value: Any) -> None:
+        self._data[key] = value
+
+    async def delete(self, key: Any) -> bool:
+        return self._data.pop(key, None) is not None
+
+    async def keys(self) -> List[Any]:
+        return list(self._data)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class InMemoryPool(ResourcePool[MemoryConnection]):
+    """
+    Pool of `MemoryConnection`s sharing one dict.
+
+    A local stand-in for a real pool: services written against
+    `ResourcePool.lease()` run unchanged in tests and examples.
+    """
+
+    def __init__(self, min_size: int = 0, max_size: int = 10, **options: Any) -> None:
+        self.data: Dict[Any, Any] = {}
+        super().__init__(
+            partial(MemoryConnection, self.data),
+            close=MemoryConnection.close,
+            check=lambda connection: not connection.closed,
+            min_size=min_size,
+            max_size=max_size,
+            **options
+        )
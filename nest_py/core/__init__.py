@@ -1,9 +1,11 @@
+from nest_py.core.nestpy_application import NestPyApplication
 from nest_py.core.nestpy_application_context import NestPyApplicationContext
 from nest_py.core.nestpy_factory import NestPyFactory
 from nest_py.core.reflect import Reflect
 
 
 __all__ = [
+    "NestPyApplication",
     "NestPyApplicationContext",
     "NestPyFactory",
     "Reflect",
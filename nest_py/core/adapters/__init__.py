@@ -0,0 +1,8 @@
+from nest_py.core.adapters.abstract_http_adapter import AbstractHttpAdapter
+from nest_py.core.adapters.asgi_adapter import AsgiAdapter
+
+
+__all__ = [
+    "AbstractHttpAdapter",
+    "AsgiAdapter",
+]
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+
+class AbstractHttpAdapter(ABC):
+    """
+    Bridge between a `NestPyApplication` and the HTTP server stack serving it.
+
+    `mount` receives the application once its routes are compiled and
+    `get_instance` returns the ASGI callable handed to the server.
+    """
+
+    @abstractmethod
+    def mount(self, app: Any) -> None: ...
+
+    @abstractmethod
+    def get_instance(self) -> Any: ...
+
+    def add_route(self, plan: Any) -> None:
+        """Mount a route compiled after `mount`; router-backed adapters pick it up from the router."""
+
+    def listen(self, host: str, port: Union[str, int], **options: Any) -> None:
+        import uvicorn
+
+        uvicorn.run(self.get_instance(), host=host, port=int(port), **options)
@@ -0,0 +1,28 @@
+from typing import Any, Optional
+from nest_py.core.adapters.abstract_http_adapter import AbstractHttpAdapter
+from nest_py.core.router import RouterApp
+
+
+class AsgiAdapter(AbstractHttpAdapter):
+    """
+    First-party adapter serving controllers directly as a plain ASGI app.
+
+    Requests go straight from the server to the application's router with no
+    framework middleware in between; bodies are read without concatenating
+    chunks and decoded from the buffer. Use `FastAPIAdapter` instead when a
+    service needs OpenAPI documentation or FastAPI dependencies.
+    """
+
+    def __init__(self) -> None:
+        self._instance: Optional[RouterApp] = None
+
+    def mount(self, app: Any) -> None:
+        self._instance = RouterApp(app.resolve_route, app.get_router().allowed_methods, app.startup, app.close)
+        for plan in app.get_plans():
+            self._instance.add_route(plan)
+
+    def add_route(self, plan: Any) -> None:
+        self._instance.add_route(plan)
+
+    def get_instance(self) -> RouterApp:
+        return self._instance
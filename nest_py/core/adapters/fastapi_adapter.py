@@ -0,0 +1,101 @@
+from functools import wraps
+from typing import Any, Callable
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+from nest_py.core.adapters.abstract_http_adapter import AbstractHttpAdapter
+from nest_py.core.exceptions import HttpException
+from nest_py.core.execution_context import current_request
+from nest_py.core.middleware import compile_middleware
+from nest_py.core.router.encoding import encode_error
+from nest_py.core.router.router_app import call_endpoint
+from nest_py.core.structures import DispatchPlan
+
+
+class RequestContextMiddleware:
+    """Expose the current request to guards through `ExecutionContext.get_request()`."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = current_request.set(Request(scope, receive))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_request.reset(token)
+
+
+async def handle_http_exception(request: Request, error: HttpException) -> Response:
+    return Response(encode_error(error), status_code=error.status_code, media_type="application/json")
+
+
+def streaming_endpoint(plan: DispatchPlan) -> Callable[..., Any]:
+    endpoint = plan.endpoint
+
+    @wraps(endpoint)
+    async def stream_endpoint(**kwargs) -> StreamingResponse:
+        response = await endpoint(**kwargs)
+        return StreamingResponse(response.chunks(), media_type=response.media_type, headers=response.headers)
+
+    return stream_endpoint
+
+
+def encoded_endpoint(plan: DispatchPlan) -> Callable[..., Any]:
+    """Return the bytes of the route's precompiled encoder instead of going through `jsonable_encoder`."""
+    encoder = plan.encoder
+    media_type = plan.media_type or "application/json"
+    status_code = plan.metadata.get("kwargs", {}).get("status_code", 200)
+
+    @wraps(plan.endpoint)
+    async def encode_endpoint(**kwargs) -> Response:
+        result = await call_endpoint(plan, kwargs)
+        return Response(encoder(result), status_code=status_code, media_type=media_type)
+
+    return encode_endpoint
+
+
+def adapt_endpoint(plan: DispatchPlan) -> Callable[..., Any]:
+    if plan.is_stream:
+        return streaming_endpoint(plan)
+    if plan.encoder is not None:
+        return encoded_endpoint(plan)
+    return plan.endpoint
+
+
+class FastAPIAdapter(AbstractHttpAdapter):
+    """
+    Adapter mounting every compiled route on a FastAPI application.
+
+    Keyword arguments are forwarded to `FastAPI(...)` (title, version,
+    description, debug, ...). Pending lazy modules are loaded before mounting,
+    since FastAPI needs the full route table up front.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        self._instance = FastAPI(**options)
+        self._instance.add_middleware(RequestContextMiddleware)
+        self._instance.add_exception_handler(HttpException, handle_http_exception)
+
+    def mount(self, app: Any) -> None:
+        app.load_pending_modules()
+        self._instance.router.on_startup.append(app.startup)
+        self._instance.router.on_shutdown.append(app.close)
+        for plan in app.get_plans():
+            self.add_route(plan)
+
+    def add_route(self, plan: DispatchPlan) -> None:
+        self._instance.add_api_route(
+            plan.path,
+            adapt_endpoint(plan),
+            tags=[plan.controller_class.__name__],
+            **plan.metadata.get("kwargs", {})
+        )
+        if plan.middleware:
+            route = self._instance.router.routes[-1]
+            route.app = compile_middleware(plan.middleware, route.app)
+
+    def get_instance(self) -> FastAPI:
+        return self._instance
@@ -3,9 +3,45 @@ class MetadataKeys:
     CONTROLLER_METADATA = "__controller_metadata__"
     ROUTE_METADATA = "__route_metadata__"
     METHOD_METADATA = "__method_metadata__"
+    OFFLOAD_METADATA = "__offload_metadata__"
+    STREAM_METADATA = "__stream_metadata__"
+    SERIALIZER_METADATA = "__serializer_metadata__"
 
     GUARD_METADATA = "__guard_metadata__"
     INTERCEPTOR_METADATA = "__interceptor_metadata__"
     MIDDLEWARE_METADATA = "__middleware_metadata__"
     PIPE_METADATA = "__pipe_metadata__"
     EXCEPTION_FILTER_METADATA = "__exception_filter_metadata__"
+    CATCH_METADATA = "__catch_metadata__"
+    SCHEDULE_METADATA = "__schedule_metadata__"
+
+
+class OffloadPolicy:
+    THREADPOOL = "threadpool"
+    INLINE = "inline"
+    EXECUTOR = "executor"
+    PROCESS = "process"
+
+
+class JobKind:
+    INTERVAL = "interval"
+    TIMEOUT = "timeout"
+    CRON = "cron"
+
+
+class StreamMode:
+    RAW = "raw"
+    NDJSON = "ndjson"
+    SSE = "sse"
+
+
+class ParamKind:
+    PATH = "path"
+    QUERY = "query"
+    BODY = "body"
+
+
+class Scope:
+    SINGLETON = "singleton"
+    REQUEST = "request"
+    TRANSIENT = "transient"
@@ -0,0 +1,8 @@
+from nest_py.core.discovery.discovery import DISCOVERY_CACHE_PATH, ComponentDiscovery, parse_source
+
+
+__all__ = [
+    "DISCOVERY_CACHE_PATH",
+    "ComponentDiscovery",
+    "parse_source",
+]
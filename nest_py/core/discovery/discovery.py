@@ -0,0 +1,331 @@
+import ast
+import hashlib
+import importlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from nest_py.core.errors import NestPyError
+from nest_py.core.router.route_compiler import join_path
+from nest_py.core.scanner import IMPORT_SEPARATOR
+from nest_py.core.structures import DiscoveredClass, DiscoveredRoute
+
+DISCOVERY_VERSION = 2
+DISCOVERY_CACHE_PATH = os.path.join(".nestpy", "discovery.json")
+COMPONENT_DECORATORS = ("controller", "module", "injectable")
+HTTP_DECORATORS = ("get", "post", "put", "delete", "head", "patch", "options")
+SKIPPED_DIRS = frozenset(("__pycache__", "node_modules", "venv", "build", "dist", "site-packages"))
+PARALLEL_THRESHOLD = 64
+
+
+def decorator_name(node: ast.expr) -> str:
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return node.id if isinstance(node, ast.Name) else ""
+
+
+def literal(node: Optional[ast.expr], default: Any = None) -> Any:
+    if node is None:
+        return default
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return default
+
+
+def names(node: Optional[ast.expr]) -> Tuple[str, ...]:
+    if not isinstance(node, (ast.List, ast.Tuple)):
+        return ()
+    found = []
+    for item in node.elts:
+        if isinstance(item, ast.Constant) and isinstance(item.value, str):
+            found.append(item.value)
+        elif isinstance(item, (ast.Name, ast.Attribute)):
+            found.append(decorator_name(item))
+    return tuple(found)
+
+
+def keywords(node: ast.expr) -> Dict[str, ast.expr]:
+    return {keyword.arg: keyword.value for keyword in getattr(node, "keywords", ()) if keyword.arg}
+
+
+def first_arg(node: ast.expr) -> Optional[ast.expr]:
+    args = getattr(node, "args", None)
+    return args[0] if args else None
+
+
+def import_sources(tree: ast.Module, module: str, package: bool) -> Tuple[str, ...]:
+    """Return the top-level `from ... import name` of a source as `"module:name"` references."""
+    sources = []
+    for node in tree.body:
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        base = node.module or ""
+        if node.level:
+            parts = module.split(".")
+            parts = parts[:len(parts) - node.level + (1 if package else 0)]
+            base = ".".join(parts + ([base] if base else []))
+        sources.extend(f"{base}{IMPORT_SEPARATOR}{alias.name}" for alias in node.names if alias.name != "*")
+    return tuple(sources)
+
+
+def parse_routes(body: List[ast.stmt]) -> Tuple[DiscoveredRoute, ...]:
+    routes = []
+    for item in body:
+        if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in item.decorator_list:
+            name = decorator_name(decorator)
+            if name in HTTP_DECORATORS:
+                methods: Tuple[str, ...] = (name.upper(),)
+            elif name == "route":
+                methods = tuple(literal(keywords(decorator).get("methods"), ()))
+            else:
+                continue
+            path = literal(first_arg(decorator), "/")
+            routes.append(DiscoveredRoute(item.name, methods, path if isinstance(path, str) else "/", item.lineno))
+    return tuple(routes)
+
+
+def parse_source(source: bytes, module: str, package: bool = False) -> List[DiscoveredClass]:
+    """
+    Return the components declared at the top level of a Python source, without importing it.
+
+    `package` tells that the source is the `__init__.py` of `module`, for
+    resolving relative imports.
+    """
+    if not any(name.encode() in source for name in COMPONENT_DECORATORS):
+        return []
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+
+    sources = import_sources(tree, module, package)
+    found = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for decorator in node.decorator_list:
+            kind = decorator_name(decorator)
+            if kind == "controller":
+                prefix = literal(first_arg(decorator), "")
+                found.append(DiscoveredClass(
+                    kind, node.name, module, node.lineno,
+                    prefix=prefix if isinstance(prefix, str) else "",
+                    routes=parse_routes(node.body),
+                    sources=sources
+                ))
+            elif kind == "module":
+                options = keywords(decorator)
+                found.append(DiscoveredClass(
+                    kind, node.name, module, node.lineno,
+                    imports=names(options.get("imports")),
+                    controllers=names(options.get("controllers")),
+                    providers=names(options.get("providers")),
+                    sources=sources
+                ))
+            elif kind == "injectable":
+                found.append(DiscoveredClass(kind, node.name, module, node.lineno, sources=sources))
+    return found
+
+
+def parse_entry(entry: Tuple[bytes, str, bool]) -> List[DiscoveredClass]:
+    return parse_source(*entry)
+
+
+def to_json(component: DiscoveredClass) -> Dict[str, Any]:
+    data = component._asdict()
+    data["routes"] = [route._asdict() for route in component.routes]
+    return data
+
+
+def from_json(data: Dict[str, Any]) -> DiscoveredClass:
+    values = {key: tuple(value) if isinstance(value, list) else value for key, value in data.items()}
+    values["routes"] = tuple(
+        DiscoveredRoute(route["handler"], tuple(route["methods"]), route["path"], route["lineno"])
+        for route in data["routes"]
+    )
+    return DiscoveredClass(**values)
+
+
+class ComponentDiscovery:
+    """
+    Find controllers, modules and injectables by parsing a source tree.
+
+    Files under `source_root` are read with `ast` and never imported. Parse
+    results are cached in `cache_path`, keyed by module name and content
+    hash, and cache misses are parsed in a process pool once there are more
+    than `PARALLEL_THRESHOLD` of them (`workers=0` always parses inline).
+    `reachable(root)` walks the `@module` graph from the root module so that
+    `load(root)` imports only the Python modules it actually needs.
+
+    Components are keyed by `"module:Class"`, so classes sharing a name in
+    different files stay apart. A `"package.module:Class"` reference names
+    one of them; a bare class name resolves to the class declared in the
+    referencing file, then to one it imports with `from ... import`, then
+    to the only class of that name in the tree. Ambiguous names raise
+    `NestPyError`.
+    """
+
+    def __init__(
+            self,
+            source_root: str = ".",
+            cache_path: Optional[str] = DISCOVERY_CACHE_PATH,
+            workers: Optional[int] = None
+    ) -> None:
+        self._source_root = os.path.abspath(source_root)
+        self._cache_path = cache_path
+        self._workers = workers
+        self._components: Optional[Dict[str, DiscoveredClass]] = None
+        self._by_name: Dict[str, List[DiscoveredClass]] = {}
+
+    def files(self) -> Iterator[Tuple[str, str]]:
+        """Yield `(path, module name)` for every Python file under the source root."""
+        for directory, subdirectories, filenames in os.walk(self._source_root):
+            subdirectories[:] = sorted(
+                name for name in subdirectories if not name.startswith(".") and name not in SKIPPED_DIRS
+            )
+            relative = os.path.relpath(directory, self._source_root)
+            package = [] if relative == os.curdir else relative.split(os.sep)
+            for filename in sorted(filenames):
+                if not filename.endswith(".py"):
+                    continue
+                stem = filename[:-3]
+                parts = package if stem == "__init__" else package + [stem]
+                if parts and all(part.isidentifier() for part in parts):
+                    yield os.path.join(directory, filename), ".".join(parts)
+
+    def _load_cache(self) -> Dict[str, List[Dict[str, Any]]]:
+        if self._cache_path is None:
+            return {}
+        try:
+            with open(self._cache_path, encoding="utf-8") as source:
+                data = json.load(source)
+        except (OSError, ValueError):
+            return {}
+        return data.get("files", {}) if data.get("version") == DISCOVERY_VERSION else {}
+
+    def _write_cache(self, files: Dict[str, List[Dict[str, Any]]]) -> None:
+        if self._cache_path is None:
+            return
+        directory = os.path.dirname(self._cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{self._cache_path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as output:
+            json.dump({"version": DISCOVERY_VERSION, "files": files}, output, sort_keys=True)
+        os.replace(temporary, self._cache_path)
+
+    def scan(self) -> Dict[str, DiscoveredClass]:
+        """Return the discovered components keyed by `"module:Class"`, parsing only files that changed."""
+        if self._components is not None:
+            return self._components
+
+        cached = self._load_cache()
+        files: Dict[str, List[Dict[str, Any]]] = {}
+        misses: List[Tuple[str, Tuple[bytes, str, bool]]] = []
+        for path, module in self.files():
+            with open(path, "rb") as source:
+                content = source.read()
+            key = f"{module}:{hashlib.sha256(content).hexdigest()}"
+            if key in cached:
+                files[key] = cached[key]
+            else:
+                misses.append((key, (content, module, os.path.basename(path) == "__init__.py")))
+
+        if len(misses) > PARALLEL_THRESHOLD and self._workers != 0:
+            with ProcessPoolExecutor(self._workers) as pool:
+                results = list(pool.map(parse_entry, [entry for _, entry in misses], chunksize=16))
+        else:
+            results = [parse_entry(entry) for _, entry in misses]
+        for (key, _), components in zip(misses, results):
+            files[key] = [to_json(component) for component in components]
+
+        if misses or len(files) != len(cached):
+            self._write_cache(files)
+
+        self._components = {}
+        self._by_name = {}
+        for entries in files.values():
+            for data in entries:
+                component = from_json(data)
+                self._components[component.key] = component
+                self._by_name.setdefault(component.name, []).append(component)
+        return self._components
+
+    def resolve(self, reference: str, referrer: Optional[DiscoveredClass] = None) -> Optional[DiscoveredClass]:
+        """Return the component named by `reference`, as seen from the file declaring `referrer`."""
+        components = self.scan()
+        if IMPORT_SEPARATOR in reference:
+            return components.get(reference)
+
+        if referrer is not None:
+            local = components.get(f"{referrer.module}{IMPORT_SEPARATOR}{reference}")
+            if local is not None:
+                return local
+            for source in referrer.sources:
+                if source.rpartition(IMPORT_SEPARATOR)[2] == reference and source in components:
+                    return components[source]
+
+        candidates = self._by_name.get(reference, [])
+        if len(candidates) > 1:
+            raise NestPyError(
+                f"'{reference}' is declared in several modules ({', '.join(sorted(c.module for c in candidates))}); "
+                f"reference it as 'module:{reference}'"
+            )
+        return candidates[0] if candidates else None
+
+    def _walk(self, root: str) -> List[DiscoveredClass]:
+        found = []
+        seen = set()
+        stack: List[Tuple[str, Optional[DiscoveredClass]]] = [(root, None)]
+
+        while stack:
+            reference, referrer = stack.pop()
+            component = self.resolve(reference, referrer)
+            if component is None or component.key in seen:
+                continue
+            seen.add(component.key)
+            found.append(component)
+            for name in component.imports + component.controllers + component.providers:
+                stack.append((name, component))
+        return found
+
+    def reachable(self, root: str) -> List[str]:
+        """
+        Return the Python modules declaring the components reachable from `root`.
+
+        `root` is a module class name or an import reference such as
+        `"app.app_module:AppModule"`; imports by reference are followed the
+        same way `ModuleScanner` resolves them.
+        """
+        return list(dict.fromkeys(component.module for component in self._walk(root)))
+
+    def load(self, root: str) -> List[str]:
+        """Import the Python modules reachable from `root` and return their names."""
+        modules = self.reachable(root)
+        for module in modules:
+            importlib.import_module(module)
+        return modules
+
+    def routes(self, root: Optional[str] = None) -> List[Tuple[str, str, str]]:
+        """
+        Return `(methods, path, "Controller.handler")` for every discovered route.
+
+        With `root`, only the controllers reachable from that module are listed.
+        """
+        components = self.scan().values() if root is None else self._walk(root)
+        routes = []
+        for component in components:
+            if component.kind != "controller":
+                continue
+            for route in component.routes:
+                routes.append((
+                    ",".join(route.methods),
+                    join_path(component.prefix, route.path),
+                    f"{component.name}.{route.handler}"
+                ))
+        return sorted(routes, key=lambda route: (route[1], route[0]))
@@ -0,0 +1,16 @@
+from nest_py.core.errors.exceptions import (
+    NestPyError,
+    CircularDependencyError,
+    UnknownDependencyError,
+    InvalidScopeError,
+    PoolTimeoutError,
+)
+
+
+__all__ = [
+    "NestPyError",
+    "CircularDependencyError",
+    "UnknownDependencyError",
+    "InvalidScopeError",
+    "PoolTimeoutError",
+]
@@ -0,0 +1,34 @@
+from typing import List
+
+
+class NestPyError(Exception):
+    pass
+
+
+class CircularDependencyError(NestPyError):
+
+    def __init__(self, path: List[str]) -> None:
+        self.path = path
+        super().__init__(f"Circular dependency detected: {' -> '.join(path)}")
+
+
+class UnknownDependencyError(NestPyError):
+
+    def __init__(self, provider: str, parameter: str, token: str, path: List[str]) -> None:
+        self.provider = provider
+        self.parameter = parameter
+        self.token = token
+        self.path = path
+        super().__init__(
+            f"Cannot resolve '{token}' for parameter '{parameter}' of '{provider}' "
+            f"(resolution path: {' -> '.join(path)}). "
+            f"Make sure it is decorated with @injectable()."
+        )
+
+
+class InvalidScopeError(NestPyError):
+    pass
+
+
+class PoolTimeoutError(NestPyError):
+    pass
@@ -0,0 +1,33 @@
+from nest_py.core.exceptions.exception_filter import ExceptionFilter, compile_filters
+from nest_py.core.exceptions.http_exception import (
+    HttpException,
+    BadRequestException,
+    UnauthorizedException,
+    ForbiddenException,
+    NotFoundException,
+    MethodNotAllowedException,
+    ConflictException,
+    PayloadTooLargeException,
+    UnprocessableEntityException,
+    TooManyRequestsException,
+    InternalServerErrorException,
+    ServiceUnavailableException,
+)
+
+
+__all__ = [
+    "ExceptionFilter",
+    "compile_filters",
+    "HttpException",
+    "BadRequestException",
+    "UnauthorizedException",
+    "ForbiddenException",
+    "NotFoundException",
+    "MethodNotAllowedException",
+    "ConflictException",
+    "PayloadTooLargeException",
+    "UnprocessableEntityException",
+    "TooManyRequestsException",
+    "InternalServerErrorException",
+    "ServiceUnavailableException",
+]
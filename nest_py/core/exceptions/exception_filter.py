@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple, Type
+from nest_py.core.constants import MetadataKeys
+from nest_py.core.exceptions.http_exception import HttpException
+from nest_py.core.execution_context import ExecutionContext
+from nest_py.core.reflect import IS_AWAITABLE, Reflect
+
+ExceptionHandler = Callable[[Exception, ExecutionContext], Awaitable[Any]]
+
+
+class ExceptionFilter(ABC):
+    """
+    Handles the exceptions a route raises.
+
+    The filter class declares what it handles with `@catch(*types)` (every
+    exception when omitted). `catch` either returns the value to respond
+    with, or returns/raises an `HttpException` to send an error.
+    """
+
+    @abstractmethod
+    def catch(self, exception: Exception, context: ExecutionContext) -> Any: ...
+
+
+def catch_types(exception_filter: Any) -> Tuple[Type[BaseException], ...]:
+    return tuple(Reflect.getMetadata(MetadataKeys.CATCH_METADATA, type(exception_filter)) or ()) or (Exception,)
+
+
+def compile_filters(filters: Sequence[ExceptionFilter]) -> Optional[ExceptionHandler]:
+    """
+    Build the exception handler of a route from its filters, highest priority first.
+
+    The first filter catching the exception type, or one of its bases,
+    handles it. That choice is made once per exception type and memoized,
+    so handling an error is a dict lookup and the success path never
+    touches the table.
+    """
+    if not filters:
+        return None
+
+    entries = [(catch_types(exception_filter), exception_filter) for exception_filter in filters]
+    table: Dict[type, Optional[ExceptionFilter]] = {}
+
+    def lookup(exception_type: type) -> Optional[ExceptionFilter]:
+        for types, exception_filter in entries:
+            if issubclass(exception_type, types):
+                return exception_filter
+        return None
+
+    async def handle(exception: Exception, context: ExecutionContext) -> Any:
+        exception_type = type(exception)
+        try:
+            exception_filter = table[exception_type]
+        except KeyError:
+            exception_filter = table[exception_type] = lookup(exception_type)
+        if exception_filter is None:
+            raise exception
+
+        result = exception_filter.catch(exception, context)
+        if IS_AWAITABLE(result):
+            result = await result
+        if isinstance(result, HttpException):
+            raise result from exception
+        return result
+
+    return handle
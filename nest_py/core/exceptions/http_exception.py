@@ -0,0 +1,76 @@
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Union
+
+Response = Union[str, Dict[str, Any], None]
+
+
+class HttpException(Exception):
+    """
+    Exception turned into an HTTP error response by the adapters.
+
+    `response` is either a message, sent as `{"detail": message}`, or the
+    full JSON body; subclasses fix the status and a default message.
+    """
+
+    status: int = 500
+    message: Optional[str] = None
+
+    def __init__(self, response: Response = None, status: Optional[int] = None) -> None:
+        self.status_code = status if status is not None else type(self).status
+        if response is None:
+            response = type(self).message or HTTPStatus(self.status_code).phrase
+        self.response = response
+        super().__init__(response if isinstance(response, str) else f"HTTP {self.status_code}")
+
+    def get_status(self) -> int:
+        return self.status_code
+
+    def get_response(self) -> Dict[str, Any]:
+        if isinstance(self.response, dict):
+            return self.response
+        return {"detail": self.response}
+
+
+class BadRequestException(HttpException):
+    status = 400
+
+
+class UnauthorizedException(HttpException):
+    status = 401
+
+
+class ForbiddenException(HttpException):
+    status = 403
+    message = "Forbidden resource"
+
+
+class NotFoundException(HttpException):
+    status = 404
+
+
+class MethodNotAllowedException(HttpException):
+    status = 405
+
+
+class ConflictException(HttpException):
+    status = 409
+
+
+class PayloadTooLargeException(HttpException):
+    status = 413
+
+
+class UnprocessableEntityException(HttpException):
+    status = 422
+
+
+class TooManyRequestsException(HttpException):
+    status = 429
+
+
+class InternalServerErrorException(HttpException):
+    status = 500
+
+
+class ServiceUnavailableException(HttpException):
+    status = 503
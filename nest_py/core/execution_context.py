@@ -0,0 +1,67 @@
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional, Type
+from urllib.parse import parse_qsl
+from nest_py.core.structures import DispatchPlan
+
+
+class HttpRequest:
+    """Read-only view over an ASGI HTTP scope; headers and query are parsed on first access."""
+
+    __slots__ = ("scope", "receive", "_headers", "_query_params")
+
+    def __init__(self, scope: Dict[str, Any], receive: Any = None) -> None:
+        self.scope = scope
+        self.receive = receive
+        self._headers: Optional[Dict[str, str]] = None
+        self._query_params: Optional[Dict[str, str]] = None
+
+    @property
+    def method(self) -> str:
+        return self.scope["method"]
+
+    @property
+    def path(self) -> str:
+        return self.scope["path"]
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        if self._headers is None:
+            self._headers = {
+                name.decode("latin-1").lower(): value.decode("latin-1")
+                for name, value in self.scope.get("headers", ())
+            }
+        return self._headers
+
+    @property
+    def query_params(self) -> Dict[str, str]:
+        if self._query_params is None:
+            self._query_params = dict(parse_qsl(self.scope.get("query_string", b"").decode("latin-1")))
+        return self._query_params
+
+
+current_request: ContextVar[Optional[Any]] = ContextVar("current_request", default=None)
+authorized_route: ContextVar[Optional[str]] = ContextVar("authorized_route", default=None)
+AUTHORIZED = object()
+
+
+class ExecutionContext:
+    """Route being dispatched and the arguments bound for this call."""
+
+    __slots__ = ("plan", "kwargs")
+
+    def __init__(self, plan: DispatchPlan, kwargs: Dict[str, Any]) -> None:
+        self.plan = plan
+        self.kwargs = kwargs
+
+    def get_class(self) -> Type[Any]:
+        return self.plan.controller_class
+
+    def get_handler(self) -> Callable[..., Any]:
+        return self.plan.handler
+
+    def get_args(self) -> Dict[str, Any]:
+        return self.kwargs
+
+    def get_request(self) -> Any:
+        """Request set by the HTTP adapter (`HttpRequest` or the framework's own request)."""
+        return current_request.get()
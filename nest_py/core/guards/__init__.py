@@ -0,0 +1,7 @@
+from nest_py.core.guards.guard import CanActivate, compile_guards
+
+
+__all__ = [
+    "CanActivate",
+    "compile_guards",
+]
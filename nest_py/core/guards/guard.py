@@ -0,0 +1,74 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Optional, Sequence, Tuple, Union
+from nest_py.core.exceptions import ForbiddenException
+from nest_py.core.execution_context import ExecutionContext
+from nest_py.core.reflect import IS_AWAITABLE, IS_COROUTINE_FUNC
+
+GuardCheck = Callable[[ExecutionContext], Awaitable[None]]
+
+
+class CanActivate(ABC):
+    """
+    Decides whether a route may run.
+
+    `can_activate` returns a bool (or an awaitable one); raising an
+    `HttpException` rejects the request with that status instead of 403.
+    Async guards setting `independent = True` do not depend on the guards
+    declared next to them and may run concurrently with them.
+    """
+
+    independent: bool = False
+
+    @abstractmethod
+    def can_activate(self, context: ExecutionContext) -> Union[bool, Awaitable[bool]]: ...
+
+
+async def run_concurrently(guards: Tuple[Any, ...], context: ExecutionContext) -> bool:
+    tasks = [asyncio.ensure_future(guard.can_activate(context)) for guard in guards]
+    try:
+        for done in asyncio.as_completed(tasks):
+            if not await done:
+                return False
+        return True
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def compile_stages(guards: Sequence[Any]) -> Tuple[Tuple[Any, ...], ...]:
+    """Group consecutive independent async guards; every other guard is a stage of its own."""
+    stages = []
+    for guard in guards:
+        concurrent = getattr(guard, "independent", False) and IS_COROUTINE_FUNC(guard.can_activate)
+        if concurrent and stages and stages[-1][0]:
+            stages[-1][1].append(guard)
+        else:
+            stages.append((concurrent, [guard]))
+    return tuple(tuple(members) for _, members in stages)
+
+
+def compile_guards(guards: Sequence[Any]) -> Optional[GuardCheck]:
+    """
+    Compile the flat guard tuple of a route into one check.
+
+    Stages run in declaration order and the first failing guard stops the
+    pipeline with `ForbiddenException`; within a concurrent stage the
+    remaining guards are cancelled.
+    """
+    stages = compile_stages(guards)
+    if not stages:
+        return None
+
+    async def check(context: ExecutionContext) -> None:
+        for stage in stages:
+            if len(stage) > 1:
+                allowed = await run_concurrently(stage, context)
+            else:
+                allowed = stage[0].can_activate(context)
+                if IS_AWAITABLE(allowed):
+                    allowed = await allowed
+            if not allowed:
+                raise ForbiddenException()
+
+    return check
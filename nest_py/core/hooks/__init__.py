@@ -0,0 +1,20 @@
+from nest_py.core.hooks.lifecycle import (
+    BEFORE_APPLICATION_SHUTDOWN,
+    ON_APPLICATION_BOOTSTRAP,
+    ON_MODULE_DESTROY,
+    ON_MODULE_INIT,
+    SHUTDOWN_HOOKS,
+    STARTUP_HOOKS,
+    run_hooks,
+)
+
+
+__all__ = [
+    "BEFORE_APPLICATION_SHUTDOWN",
+    "ON_APPLICATION_BOOTSTRAP",
+    "ON_MODULE_DESTROY",
+    "ON_MODULE_INIT",
+    "SHUTDOWN_HOOKS",
+    "STARTUP_HOOKS",
+    "run_hooks",
+]
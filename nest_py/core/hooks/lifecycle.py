@@ -0,0 +1,84 @@
+import asyncio
+from inspect import isawaitable
+from typing import Any, Dict, List, Sequence
+from nest_py.core.structures import HookNode
+
+ON_MODULE_INIT = "on_module_init"
+ON_APPLICATION_BOOTSTRAP = "on_application_bootstrap"
+ON_MODULE_DESTROY = "on_module_destroy"
+BEFORE_APPLICATION_SHUTDOWN = "before_application_shutdown"
+
+STARTUP_HOOKS = (ON_MODULE_INIT, ON_APPLICATION_BOOTSTRAP)
+SHUTDOWN_HOOKS = (ON_MODULE_DESTROY, BEFORE_APPLICATION_SHUTDOWN)
+
+
+async def call_hook(instance: Any, hook: str) -> None:
+    method = getattr(instance, hook, None)
+    if method is None:
+        return
+    result = method()
+    if isawaitable(result):
+        await result
+
+
+def order_nodes(nodes: Sequence[HookNode]) -> Dict[str, List[str]]:
+    """
+    Map each node to the nodes it waits for.
+
+    Nodes are visited depth-first so that a dependency cycle (modules may
+    import each other) drops its back edge instead of deadlocking.
+    """
+    by_name = {node.name: node for node in nodes}
+    waits: Dict[str, List[str]] = {}
+    visiting = set()
+
+    def visit(name: str) -> None:
+        if name in waits or name in visiting:
+            return
+        visiting.add(name)
+        for dep in by_name[name].deps:
+            if dep in by_name:
+                visit(dep)
+        visiting.discard(name)
+        waits[name] = [dep for dep in by_name[name].deps if dep in waits]
+
+    for node in nodes:
+        visit(node.name)
+    return waits
+
+
+async def run_hooks(nodes: Sequence[HookNode], hook: str, reverse: bool = False) -> None:
+    """
+    Call `hook` on every node that defines it.
+
+    Each node starts as soon as its dependencies are done (or, with
+    `reverse`, as soon as every node depending on it is done), so async
+    hooks of independent branches of the graph run concurrently. The first
+    failure cancels the hooks still running and is raised.
+    """
+    waits = order_nodes(nodes)
+    if reverse:
+        dependents: Dict[str, List[str]] = {name: [] for name in waits}
+        for name, deps in waits.items():
+            for dep in deps:
+                dependents[dep].append(name)
+        waits = dependents
+
+    tasks: Dict[str, "asyncio.Future[None]"] = {}
+
+    async def run(node: HookNode) -> None:
+        pending = [tasks[name] for name in waits[node.name]]
+        if pending:
+            await asyncio.gather(*pending)
+        await call_hook(node.instance, hook)
+
+    for node in nodes:
+        if node.name not in tasks:
+            tasks[node.name] = asyncio.ensure_future(run(node))
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
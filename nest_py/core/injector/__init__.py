@@ -0,0 +1,12 @@
+from nest_py.core.injector.injector import Injector
+from nest_py.core.injector.lazy import lazy_method
+from nest_py.core.injector.request_scope import InstancePool, RequestScope, scoped_method
+
+
+__all__ = [
+    "Injector",
+    "InstancePool",
+    "RequestScope",
+    "lazy_method",
+    "scoped_method",
+]
@@ -0,0 +1,236 @@
+from functools import partial
+from inspect import Parameter
+from threading import RLock
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
+from nest_py.core.constants import Scope
+from nest_py.core.errors import CircularDependencyError, InvalidScopeError, UnknownDependencyError
+from nest_py.core.injector.request_scope import InstancePool, RequestScope
+from nest_py.core.structures import ProviderPlan
+
+T = TypeVar("T")
+Token = Union[str, Type[Any]]
+
+VARIADIC = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+
+
+class Injector:
+    """
+    Dependency injection container built on top of the application registry.
+
+    The provider graph is read from the `deps` signatures stored by
+    `register_injectable` and `register_controller`, compiled once into
+    `ProviderPlan`s in topological order and then instantiated in a single
+    pass. After compilation, resolving a provider never touches a signature.
+
+    Providers have one of three scopes: singletons are created at startup,
+    request-scoped providers once per `RequestScope` and transient providers on
+    every resolution. A provider that depends on a request-scoped provider is
+    itself promoted to request scope.
+    """
+
+    def __init__(self, ctx_app: Any) -> None:
+        self._ctx_app = ctx_app
+        self._registry: Dict[str, Dict[str, Any]] = {}
+        self._plans: Dict[str, ProviderPlan] = {}
+        self._order: List[str] = []
+        self._instances: Dict[str, Any] = {}
+        self._pools: Dict[str, InstancePool] = {}
+        self._needs_request: Set[str] = set()
+        self._lock = RLock()
+
+    @staticmethod
+    def token_name(token: Token) -> str:
+        return token if isinstance(token, str) else token.__name__
+
+    def _collect(self) -> Dict[str, Dict[str, Any]]:
+        registry = {}
+        for name, entry in self._ctx_app.get_injectables().items():
+            registry[name] = {
+                "class": entry["injectable_class"],
+                "deps": entry["deps"],
+                "scope": entry.get("scope", Scope.SINGLETON),
+                "pool_size": entry.get("pool_size", 0)
+            }
+        for name, entry in self._ctx_app.get_controllers().items():
+            registry[name] = {
+                "class": entry["controller_class"],
+                "deps": entry["deps"],
+                "scope": entry["params"]["kwargs"].get("scope", Scope.SINGLETON),
+                "pool_size": 0
+            }
+        return registry
+
+    def _dependency_of(self, param: Parameter) -> Optional[str]:
+        annotation = param.annotation
+        if annotation is Parameter.empty:
+            return None
+        if isinstance(annotation, str):
+            return annotation
+        name = getattr(annotation, "__name__", None)
+        entry = self._registry.get(name)
+        if entry is not None and entry["class"] is annotation:
+            return name
+        return None
+
+    def _compile_deps(self, name: str, path: List[str]) -> List[Tuple[str, str]]:
+        deps = []
+
+        for param in self._registry[name]["deps"].parameters.values():
+            if param.kind in VARIADIC:
+                continue
+            token = self._dependency_of(param)
+
+            if token is not None and token in self._registry:
+                deps.append((param.name, token))
+            elif param.default is Parameter.empty:
+                raise UnknownDependencyError(
+                    provider=name,
+                    parameter=param.name,
+                    token=token or str(param.annotation),
+                    path=path
+                )
+
+        return deps
+
+    def _compile_scope(self, name: str, deps: List[Tuple[str, str]]) -> str:
+        entry = self._registry[name]
+        scope = entry["scope"]
+        dep_scopes = {self._plans[dep].scope for _, dep in deps}
+        needs_request = any(dep in self._needs_request for _, dep in deps)
+
+        if scope == Scope.SINGLETON and needs_request:
+            scope = Scope.REQUEST
+        if scope == Scope.REQUEST or needs_request:
+            self._needs_request.add(name)
+        if entry["pool_size"] and dep_scopes - {Scope.SINGLETON}:
+            raise InvalidScopeError(
+                f"Pooled provider '{name}' can only depend on singleton providers"
+            )
+        if entry["pool_size"] and scope != Scope.REQUEST:
+            raise InvalidScopeError(f"Only request-scoped providers can be pooled ('{name}')")
+        return scope
+
+    def _visit(self, name: str, path: List[str], visiting: Dict[str, int]) -> None:
+        if name in self._plans:
+            return
+        if name in visiting:
+            raise CircularDependencyError(path[visiting[name]:] + [name])
+
+        visiting[name] = len(path)
+        path.append(name)
+        deps = self._compile_deps(name, path)
+
+        for _, dep in deps:
+            self._visit(dep, path, visiting)
+
+        path.pop()
+        del visiting[name]
+        entry = self._registry[name]
+        plan = self._plans[name] = ProviderPlan(
+            name=name,
+            provider_class=entry["class"],
+            deps=tuple(deps),
+            scope=self._compile_scope(name, deps),
+            pool_size=entry["pool_size"]
+        )
+        if plan.pool_size:
+            self._pools[name] = InstancePool(partial(self.create, name), plan.pool_size)
+        self._order.append(name)
+
+    def compile(self) -> List[str]:
+        """
+        Build the provider graph and return the providers in topological order.
+
+        Raises:
+            CircularDependencyError: If providers depend on each other in a cycle.
+            UnknownDependencyError: If a required dependency is not registered.
+        """
+        if self._order:
+            return self._order
+        return self.refresh()
+
+    def refresh(self) -> List[str]:
+        """
+        Compile providers registered since the last compilation.
+
+        Existing plans and instances are kept, so modules loaded after startup
+        extend the graph without rebuilding it.
+        """
+        self._registry = self._collect()
+        for name in self._registry:
+            self._visit(name, [], {})
+        return self._order
+
+    def instantiate(self) -> Dict[str, Any]:
+        for name in self.compile():
+            if name not in self._instances and self._plans[name].scope == Scope.SINGLETON:
+                self._instances[name] = self.create(name)
+        return self._instances
+
+    def create(self, token: Token, request: Optional[RequestScope] = None) -> Any:
+        plan = self._plans[self.token_name(token)]
+        return plan.provider_class(**{param: self.resolve(dep, request) for param, dep in plan.deps})
+
+    def resolve(self, token: Token, request: Optional[RequestScope] = None) -> Any:
+        name = self.token_name(token)
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        plan = self._plans.get(name) or self.get_plan(name)
+        if plan.scope == Scope.SINGLETON:
+            return self.get(name)
+        if plan.scope == Scope.TRANSIENT:
+            return self.create(name, request)
+        if request is None:
+            raise InvalidScopeError(f"'{name}' is request-scoped and needs a request scope")
+
+        instance = request.instances.get(name)
+        if instance is None:
+            pool = self._pools.get(name)
+            instance = pool.acquire() if pool is not None else self.create(name, request)
+            request.instances[name] = instance
+            request.track(instance, pool)
+        return instance
+
+    def get(self, token: Token) -> Any:
+        name = self.token_name(token)
+        try:
+            return self._instances[name]
+        except KeyError:
+            pass
+
+        plan = self.get_plan(name)
+        if plan.scope != Scope.SINGLETON:
+            raise InvalidScopeError(
+                f"'{name}' is {plan.scope}-scoped; use resolve() with a request scope"
+            )
+
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                instance = self._instances[name] = self.create(name)
+            return instance
+
+    def get_plan(self, token: Token) -> ProviderPlan:
+        name = self.token_name(token)
+        try:
+            return self._plans[name]
+        except KeyError:
+            self.refresh()
+            return self._plans[name]
+
+    def get_order(self) -> List[str]:
+        return self.compile()
+
+    def get_instances(self) -> Dict[str, Any]:
+        """Return the singletons created so far, keyed by provider name."""
+        return self._instances
+
+    def reset(self) -> None:
+        self._registry.clear()
+        self._plans.clear()
+        self._order.clear()
+        self._instances.clear()
+        self._pools.clear()
+        self._needs_request.clear()
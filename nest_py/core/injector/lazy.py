@@ -0,0 +1,42 @@
+from functools import wraps
+from typing import Any, Callable
+from nest_py.core.reflect import IS_COROUTINE_FUNC, IS_ASYNC_GEN_FUNC, IS_GEN_FUNC
+
+
+def lazy_method(injector: Any, token: str, handler: Callable) -> Callable:
+    """
+    Build a callable that instantiates the controller on first use.
+
+    The controller (and its provider subgraph) is resolved on the first call
+    and the bound method is cached, so later calls only pay a `None` check.
+    """
+    bound = None
+
+    def bind() -> Callable:
+        nonlocal bound
+        if bound is None:
+            bound = handler.__get__(injector.get(token))
+        return bound
+
+    if IS_COROUTINE_FUNC(handler):
+        @wraps(handler)
+        async def method(**kwargs) -> Any:
+            return await (bound or bind())(**kwargs)
+
+    elif IS_ASYNC_GEN_FUNC(handler):
+        @wraps(handler)
+        async def method(**kwargs) -> Any:
+            async for item in (bound or bind())(**kwargs):
+                yield item
+
+    elif IS_GEN_FUNC(handler):
+        @wraps(handler)
+        def method(**kwargs) -> Any:
+            yield from (bound or bind())(**kwargs)
+
+    else:
+        @wraps(handler)
+        def method(**kwargs) -> Any:
+            return (bound or bind())(**kwargs)
+
+    return method
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+from collections import deque
+from functools import wraps
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+from nest_py.core.reflect import Reflect, IS_AWAITABLE, IS_COROUTINE_FUNC, IS_ASYNC_GEN_FUNC, IS_GEN_FUNC
+
+REQUEST_DESTROY_HOOK = "on_request_destroy"
+POOL_RESET_HOOK = "reset"
+
+logger = logging.getLogger("nest_py.injector")
+_teardowns: Set["asyncio.Task[None]"] = set()
+
+
+class InstancePool:
+    """
+    Bounded pool of request-scoped instances.
+
+    Released instances are reset through their `reset()` hook and kept for the
+    next request; once `max_size` idle instances are held, extras are dropped.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_size: int) -> None:
+        self._factory = factory
+        self._max_size = max_size
+        self._idle: Deque[Any] = deque()
+
+    def acquire(self) -> Any:
+        try:
+            return self._idle.pop()
+        except IndexError:
+            return self._factory()
+
+    def release(self, instance: Any) -> None:
+        if len(self._idle) >= self._max_size:
+            return
+        reset = Reflect.get(instance, POOL_RESET_HOOK)
+        if reset is not None:
+            try:
+                reset()
+            except Exception:
+                logger.exception("Dropped pooled %s: reset() failed", type(instance).__name__)
+                return
+        self._idle.append(instance)
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+
+class RequestScope:
+    """
+    Holds the request-scoped instances created while serving one request.
+
+    Instances are created lazily by `Injector.resolve` and torn down in
+    creation order by `close()`/`aclose()`. `close()` serves sync handlers:
+    async `on_request_destroy` hooks are run to completion on a private event
+    loop, or, when the handler runs inline on the event loop thread, in a
+    task that releases the remaining instances once the hook is done.
+    """
+
+    __slots__ = ("instances", "_created")
+
+    def __init__(self) -> None:
+        self.instances: Dict[str, Any] = {}
+        self._created: List[Tuple[Any, Any]] = []
+
+    def track(self, instance: Any, pool: Any = None) -> None:
+        self._created.append((instance, pool))
+
+    def close(self) -> None:
+        created = self._drain()
+        for index, (instance, pool) in enumerate(created):
+            hook = Reflect.get(instance, REQUEST_DESTROY_HOOK)
+            result = hook() if hook is not None else None
+            if IS_AWAITABLE(result):
+                try:
+                    loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+                except RuntimeError:
+                    loop = None
+                if loop is not None:
+                    task = loop.create_task(self._finish(result, created[index:]))
+                    _teardowns.add(task)
+                    task.add_done_callback(_teardown_done)
+                    return
+                asyncio.run(self._finish(result, []))
+            if pool is not None:
+                pool.release(instance)
+
+    async def aclose(self) -> None:
+        for instance, pool in self._drain():
+            hook = Reflect.get(instance, REQUEST_DESTROY_HOOK)
+            if hook is not None:
+                result = hook()
+                if IS_AWAITABLE(result):
+                    await result
+            if pool is not None:
+                pool.release(instance)
+
+    async def _finish(self, pending: Awaitable[Any], created: List[Tuple[Any, Any]]) -> None:
+        await pending
+        if created:
+            instance, pool = created[0]
+            if pool is not None:
+                pool.release(instance)
+            self._created = created[1:]
+            await self.aclose()
+
+    def _drain(self) -> List[Tuple[Any, Any]]:
+        created, self._created = self._created, []
+        self.instances.clear()
+        return created
+
+
+def _teardown_done(task: "asyncio.Task[None]") -> None:
+    _teardowns.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("on_request_destroy failed", exc_info=task.exception())
+
+
+def scoped_method(injector: Any, token: str, handler: Callable) -> Callable:
+    """
+    Build a callable that resolves the controller per request before calling `handler`.
+
+    The returned callable keeps the sync/async/generator flavour of
+    `handler` so it can be compiled like a bound method.
+    """
+    if IS_COROUTINE_FUNC(handler):
+        @wraps(handler)
+        async def method(**kwargs) -> Any:
+            request = RequestScope()
+            try:
+                return await handler(injector.resolve(token, request), **kwargs)
+            finally:
+                await request.aclose()
+
+    elif IS_ASYNC_GEN_FUNC(handler):
+        @wraps(handler)
+        async def method(**kwargs) -> Any:
+            request = RequestScope()
+            try:
+                async for item in handler(injector.resolve(token, request), **kwargs):
+                    yield item
+            finally:
+                await request.aclose()
+
+    elif IS_GEN_FUNC(handler):
+        @wraps(handler)
+        def method(**kwargs) -> Any:
+            request = RequestScope()
+            try:
+                yield from handler(injector.resolve(token, request), **kwargs)
+            finally:
+                request.close()
+
+    else:
+        @wraps(handler)
+        def method(**kwargs) -> Any:
+            request = RequestScope()
+            try:
+                return handler(injector.resolve(token, request), **kwargs)
+            finally:
+                request.close()
+
+    return method
@@ -0,0 +1,11 @@
+from nest_py.core.inspector.metrics import METRICS_PATH, Metrics, RouteMetrics
+from nest_py.core.inspector.profiler import PROFILER_PATH, SamplingProfiler
+
+
+__all__ = [
+    "METRICS_PATH",
+    "Metrics",
+    "PROFILER_PATH",
+    "RouteMetrics",
+    "SamplingProfiler",
+]
@@ -0,0 +1,206 @@
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+from nest_py.core.constants import OffloadPolicy
+from nest_py.core.exceptions import HttpException
+from nest_py.core.router.route_compiler import compile_route
+from nest_py.core.structures import DispatchPlan, RouteDefinition
+
+METRICS_PATH = "/metrics"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STAGES = ("guard", "pipe", "handler", "serializer")
+
+
+def passthrough(body: bytes) -> bytes:
+    return body
+
+
+class Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+
+
+class RouteShard:
+    """Counters of one route, written by a single thread."""
+
+    __slots__ = ("latency", "stages", "in_flight", "errors")
+
+    def __init__(self) -> None:
+        self.latency = Histogram()
+        self.stages = {stage: Histogram() for stage in STAGES}
+        self.in_flight = 0
+        self.errors: Dict[int, int] = {}
+
+
+def histogram_lines(name: str, labels: str, histograms: Sequence[Histogram]) -> List[str]:
+    lines = []
+    cumulative = 0
+    for index, bound in enumerate(BUCKETS + (float("inf"),)):
+        cumulative += sum(histogram.counts[index] for histogram in histograms)
+        le = "+Inf" if index == len(BUCKETS) else repr(bound)
+        lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+    lines.append(f"{name}_sum{{{labels}}} {sum(histogram.sum for histogram in histograms)}")
+    lines.append(f"{name}_count{{{labels}}} {cumulative}")
+    return lines
+
+
+class RouteMetrics:
+    """
+    Instrumentation of one compiled route.
+
+    Every thread records into its own `RouteShard`, so the request path
+    never takes a lock or contends on a counter; shards are summed when
+    `Metrics.render` is scraped.
+    """
+
+    def __init__(self, controller: str, handler: str) -> None:
+        self.labels = f'controller="{controller}",handler="{handler}"'
+        self.shards: List[RouteShard] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def shard(self) -> RouteShard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = RouteShard()
+            with self._lock:
+                self.shards.append(shard)
+            return shard
+
+    def timed(self, stage: str, call: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        async def timed_call(*args, **kwargs) -> Any:
+            start = perf_counter()
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                self.shard().stages[stage].observe(perf_counter() - start)
+
+        return timed_call
+
+    def timed_encoder(self, encoder: Callable[[Any], bytes]) -> Callable[[Any], bytes]:
+        def timed_encode(value: Any) -> bytes:
+            start = perf_counter()
+            try:
+                return encoder(value)
+            finally:
+                self.shard().stages["serializer"].observe(perf_counter() - start)
+
+        return timed_encode
+
+    def instrument(self, endpoint: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        async def instrumented(**kwargs) -> Any:
+            shard = self.shard()
+            shard.in_flight += 1
+            start = perf_counter()
+            try:
+                return await endpoint(**kwargs)
+            except HttpException as error:
+                shard.errors[error.status_code] = shard.errors.get(error.status_code, 0) + 1
+                raise
+            except Exception:
+                shard.errors[500] = shard.errors.get(500, 0) + 1
+                raise
+            finally:
+                shard.in_flight -= 1
+                shard.latency.observe(perf_counter() - start)
+
+        return instrumented
+
+
+class Metrics:
+    """
+    Per-route request metrics exported in the Prometheus text format.
+
+    Enabled with `NestPyApplicationContext.enable_metrics()` (or
+    `NestPyFactory.create(..., metrics=True)`) before the routes are
+    compiled: each route then records its latency, in-flight requests,
+    errors by status and the time spent in guards, pipes, the handler and
+    the serializer. Routes without a serializer are encoded with
+    `encode_json` so that stage is measured too. The application serves
+    the result on `GET {path}`; with several workers, each process reports
+    its own counters.
+    """
+
+    def __init__(self, path: str = METRICS_PATH) -> None:
+        self.path = path
+        self._routes: Dict[str, RouteMetrics] = {}
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def add_collector(self, collect: Callable[[], List[str]]) -> None:
+        """Append the lines returned by `collect` to every scrape."""
+        self._collectors.append(collect)
+
+    def route(self, plan: DispatchPlan) -> RouteMetrics:
+        metrics = self._routes.get(plan.name)
+        if metrics is None:
+            metrics = self._routes[plan.name] = RouteMetrics(plan.controller_class.__name__, plan.handler.__name__)
+        return metrics
+
+    def render(self) -> str:
+        routes = list(self._routes.values())
+        lines = [
+            "# HELP nestpy_request_duration_seconds Time spent in the route endpoint.",
+            "# TYPE nestpy_request_duration_seconds histogram",
+        ]
+        for route in routes:
+            shards = list(route.shards)
+            lines.extend(histogram_lines(
+                "nestpy_request_duration_seconds", route.labels, [shard.latency for shard in shards]
+            ))
+
+        lines.append("# HELP nestpy_stage_duration_seconds Time spent in each stage of the route.")
+        lines.append("# TYPE nestpy_stage_duration_seconds histogram")
+        for route in routes:
+            shards = list(route.shards)
+            for stage in STAGES:
+                histograms = [shard.stages[stage] for shard in shards]
+                if any(histogram.counts != [0] * len(histogram.counts) for histogram in histograms):
+                    lines.extend(histogram_lines(
+                        "nestpy_stage_duration_seconds", f'{route.labels},stage="{stage}"', histograms
+                    ))
+
+        lines.append("# HELP nestpy_requests_in_flight Requests currently inside the route endpoint.")
+        lines.append("# TYPE nestpy_requests_in_flight gauge")
+        for route in routes:
+            lines.append(f"nestpy_requests_in_flight{{{route.labels}}} {sum(shard.in_flight for shard in list(route.shards))}")
+
+        lines.append("# HELP nestpy_request_errors_total Requests that raised, by response status.")
+        lines.append("# TYPE nestpy_request_errors_total counter")
+        for route in routes:
+            errors: Dict[int, int] = {}
+            for shard in list(route.shards):
+                for status, count in list(shard.errors.items()):
+                    errors[status] = errors.get(status, 0) + count
+            for status, count in sorted(errors.items()):
+                lines.append(f'nestpy_request_errors_total{{{route.labels},status="{status}"}} {count}')
+
+        for collect in self._collectors:
+            lines.extend(collect())
+        return "\n".join(lines) + "\n"
+
+    async def scrape(self) -> bytes:
+        return self.render().encode()
+
+    def compile(self) -> DispatchPlan:
+        """Compile the metrics endpoint into a plan served like any controller route."""
+        route = RouteDefinition(
+            handler=Metrics.scrape,
+            metadata={"args": (self.path,), "kwargs": {"methods": ["GET"]}}
+        )
+        plan = compile_route(
+            Metrics,
+            self.scrape,
+            route,
+            offload={"policy": OffloadPolicy.INLINE, "executor": None}
+        )
+        return plan._replace(encoder=passthrough, media_type=CONTENT_TYPE)
@@ -0,0 +1,175 @@
+import sys
+import threading
+from inspect import unwrap
+from types import CodeType, FrameType
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from nest_py.core.constants import OffloadPolicy
+from nest_py.core.exceptions import BadRequestException
+from nest_py.core.router.route_compiler import compile_route
+from nest_py.core.structures import DispatchPlan, RouteDefinition
+
+PROFILER_PATH = "/_profiler"
+MIN_INTERVAL = 0.001
+CONTENT_TYPE = "text/plain; charset=utf-8"
+UNATTRIBUTED = "(unattributed)"
+IDLE_SOURCES = ("selectors.py", "threading.py")
+
+Stack = Tuple[CodeType, ...]
+
+
+def passthrough(body: bytes) -> bytes:
+    return body
+
+
+def frame_label(code: CodeType) -> str:
+    return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def check_interval(interval: float) -> float:
+    if not interval >= MIN_INTERVAL:
+        raise ValueError(f"The sampling interval must be at least {MIN_INTERVAL}s")
+    return interval
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler attributing samples to controller routes.
+
+    While running, a daemon thread wakes every `interval` seconds and
+    records the stack of every other thread. A sample belongs to the route
+    whose handler frame is on the stack, found by code object, so requests
+    pay nothing for attribution and nothing at all while the profiler is
+    stopped. Unattributed stacks are only kept for the main thread, and not
+    while its event loop is idle in the selector. Samples are exported in
+    the collapsed-stack format read by flamegraph tools, with the route as
+    the root frame.
+
+    A timer thread is used rather than SIGPROF: the signal is delivered to
+    whichever thread is running and Python only runs the handler once the
+    main thread wakes up, so handlers offloaded to the thread pool would be
+    missed. Intervals below `MIN_INTERVAL` are rejected, since the sampler
+    would spin and starve the request threads.
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 128) -> None:
+        self._interval = check_interval(interval)
+        self._max_depth = max_depth
+        self._routes: Dict[CodeType, str] = {}
+        self._samples: Dict[str, Dict[Stack, int]] = {}
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.running = False
+        self.path = PROFILER_PATH
+
+    def register(self, plans: Iterable[DispatchPlan]) -> None:
+        """Attribute samples to `plans`; the profiler's own admin endpoints are skipped."""
+        for plan in plans:
+            if plan.controller_class is SamplingProfiler:
+                continue
+            code = getattr(unwrap(plan.handler), "__code__", None)
+            if code is not None:
+                self._routes[code] = plan.name
+
+    def start(self, interval: Optional[float] = None) -> None:
+        if self.running:
+            return
+        self._interval = self._interval if interval is None else check_interval(interval)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="nestpy-profiler", daemon=True)
+        self.running = True
+        self._thread.start()
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.running = False
+
+    def reset(self) -> None:
+        self._samples = {}
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        main = threading.main_thread().ident
+        while not self._stopped.wait(self._interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own:
+                    self._sample(frame, thread_id == main)
+
+    def _sample(self, frame: Optional[FrameType], main: bool) -> None:
+        stack: List[CodeType] = []
+        route = None
+        while frame is not None and len(stack) < self._max_depth:
+            code = frame.f_code
+            if route is None:
+                route = self._routes.get(code)
+            stack.append(code)
+            frame = frame.f_back
+        if route is None:
+            if not main or not stack or stack[0].co_filename.endswith(IDLE_SOURCES):
+                return
+            route = UNATTRIBUTED
+        stack.reverse()
+        counts = self._samples.get(route)
+        if counts is None:
+            counts = self._samples[route] = {}
+        key = tuple(stack)
+        counts[key] = counts.get(key, 0) + 1
+
+    def totals(self) -> Dict[str, int]:
+        """Return the number of samples per route."""
+        return {route: sum(dict(counts).values()) for route, counts in dict(self._samples).items()}
+
+    def collapsed(self, route: str = "") -> str:
+        """Return the samples as collapsed stacks (`route;frame;...;frame count` lines)."""
+        lines = []
+        for name, counts in sorted(dict(self._samples).items()):
+            if route and name != route:
+                continue
+            for stack, count in dict(counts).items():
+                lines.append(";".join([name] + [frame_label(code) for code in stack]) + f" {count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    async def export(self, route: str = "") -> bytes:
+        return self.collapsed(route).encode()
+
+    async def start_endpoint(self, interval: float = 0.0) -> Dict[str, Any]:
+        try:
+            self.start(interval or None)
+        except ValueError as error:
+            raise BadRequestException(str(error)) from None
+        return {"running": self.running, "interval": self._interval}
+
+    async def stop_endpoint(self) -> Dict[str, Any]:
+        self.stop()
+        return {"running": self.running, "samples": self.totals()}
+
+    async def reset_endpoint(self) -> Dict[str, Any]:
+        self.reset()
+        return {"running": self.running}
+
+    def compile(self, path: str = PROFILER_PATH, guards: Sequence[Any] = ()) -> List[DispatchPlan]:
+        """
+        Compile the admin endpoints, protected by `guards`:
+
+            GET    {path}?route=...     collapsed stacks, optionally for one route
+            POST   {path}/start?interval=...
+            POST   {path}/stop
+            DELETE {path}               drop the samples
+        """
+        self.path = path
+        offload = {"policy": OffloadPolicy.INLINE, "executor": None}
+        endpoints = (
+            (SamplingProfiler.export, self.export, path, "GET"),
+            (SamplingProfiler.start_endpoint, self.start_endpoint, f"{path}/start", "POST"),
+            (SamplingProfiler.stop_endpoint, self.stop_endpoint, f"{path}/stop", "POST"),
+            (SamplingProfiler.reset_endpoint, self.reset_endpoint, path, "DELETE"),
+        )
+        plans = []
+        for handler, method, route_path, http_method in endpoints:
+            route = RouteDefinition(handler=handler, metadata={"args": (route_path,), "kwargs": {"methods": [http_method]}})
+            plans.append(compile_route(SamplingProfiler, method, route, offload=offload, guards=guards))
+        plans[0] = plans[0]._replace(encoder=passthrough, media_type=CONTENT_TYPE)
+        return plans
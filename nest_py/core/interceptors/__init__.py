@@ -0,0 +1,19 @@
+from nest_py.core.interceptors.cache import (
+    CacheBackend,
+    CacheInterceptor,
+    InMemoryCacheClient,
+    MemoryCache,
+    SharedCache,
+)
+from nest_py.core.interceptors.interceptor import NestInterceptor, compile_interceptors
+
+
+__all__ = [
+    "CacheBackend",
+    "CacheInterceptor",
+    "InMemoryCacheClient",
+    "MemoryCache",
+    "NestInterceptor",
+    "SharedCache",
+    "compile_interceptors",
+]
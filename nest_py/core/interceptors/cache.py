@@ -0,0 +1,221 @@
+import asyncio
+import pickle
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urlencode
+from nest_py.core.constants import ParamKind
+from nest_py.core.execution_context import ExecutionContext
+from nest_py.core.interceptors.interceptor import CallNext, NestInterceptor
+
+MISSING = object()
+CACHEABLE_METHODS = frozenset(("GET", "HEAD"))
+
+CacheKey = Union[str, Callable[[ExecutionContext], str]]
+
+
+class CacheBackend(ABC):
+    """Storage used by `CacheInterceptor`; `get` returns `MISSING` on a miss."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Any: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache with per-entry TTL.
+
+    Entries past their TTL are dropped when read; once `max_size` entries are
+    held, the least recently used one is evicted.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._entries[key] = (time.monotonic() + ttl if ttl else None, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class InMemoryCacheClient:
+    """
+    Local stand-in for a shared cache server client (Redis-like `get`/`set`/`delete`).
+
+    Lets `SharedCache` run in tests and single-process setups.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[str, Tuple[Optional[float], bytes]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, px: Optional[int] = None) -> None:
+        self._values[key] = (time.monotonic() + px / 1000 if px else None, value)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._values.pop(key, None)
+
+    async def scan_iter(self, match: str):
+        prefix = match.rstrip("*")
+        for key in list(self._values):
+            if key.startswith(prefix):
+                yield key
+
+
+class SharedCache(CacheBackend):
+    """
+    Cache shared between workers through an async Redis-like `client`.
+
+    Values are pickled; keys are prefixed with `namespace`.
+    """
+
+    def __init__(self, client: Any = None, namespace: str = "nestpy:cache:") -> None:
+        self._client = client if client is not None else InMemoryCacheClient()
+        self._namespace = namespace
+
+    async def get(self, key: str) -> Any:
+        raw = await self._client.get(self._namespace + key)
+        return MISSING if raw is None else pickle.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self._client.set(self._namespace + key, pickle.dumps(value), px=int(ttl * 1000) if ttl else None)
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._namespace + key)
+
+    async def clear(self) -> None:
+        keys = [key async for key in self._client.scan_iter(match=self._namespace + "*")]
+        if keys:
+            await self._client.delete(*keys)
+
+
+class CacheInterceptor(NestInterceptor):
+    """
+    Cache route results for `ttl` seconds.
+
+    Entries are keyed on the route (or the `key` prefix) plus its path and
+    query arguments; a callable `key` builds the whole key from the
+    execution context. Concurrent misses for the same key are coalesced:
+    the handler runs once and every waiter gets its result; if that call
+    fails or is cancelled, the waiters start over and one of them runs the
+    handler. As in NestJS, only GET and HEAD routes are cached: a route
+    accepting any other method, or streaming its response, always runs its
+    handler.
+
+    Values are not copied: with `MemoryCache`, every hit and every coalesced
+    waiter gets the same object, so handlers and callers must not mutate
+    what they return. `SharedCache` unpickles a fresh copy on each hit.
+    """
+
+    def __init__(
+            self,
+            ttl: Optional[float] = None,
+            key: Optional[CacheKey] = None,
+            backend: Optional[CacheBackend] = None,
+            max_size: int = 1024
+    ) -> None:
+        self.ttl = ttl
+        self.key = key
+        self.backend = backend if backend is not None else MemoryCache(max_size)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._key_params: Dict[str, Tuple[str, ...]] = {}
+        self._cacheable: Dict[str, bool] = {}
+
+    def is_cacheable(self, context: ExecutionContext) -> bool:
+        plan = context.plan
+        cacheable = self._cacheable.get(plan.name)
+        if cacheable is None:
+            cacheable = self._cacheable[plan.name] = (
+                not plan.is_stream
+                and bool(plan.methods)
+                and all(method.upper() in CACHEABLE_METHODS for method in plan.methods)
+            )
+        return cacheable
+
+    def build_key(self, context: ExecutionContext) -> str:
+        if callable(self.key):
+            return self.key(context)
+
+        plan = context.plan
+        names = self._key_params.get(plan.name)
+        if names is None:
+            names = self._key_params[plan.name] = tuple(
+                param.name for param in plan.parameters if param.kind != ParamKind.BODY
+            )
+        values = [(name, context.kwargs[name]) for name in names if context.kwargs.get(name) is not None]
+        return f"{self.key or plan.name}?{urlencode(values)}"
+
+    async def intercept(self, context: ExecutionContext, call_next: CallNext) -> Any:
+        if not self.is_cacheable(context):
+            return await call_next()
+
+        key = self.build_key(context)
+        while True:
+            value = await self.backend.get(key)
+            if value is not MISSING:
+                return value
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            value = await asyncio.shield(pending)
+            if value is not MISSING:
+                return value
+
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        result = MISSING
+        try:
+            value = await call_next()
+            await self.backend.set(key, value, self.ttl)
+            result = value
+        finally:
+            del self._inflight[key]
+            future.set_result(result)
+        return value
+
+    async def invalidate(self, key: Optional[str] = None) -> None:
+        if key is None:
+            await self.backend.clear()
+        else:
+            await self.backend.delete(key)
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from functools import partial
+from typing import Any, Awaitable, Callable, Sequence
+from nest_py.core.execution_context import ExecutionContext
+
+CallNext = Callable[[], Awaitable[Any]]
+Call = Callable[[ExecutionContext], Awaitable[Any]]
+
+
+class NestInterceptor(ABC):
+    """
+    Wraps the dispatch of a route.
+
+    `intercept` receives the execution context and `call_next`, which runs
+    the rest of the chain (and finally the handler) when awaited.
+    """
+
+    @abstractmethod
+    async def intercept(self, context: ExecutionContext, call_next: CallNext) -> Any: ...
+
+
+def link(interceptor: NestInterceptor, call: Call) -> Call:
+    intercept = interceptor.intercept
+
+    async def linked(context: ExecutionContext) -> Any:
+        return await intercept(context, partial(call, context))
+    return linked
+
+
+def compile_interceptors(call: Call, interceptors: Sequence[NestInterceptor]) -> Call:
+    """Nest `interceptors` around `call`, first one outermost; built once per route."""
+    for interceptor in reversed(interceptors):
+        call = link(interceptor, call)
+    return call
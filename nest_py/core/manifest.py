@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Type
+
+MANIFEST_VERSION = 1
+MANIFEST_PATH = os.path.join(".nestpy", "manifest.json")
+MANIFEST_ENV = "NESTPY_MANIFEST"
+
+
+def file_stamp(path: str, with_hash: bool = True) -> Dict[str, Any]:
+    stat = os.stat(path)
+    stamp = {"path": path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    if with_hash:
+        with open(path, "rb") as source:
+            stamp["sha256"] = hashlib.sha256(source.read()).hexdigest()
+    return stamp
+
+
+def source_file(module_name: str) -> Optional[str]:
+    module = sys.modules.get(module_name)
+    return getattr(module, "__file__", None)
+
+
+def class_sources(cls: Type[Any]) -> List[str]:
+    return [klass.__module__ for klass in cls.__mro__ if source_file(klass.__module__)]
+
+
+def json_safe(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [json_safe(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): json_safe(item) for key, item in value.items()}
+    return repr(value)
+
+
+def build_manifest(ctx_app: Any) -> Dict[str, Any]:
+    """
+    Serialize the controller/module/injectable registry of `ctx_app`.
+
+    Every entry records the Python modules it was read from; their files are
+    stamped with mtime, size and sha256 so the manifest can detect staleness.
+    """
+    sources: Dict[str, Dict[str, Any]] = {}
+
+    def describe(cls: Type[Any]) -> Dict[str, Any]:
+        modules = class_sources(cls)
+        for module_name in modules:
+            if module_name not in sources:
+                sources[module_name] = file_stamp(source_file(module_name))
+        return {"module": cls.__module__, "qualname": cls.__qualname__, "sources": modules}
+
+    controllers = {}
+    for name, entry in ctx_app.get_controllers().items():
+        controllers[name] = {
+            **describe(entry["controller_class"]),
+            "routes": [
+                {"handler": route.handler.__name__, "metadata": json_safe(route.metadata)}
+                for route in entry["routes"]
+            ],
+            "params": json_safe(entry["params"])
+        }
+
+    modules = {}
+    for name, entry in ctx_app.get_modules().items():
+        modules[name] = {
+            **describe(entry["module_class"]),
+            **{key: entry[key] for key in ("imports", "controllers", "providers", "exports")}
+        }
+
+    injectables = {}
+    for name, entry in ctx_app.get_injectables().items():
+        injectables[name] = {
+            **describe(entry["injectable_class"]),
+            "scope": entry.get("scope"),
+            "pool_size": entry.get("pool_size", 0)
+        }
+
+    return {
+        "version": MANIFEST_VERSION,
+        "python": list(sys.version_info[:2]),
+        "sources": sources,
+        "controllers": controllers,
+        "modules": modules,
+        "injectables": injectables,
+    }
+
+
+def write_manifest(manifest: Dict[str, Any], path: str = MANIFEST_PATH) -> str:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as output:
+        json.dump(manifest, output, indent=2, sort_keys=True)
+    os.replace(temporary, path)
+    return path
+
+
+class Manifest:
+    """
+    Precompiled registry loaded at boot in place of reflection.
+
+    Lookups are keyed by class; an entry is only served while every source
+    file it was built from is unchanged (same mtime and size, or same sha256
+    after a touch). Stale entries return None so callers fall back to
+    reflection.
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self._data = data
+        self._fresh: Dict[str, bool] = {}
+        self._controllers = {
+            (entry["module"], entry["qualname"]): entry
+            for entry in data.get("controllers", {}).values()
+        }
+        self.stale_sources: List[str] = []
+
+    @classmethod
+    def load(cls, path: str = MANIFEST_PATH) -> Optional["Manifest"]:
+        try:
+            with open(path, encoding="utf-8") as source:
+                data = json.load(source)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != MANIFEST_VERSION or data.get("python") != list(sys.version_info[:2]):
+            return None
+        return cls(data)
+
+    def is_fresh(self, module_name: str) -> bool:
+        fresh = self._fresh.get(module_name)
+        if fresh is None:
+            fresh = self._fresh[module_name] = self._check(module_name)
+            if not fresh:
+                self.stale_sources.append(module_name)
+        return fresh
+
+    def _check(self, module_name: str) -> bool:
+        stamp = self._data["sources"].get(module_name)
+        path = source_file(module_name)
+        if stamp is None or path is None or os.path.abspath(path) != os.path.abspath(stamp["path"]):
+            return False
+        try:
+            current = file_stamp(path, with_hash=False)
+            if current["mtime_ns"] == stamp["mtime_ns"] and current["size"] == stamp["size"]:
+                return True
+            return file_stamp(path)["sha256"] == stamp["sha256"]
+        except OSError:
+            return False
+
+    def get_route_handlers(self, cls: Type[Any]) -> Optional[List[str]]:
+        entry = self._controllers.get((cls.__module__, cls.__qualname__))
+        if entry is None or not all(self.is_fresh(module) for module in entry["sources"]):
+            return None
+        return [route["handler"] for route in entry["routes"]]
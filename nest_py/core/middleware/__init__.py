@@ -0,0 +1,10 @@
+from nest_py.core.middleware.consumer import MiddlewareConsumer, RouteInfo
+from nest_py.core.middleware.middleware import NestMiddleware, compile_middleware
+
+
+__all__ = [
+    "MiddlewareConsumer",
+    "NestMiddleware",
+    "RouteInfo",
+    "compile_middleware",
+]
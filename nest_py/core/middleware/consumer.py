@@ -0,0 +1,81 @@
+from fnmatch import fnmatchcase
+from typing import Any, List, NamedTuple, Optional, Tuple
+from nest_py.core.reflect import IS_CLASS
+from nest_py.core.structures import DispatchPlan
+
+
+class RouteInfo(NamedTuple):
+    path: str
+    method: Optional[str] = None
+
+
+class MiddlewareConfig(NamedTuple):
+    middleware: Tuple[Any, ...]
+    routes: Tuple[Any, ...]
+    excluded: Tuple[Any, ...]
+
+
+def normalize(path: str) -> str:
+    return path.rstrip("/") or "/"
+
+
+def route_matches(route: Any, plan: DispatchPlan) -> bool:
+    """Match a route spec (path pattern, `RouteInfo` or controller class) against a plan's path template."""
+    if IS_CLASS(route):
+        return plan.controller_class is route
+    if isinstance(route, RouteInfo):
+        if route.method is not None and route.method.upper() not in plan.methods:
+            return False
+        route = route.path
+    return fnmatchcase(normalize(plan.path), normalize(route))
+
+
+class MiddlewareConfigProxy:
+
+    def __init__(self, consumer: "MiddlewareConsumer", middleware: Tuple[Any, ...]) -> None:
+        self._consumer = consumer
+        self._middleware = middleware
+        self._excluded: Tuple[Any, ...] = ()
+
+    def exclude(self, *routes: Any) -> "MiddlewareConfigProxy":
+        self._excluded += routes
+        return self
+
+    def for_routes(self, *routes: Any) -> "MiddlewareConsumer":
+        self._consumer.add(MiddlewareConfig(self._middleware, routes, self._excluded))
+        return self._consumer
+
+
+class MiddlewareConsumer:
+    """
+    Collects the middleware declared by modules in `configure(consumer)`.
+
+        consumer.apply(LoggerMiddleware).exclude("/users/export").for_routes(UserController, "/employees/*")
+
+    Routes are path patterns (`*` wildcards) matched against route templates,
+    `RouteInfo(path, method)` or controller classes. Matching happens once
+    per route at compile time; `resolve` returns the route's middleware in
+    declaration order.
+    """
+
+    def __init__(self) -> None:
+        self._configs: List[MiddlewareConfig] = []
+
+    def apply(self, *middleware: Any) -> MiddlewareConfigProxy:
+        return MiddlewareConfigProxy(self, middleware)
+
+    def add(self, config: MiddlewareConfig) -> None:
+        self._configs.append(config)
+
+    def resolve(self, plan: DispatchPlan) -> Tuple[Any, ...]:
+        resolved: Tuple[Any, ...] = ()
+        for config in self._configs:
+            if not any(route_matches(route, plan) for route in config.routes):
+                continue
+            if any(route_matches(route, plan) for route in config.excluded):
+                continue
+            resolved += config.middleware
+        return resolved
+
+    def __len__(self) -> int:
+        return len(self._configs)
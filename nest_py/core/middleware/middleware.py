@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Sequence
+from nest_py.core.reflect import IS_CLASS
+
+ASGIApp = Callable[[Dict[str, Any], Callable, Callable], Awaitable[None]]
+
+
+class NestMiddleware(ABC):
+    """
+    Middleware running before the route's guards and handler.
+
+    `use` receives the ASGI triple and `call_next`, the rest of the chain;
+    not awaiting it ends the request with whatever `use` sent.
+    """
+
+    @abstractmethod
+    async def use(self, scope: Dict[str, Any], receive: Callable, send: Callable, call_next: ASGIApp) -> None: ...
+
+
+def link(use: Callable, app: ASGIApp) -> ASGIApp:
+    async def linked(scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        await use(scope, receive, send, app)
+    return linked
+
+
+def compile_middleware(middleware: Sequence[Any], app: ASGIApp) -> ASGIApp:
+    """
+    Nest `middleware` around the ASGI callable `app`, first one outermost.
+
+    Entries are `NestMiddleware` instances, plain `async (scope, receive,
+    send, call_next)` functions, or ASGI middleware classes built as
+    `cls(app)` (Starlette style).
+    """
+    for item in reversed(middleware):
+        if isinstance(item, NestMiddleware):
+            app = link(item.use, app)
+        elif IS_CLASS(item):
+            app = item(app)
+        else:
+            app = link(item, app)
+    return app
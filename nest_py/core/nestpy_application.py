@@ -0,0 +1,250 @@
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+from nest_py.core.adapters import AbstractHttpAdapter, AsgiAdapter
+from nest_py.core.errors import NestPyError
+from nest_py.core.hooks import SHUTDOWN_HOOKS, STARTUP_HOOKS, run_hooks
+from nest_py.core.inspector.profiler import PROFILER_PATH, SamplingProfiler
+from nest_py.core.middleware import MiddlewareConsumer, NestMiddleware
+from nest_py.core.nestpy_application_context import NestPyApplicationContext
+from nest_py.core.reflect import Reflect, IS_CLASS
+from nest_py.core.router import RadixRouter
+from nest_py.core.router.batch import BATCH_PATH, BatchDispatcher
+from nest_py.core.router.router_app import Receive, Scope, Send
+from nest_py.core.scanner import IMPORT_SEPARATOR, ModuleScanner
+from nest_py.core.services.scheduler import Scheduler
+from nest_py.core.supervisor import SUPERVISOR_OPTIONS, WorkerSupervisor
+from nest_py.core.structures import DispatchPlan, HookNode, ModuleReport
+
+T = TypeVar("T")
+
+
+class NestPyApplication:
+    """
+    Application built by `NestPyFactory.create` from a root module.
+
+    Routes are compiled into a `RadixRouter` and served through an HTTP
+    adapter (`AsgiAdapter` unless another one is given); the application is
+    itself an ASGI callable delegating to the adapter. Middleware declared by
+    modules in `configure(consumer)` is resolved per route while compiling.
+
+    Providers, controllers and modules may define the `on_module_init`,
+    `on_application_bootstrap`, `on_module_destroy` and
+    `before_application_shutdown` hooks (sync or async). They run from the
+    server's lifespan, or through `startup()` and `close()`, following the
+    dependency graph: see `run_hooks`. Methods decorated with `@interval`,
+    `@timeout` or `@cron` are scheduled once the startup hooks have run and
+    stopped before the shutdown hooks: see `Scheduler`.
+    In lazy mode, controllers and their providers are instantiated on first
+    use and modules imported by reference are only imported when a request
+    does not match any of the routes loaded so far.
+    """
+
+    def __init__(
+            self,
+            ctx_app: NestPyApplicationContext,
+            module_class: Type[T],
+            lazy: bool = False,
+            adapter: Optional[AbstractHttpAdapter] = None
+    ) -> None:
+        self._ctx_app = ctx_app
+        self._module_class = module_class
+        self._lazy = lazy
+        self._scanner = ModuleScanner(ctx_app)
+        self._router = RadixRouter()
+        self._adapter = adapter or AsgiAdapter()
+        self._instance: Any = None
+        self._plans: List[DispatchPlan] = []
+        self._consumer = MiddlewareConsumer()
+        self._modules: Dict[str, Any] = {}
+        self._profiler: Optional[SamplingProfiler] = None
+        self._scheduler = Scheduler(ctx_app)
+        self._started = False
+        self._closed = False
+        self._lock = Lock()
+
+    @property
+    def context(self) -> NestPyApplicationContext:
+        return self._ctx_app
+
+    def init(self, import_seconds: Optional[float] = None) -> "NestPyApplication":
+        scanned = self._scanner.scan(self._module_class.__name__, self._lazy, import_seconds)
+        self._compile(scanned)
+        metrics = self._ctx_app.get_metrics()
+        if metrics is not None:
+            self.add_plan(metrics.compile())
+        self._adapter.mount(self)
+        self._instance = self._adapter.get_instance()
+        return self
+
+    def _configure(self, module_names: List[str]) -> None:
+        for module_name in module_names:
+            module = self._modules.get(module_name)
+            if module is None:
+                module = self._modules[module_name] = self._ctx_app.get_module(module_name)["module_class"]()
+            if Reflect.has(module, "configure"):
+                module.configure(self._consumer)
+
+    def _resolve_middleware(self, plan: DispatchPlan) -> Tuple[Any, ...]:
+        return tuple(
+            self._ctx_app.resolve_enhancer(item) if IS_CLASS(item) and issubclass(item, NestMiddleware) else item
+            for item in self._consumer.resolve(plan)
+        )
+
+    def _compile(self, module_names: List[str]) -> None:
+        injector = self._ctx_app.get_injector()
+        injector.refresh()
+        if not self._lazy:
+            injector.instantiate()
+        self._configure(module_names)
+
+        for module_name in module_names:
+            for name in self._ctx_app.get_module(module_name)["controllers"] or []:
+                if not self._ctx_app.get_controller(name):
+                    raise NestPyError(
+                        f"Controller '{name}' listed in module '{module_name}' is not registered"
+                    )
+                for plan in self._ctx_app.compile_controller(name, lazy=self._lazy):
+                    if len(self._consumer):
+                        plan = plan._replace(middleware=self._resolve_middleware(plan))
+                    self.add_plan(plan)
+
+    def add_plan(self, plan: DispatchPlan) -> None:
+        self._plans.append(plan)
+        self._router.add(plan)
+        if self._profiler is not None:
+            self._profiler.register((plan,))
+        if self._instance is not None:
+            self._adapter.add_route(plan)
+
+    def enable_batch(self, path: str = BATCH_PATH, max_concurrency: int = 8, max_requests: int = 50) -> "NestPyApplication":
+        """
+        Serve `POST {path}`, dispatching a list of sub-requests in-process.
+
+        See `BatchDispatcher` for the request format and concurrency rules.
+        """
+        dispatcher = BatchDispatcher(self.resolve_route, max_concurrency, max_requests, path)
+        self.add_plan(dispatcher.compile())
+        return self
+
+    def _hook_nodes(self) -> List[HookNode]:
+        injector = self._ctx_app.get_injector()
+        instances = injector.get_instances()
+        nodes = [
+            HookNode(name, instances[name], tuple(dep for _, dep in injector.get_plan(name).deps))
+            for name in injector.get_order() if name in instances
+        ]
+        for module_name, module in self._modules.items():
+            entry = self._ctx_app.get_module(module_name)
+            deps = [name for name in (entry["providers"] or []) + (entry["controllers"] or []) if name in instances]
+            deps.extend(
+                f"module:{reference.rpartition(IMPORT_SEPARATOR)[2]}" for reference in entry["imports"] or []
+            )
+            nodes.append(HookNode(f"module:{module_name}", module, tuple(deps)))
+        return nodes
+
+    async def startup(self) -> None:
+        """
+        Run `on_module_init` then `on_application_bootstrap`.
+
+        In lazy mode, only the providers and controllers created so far are
+        notified.
+        """
+        if self._started:
+            return
+        self._started = True
+        pool = self._ctx_app.get_process_pool()
+        if pool.used:
+            await pool.start()
+            metrics = self._ctx_app.get_metrics()
+            if metrics is not None:
+                metrics.add_collector(pool.collect)
+        nodes = self._hook_nodes()
+        for hook in STARTUP_HOOKS:
+            await run_hooks(nodes, hook)
+        self._scheduler.start()
+
+    async def close(self) -> None:
+        """Run `on_module_destroy` then `before_application_shutdown`, dependents first."""
+        if self._closed:
+            return
+        self._closed = True
+        await self._scheduler.stop()
+        nodes = self._hook_nodes()
+        for hook in SHUTDOWN_HOOKS:
+            await run_hooks(nodes, hook, reverse=True)
+        self._ctx_app.get_process_pool().shutdown()
+
+    def enable_profiler(
+            self,
+            path: str = PROFILER_PATH,
+            interval: float = 0.005,
+            guards: Optional[Sequence[Any]] = None
+    ) -> SamplingProfiler:
+        """
+        Serve the admin endpoints of a `SamplingProfiler` under `path`.
+
+        The profiler starts stopped; `POST {path}/start` switches it on at
+        runtime. The endpoints expose source paths and let callers start
+        sampling, so `guards` is required: pass the guards restricting who
+        may reach them, or `guards=()` to knowingly serve them unprotected.
+        """
+        if guards is None:
+            raise NestPyError("enable_profiler() needs guards; pass guards=() to serve the endpoints unprotected")
+        if self._profiler is None:
+            self._profiler = SamplingProfiler(interval)
+            self._profiler.register(self._plans)
+            for plan in self._profiler.compile(path, [self._ctx_app.resolve_enhancer(guard) for guard in guards]):
+                self.add_plan(plan)
+        return self._profiler
+
+    def get_profiler(self) -> Optional[SamplingProfiler]:
+        return self._profiler
+
+    def get_scheduler(self) -> Scheduler:
+        return self._scheduler
+
+    def load_pending_modules(self) -> List[str]:
+        with self._lock:
+            scanned = self._scanner.load_pending()
+            self._compile(scanned)
+            return scanned
+
+    def resolve_route(self, method: str, path: str) -> Optional[Tuple[DispatchPlan, Dict[str, str]]]:
+        match = self._router.match(method, path)
+        if match is None and self._scanner.has_pending():
+            self.load_pending_modules()
+            match = self._router.match(method, path)
+        return match
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self._instance(scope, receive, send)
+
+    def get_http_adapter(self) -> AbstractHttpAdapter:
+        return self._adapter
+
+    def get_router(self) -> RadixRouter:
+        return self._router
+
+    def get_plans(self) -> List[DispatchPlan]:
+        return self._plans
+
+    def get_report(self) -> List[ModuleReport]:
+        return self._scanner.get_reports()
+
+    def format_report(self) -> str:
+        return self._scanner.format_report()
+
+    def listen(self, host: str, port: Union[str, int], workers: int = 1, **options: Any) -> None:
+        """
+        Serve the application with uvicorn.
+
+        With `workers > 1`, or any of the supervisor options (`max_requests`,
+        `max_requests_jitter`, `graceful_timeout`, `reuse_port`,
+        `app_factory`), a pre-fork `WorkerSupervisor` runs the workers; see
+        its documentation for the recycling, drain and reload options.
+        Remaining options are passed to uvicorn.
+        """
+        if workers > 1 or any(name in options for name in SUPERVISOR_OPTIONS):
+            WorkerSupervisor(self, host, port, workers, **options).run()
+        else:
+            self._adapter.listen(host, port, **options)
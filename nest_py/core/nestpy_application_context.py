@@ -1,33 +1,21 @@
-import inspect
+import os
 from collections.abc import Callable
-from typing import Any, Dict, List, Tuple, Type, TypeVar
-from functools import wraps
-from inspect import Parameter, Signature
-from nest_py.core.reflect import Reflect
-from nest_py.core.structures import RouteDefinition
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+from nest_py.core.constants import MetadataKeys, OffloadPolicy, Scope
+from nest_py.core.injector import Injector, lazy_method, scoped_method
+from nest_py.core.inspector.metrics import METRICS_PATH, Metrics
+from nest_py.core.manifest import MANIFEST_ENV, MANIFEST_PATH, Manifest
+from nest_py.core.reflect import Reflect, IS_CLASS
+from nest_py.core.router.route_compiler import compile_route
+from nest_py.core.services.process_pool import ProcessPool
+from nest_py.core.structures import DispatchPlan, RouteDefinition
 
 T = TypeVar("T")
 INIT_VARS = "init_vars"
 CLASS = "Config"
 
 
-def make_handler(
-        handler: Callable,
-        controller: Any,
-        parameters: List[Parameter]
-) -> Callable:
-    @wraps(handler)
-    async def async_generic_handler(**kwargs) -> Callable[[Any] , Any]:
-        return await handler(controller, **kwargs)
-
-    @wraps(handler)
-    def sync_generic_handler(**kwargs) -> Callable[[Any], Any]:
-        return handler(controller, **kwargs)
-
-    sync_generic_handler.__signature__ = Signature(parameters=parameters)
-    return sync_generic_handler
-
-
 class Singleton:
     _instance: "Singleton" = None
 
@@ -59,12 +47,18 @@ class NestPyApplicationContext(Singleton):
             "controllers": dict,
             "modules": dict,
             "injectables": dict,
+            "settings": dict,
+            "plans": dict,
+            "registration_costs": dict,
         }
 
     def __init__(self) -> None:
         self._controllers = Reflect.get(self, "controllers")
         self._modules = Reflect.get(self, "modules")
         self._injectables = Reflect.get(self, "injectables")
+        self._settings = Reflect.get(self, "settings")
+        self._plans = Reflect.get(self, "plans")
+        self._registration_costs = Reflect.get(self, "registration_costs")
 
     def register_controller(
             self,
@@ -77,7 +71,7 @@ class NestPyApplicationContext(Singleton):
             "name": name,
             "controller_class": controller_class,
             "routes": routes,
-            "deps": inspect.signature(controller_class),
+            "deps": Reflect.getSignature(controller_class),
             "params": {
                 "args": list(params[0]),
                 "kwargs": params[1]
@@ -122,12 +116,16 @@ class NestPyApplicationContext(Singleton):
 
     def register_injectable(
             self,
-            injectable_class: Type[T]
+            injectable_class: Type[T],
+            scope: str = Scope.SINGLETON,
+            pool_size: int = 0
     ) -> None:
         name = injectable_class.__name__
         self._injectables[name] = {
             "injectable_class": injectable_class,
-            "deps": inspect.signature(injectable_class)
+            "deps": Reflect.getSignature(injectable_class),
+            "scope": scope,
+            "pool_size": pool_size
         }
 
     def get_injectables(self) -> Dict[str, Any]:
@@ -139,17 +137,163 @@ class NestPyApplicationContext(Singleton):
     def clear_injectables(self) -> None:
         self._injectables.clear()
 
-    def wrap_handler(self, controller: Any, handler: Callable) -> Callable:
-        handler_sig = dict(inspect.signature(handler).parameters)
-        del handler_sig["self"]
-
-        parameters = [
-            Parameter(
-                name=param.name,
-                kind=inspect.Parameter.KEYWORD_ONLY,
-                annotation=param.annotation,
-                default=param.default
-            ) for param in handler_sig.values()
+    def record_registration(self, source: str, seconds: float) -> None:
+        self._registration_costs[source] = self._registration_costs.get(source, 0.0) + seconds
+
+    def get_registration_costs(self) -> Dict[str, float]:
+        return self._registration_costs
+
+    def load_manifest(self, path: str = MANIFEST_PATH) -> Optional[Manifest]:
+        manifest = self._settings["manifest"] = Manifest.load(path)
+        return manifest
+
+    def get_manifest(self) -> Optional[Manifest]:
+        """Load `NESTPY_MANIFEST`, or `MANIFEST_PATH` when it is unset; an empty value disables it."""
+        if "manifest" not in self._settings:
+            path = os.environ.get(MANIFEST_ENV, MANIFEST_PATH)
+            self._settings["manifest"] = Manifest.load(path) if path else None
+        return self._settings["manifest"]
+
+    def get_injector(self) -> Injector:
+        injector = self._settings.get("injector")
+        if injector is None:
+            injector = self._settings["injector"] = Injector(self)
+        return injector
+
+    def set_offload_policy(self, policy: str, executor: Optional[Executor] = None) -> None:
+        if policy == OffloadPolicy.EXECUTOR and executor is None:
+            raise ValueError("The executor offload policy requires an executor")
+        self._settings["offload"] = {"policy": policy, "executor": executor}
+
+    def get_offload_policy(self, handler: Optional[Callable] = None) -> Dict[str, Any]:
+        offload = Reflect.getMetadata(MetadataKeys.OFFLOAD_METADATA, handler) if handler is not None else None
+        if offload is not None:
+            return offload
+        return self._settings.get("offload", {"policy": OffloadPolicy.THREADPOOL, "executor": None})
+
+    def get_process_pool(self) -> ProcessPool:
+        pool = self._settings.get("process_pool")
+        if pool is None:
+            pool = self._settings["process_pool"] = ProcessPool()
+        return pool
+
+    def set_process_pool(self, max_workers: Optional[int] = None, mp_context: Any = None, **options: Any) -> ProcessPool:
+        """Configure the pool used by `@offload(executor="process")`; see `ProcessPool`."""
+        pool = self.get_process_pool()
+        pool.configure(max_workers, mp_context, **options)
+        return pool
+
+    def enable_metrics(self, path: str = METRICS_PATH) -> Metrics:
+        """Instrument the routes compiled from now on; see `Metrics`."""
+        metrics = self._settings.get("metrics")
+        if metrics is None:
+            metrics = self._settings["metrics"] = Metrics(path)
+        return metrics
+
+    def get_metrics(self) -> Optional[Metrics]:
+        return self._settings.get("metrics")
+
+    def resolve_enhancer(self, enhancer: Any) -> Any:
+        if not IS_CLASS(enhancer):
+            return enhancer
+        enhancers = self._settings.setdefault("enhancers", {})
+        instance = enhancers.get(enhancer)
+        if instance is None:
+            name = enhancer.__name__
+            instance = self.get_injector().get(name) if name in self._injectables else enhancer()
+            enhancers[enhancer] = instance
+        return instance
+
+    def get_enhancers(
+            self,
+            controller_class: Type[T],
+            handler: Callable,
+            key: str,
+            handler_first: bool = False
+    ) -> Tuple[Any, ...]:
+        """
+        Resolve the enhancers (interceptors, guards, ...) declared under `key`.
+
+        Controller-level entries come first, then the handler's (the reverse
+        with `handler_first`, used for exception filters). Classes are
+        instantiated once, through the injector when they are injectable.
+        """
+        scopes = [Reflect.getMetadata(key, controller_class) or [], Reflect.getMetadata(key, handler) or []]
+        if handler_first:
+            scopes.reverse()
+        return tuple(self.resolve_enhancer(enhancer) for scope in scopes for enhancer in scope)
+
+    def compile_route(
+            self,
+            controller: Any,
+            route: RouteDefinition,
+            controller_class: Optional[Type[T]] = None,
+            lazy: bool = False
+    ) -> DispatchPlan:
+        """
+        Compile `route` against a controller instance.
+
+        When `controller` is None the controller is resolved through the
+        injector: on the first call when `lazy` is set, otherwise on every
+        call, which is how request-scoped and transient controllers are
+        dispatched.
+        """
+        controller_class = controller_class or type(controller)
+        name = controller_class.__name__
+        params = self.get_controller(name).get("params", {})
+        args = params.get("args") or [""]
+
+        if controller is not None:
+            method = route.handler.__get__(controller, controller_class)
+        elif lazy:
+            method = lazy_method(self.get_injector(), name, route.handler)
+        else:
+            method = scoped_method(self.get_injector(), name, route.handler)
+
+        return compile_route(
+            controller_class,
+            method,
+            route,
+            args[0],
+            self.get_offload_policy(route.handler),
+            self.get_enhancers(controller_class, route.handler, MetadataKeys.INTERCEPTOR_METADATA),
+            self.get_enhancers(controller_class, route.handler, MetadataKeys.GUARD_METADATA),
+            self.get_enhancers(controller_class, route.handler, MetadataKeys.PIPE_METADATA),
+            self.get_enhancers(controller_class, route.handler, MetadataKeys.EXCEPTION_FILTER_METADATA, True),
+            self.get_metrics()
+        )
+
+    def compile_controller(
+            self,
+            name: str,
+            controller: Any = None,
+            lazy: bool = False
+    ) -> List[DispatchPlan]:
+        entry = self.get_controller(name)
+        if controller is None:
+            injector = self.get_injector()
+            singleton = injector.get_plan(name).scope == Scope.SINGLETON
+            if singleton and not lazy:
+                controller = injector.get(name)
+            lazy = lazy and singleton
+
+        plans = [
+            self.compile_route(controller, route, entry["controller_class"], lazy)
+            for route in entry["routes"]
         ]
+        self._plans[name] = plans
+        return plans
+
+    def get_plans(self) -> Dict[str, List[DispatchPlan]]:
+        return self._plans
 
-        return make_handler(handler, controller, parameters)
+    def clear_plans(self) -> None:
+        self._plans.clear()
+
+    def wrap_handler(self, controller: Any, handler: Callable) -> Callable:
+        routes = self.get_controller(type(controller).__name__).get("routes", [])
+        route = next(
+            (route for route in routes if route.handler is handler),
+            RouteDefinition(handler=handler, metadata={})
+        )
+        return self.compile_route(controller, route).endpoint
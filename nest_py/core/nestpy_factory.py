@@ -1,12 +1,47 @@
-from typing import Union
+import importlib
+from time import perf_counter
+from typing import Optional, Type, TypeVar, Union
+from nest_py.core.adapters import AbstractHttpAdapter
+from nest_py.core.discovery import ComponentDiscovery
+from nest_py.core.nestpy_application import NestPyApplication
+from nest_py.core.nestpy_application_context import NestPyApplicationContext
+from nest_py.core.scanner import IMPORT_SEPARATOR
+
+T = TypeVar("T")
 
 
 class NestPyFactory:
 
     @staticmethod
-    def create(module_class, *args, **kwargs):
-        return module_class(*args, **kwargs)
+    def create(
+            module_class: Union[str, Type[T]],
+            lazy: bool = False,
+            adapter: Optional[AbstractHttpAdapter] = None,
+            metrics: bool = False,
+            discover: Optional[str] = None
+    ) -> NestPyApplication:
+        """
+        Build the application of `module_class`.
+
+        With `discover` (a source directory) and a `"package.module:Class"`
+        reference, the tree is scanned statically first and only the Python
+        modules reachable from the root module are imported.
+        """
+        import_seconds = None
+        if isinstance(module_class, str):
+            source, _, name = module_class.partition(IMPORT_SEPARATOR)
+            if discover is not None:
+                ComponentDiscovery(discover).load(module_class)
+            start = perf_counter()
+            module_class = getattr(importlib.import_module(source), name)
+            import_seconds = perf_counter() - start
+
+        ctx_app = NestPyApplicationContext()
+        if metrics:
+            ctx_app.enable_metrics()
+        app = NestPyApplication(ctx_app, module_class, lazy=lazy, adapter=adapter)
+        return app.init(import_seconds)
 
     @staticmethod
-    def listen(cls, host: str, port: Union[str, int]) -> None:
-        print(f"Listening on port {port}...")
\ No newline at end of file
+    def listen(app: NestPyApplication, host: str, port: Union[str, int], **options) -> None:
+        app.listen(host, port, **options)
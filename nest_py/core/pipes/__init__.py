@@ -0,0 +1,8 @@
+from nest_py.core.pipes.pipe import PipeTransform, compile_argument_pipes, trusted
+
+
+__all__ = [
+    "PipeTransform",
+    "compile_argument_pipes",
+    "trusted",
+]
@@ -0,0 +1,82 @@
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+from nest_py.core.reflect import IS_AWAITABLE, IS_CLASS, IS_COROUTINE_FUNC
+from nest_py.core.structures import ArgumentMetadata, ParameterPlan
+
+ArgumentsTransform = Callable[[Dict[str, Any]], Awaitable[None]]
+
+trusted_call: ContextVar[bool] = ContextVar("trusted_call", default=False)
+
+
+class PipeTransform(ABC):
+    """
+    Transforms or validates one handler argument before the handler runs.
+
+    `compile` is called once per parameter when the route is compiled and
+    returns the callable applied on every request; pipes that can prepare
+    work for a given annotation (validators, parsers) override it.
+    """
+
+    @abstractmethod
+    def transform(self, value: Any, metadata: ArgumentMetadata) -> Any: ...
+
+    def compile(self, metadata: ArgumentMetadata) -> Callable[[Any], Any]:
+        transform = self.transform
+        return lambda value: transform(value, metadata)
+
+
+class TrustedBlock:
+    __slots__ = ("_token",)
+
+    def __enter__(self) -> None:
+        self._token = trusted_call.set(True)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        trusted_call.reset(self._token)
+
+
+def trusted() -> TrustedBlock:
+    """Skip every pipe for the calls made inside the block (trusted in-process callers)."""
+    return TrustedBlock()
+
+
+def resolve_pipe(pipe: Any) -> Any:
+    return pipe() if IS_CLASS(pipe) else pipe
+
+
+def compile_argument_pipes(
+        parameters: Sequence[ParameterPlan],
+        pipes: Sequence[Any] = ()
+) -> Optional[ArgumentsTransform]:
+    """
+    Compile the route-level `pipes` and the pipes declared on each parameter.
+
+    Returns None when no parameter has a pipe. The result transforms the
+    bound arguments in place; async pipes are only awaited where declared.
+    """
+    steps = []
+    for param in parameters:
+        declared = tuple(pipes) + tuple(resolve_pipe(pipe) for pipe in param.pipes)
+        if not declared:
+            continue
+        metadata = ArgumentMetadata(param.kind, param.annotation, param.name)
+        chain: Tuple[Callable[[Any], Any], ...] = tuple(pipe.compile(metadata) for pipe in declared)
+        is_async = any(IS_COROUTINE_FUNC(pipe.transform) for pipe in declared)
+        steps.append((param.name, chain, is_async))
+
+    if not steps:
+        return None
+
+    async def apply(kwargs: Dict[str, Any]) -> None:
+        if trusted_call.get():
+            return
+        for name, chain, is_async in steps:
+            value = kwargs.get(name)
+            for transform in chain:
+                value = transform(value)
+                if is_async and IS_AWAITABLE(value):
+                    value = await value
+            kwargs[name] = value
+
+    return apply
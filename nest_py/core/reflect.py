@@ -1,11 +1,17 @@
-from typing import Any, Optional, Tuple, List, Protocol
+from itertools import chain
+from typing import Any, Dict, Optional, Tuple, List, Protocol
+from weakref import WeakKeyDictionary
 from inspect import (
+    Signature,
+    signature,
     getmembers,
     isfunction,
     isclass,
     ismethod,
     iscoroutine,
+    iscoroutinefunction,
     isasyncgenfunction,
+    isgeneratorfunction,
     isabstract,
     isawaitable,
     isdatadescriptor,
@@ -22,7 +28,9 @@ IS_FUNCTION: FilterType = isfunction
 IS_CLASS: FilterType = isclass
 IS_METHOD: FilterType = ismethod
 IS_COROUTINE: FilterType = iscoroutine
+IS_COROUTINE_FUNC: FilterType = iscoroutinefunction
 IS_ASYNC_GEN_FUNC: FilterType = isasyncgenfunction
+IS_GEN_FUNC: FilterType = isgeneratorfunction
 IS_ABSTRACT: FilterType = isabstract
 IS_AWAITABLE: FilterType = isawaitable
 IS_DATA_DESCRIPTOR: FilterType = isdatadescriptor
@@ -30,13 +38,28 @@ IS_ROUTINE: FilterType = isroutine
 IS_ASYNC_GEN: FilterType = isasyncgen
 IS_BUILTIN: FilterType = isbuiltin
 
+_signatures: "WeakKeyDictionary[Any, Signature]" = WeakKeyDictionary()
+_metadata: "WeakKeyDictionary[Any, Dict[str, Any]]" = WeakKeyDictionary()
+_members: "WeakKeyDictionary[Any, Tuple[Tuple[int, ...], Dict[Any, List[Tuple[str, Any]]]]]" = WeakKeyDictionary()
+
+
+def _unwrap(target: Any) -> Any:
+    return getattr(target, "__func__", target)
+
+
+def _fingerprint(target: type) -> Tuple[int, ...]:
+    return tuple(chain.from_iterable(map(id, vars(klass).values()) for klass in target.__mro__))
+
 
 class Reflect:
     """
     Utility class that provides simple reflection helpers for Python objects.
 
     Methods mirror common reflection operations: getting, setting, checking
-    existence, and deleting attributes on arbitrary targets.
+    existence, and deleting attributes on arbitrary targets. Framework
+    metadata is kept in a weak side table (`defineMetadata`/`getMetadata`,
+    as in reflect-metadata) instead of attributes on the target, and member
+    scans of classes are memoized until the class changes.
     """
 
     @staticmethod
@@ -98,11 +121,128 @@ class Reflect:
         """
         delattr(target, key)
 
+    @staticmethod
+    def getSignature(target: Any) -> Signature:
+        """
+        Return the signature of `target`, computing it at most once per target.
+
+        Args:
+            target: The callable (function or class) to inspect.
+
+        Returns:
+            The `inspect.Signature` of `target`. Targets that cannot be weakly
+            referenced are inspected on every call.
+        """
+        try:
+            return _signatures[target]
+        except KeyError:
+            sig = _signatures[target] = signature(target)
+            return sig
+        except TypeError:
+            return signature(target)
+
+    @staticmethod
+    def defineMetadata(key: str, value: Any, target: Any) -> None:
+        """
+        Attach metadata to `target` without touching its attributes.
+
+        Args:
+            key: The metadata key (see `MetadataKeys`).
+            value: The value to store.
+            target: The class or function to annotate; bound methods store on their function.
+
+        Raises:
+            TypeError: If `target` cannot be weakly referenced.
+        """
+        target = _unwrap(target)
+        entries = _metadata.get(target)
+        if entries is None:
+            entries = _metadata[target] = {}
+        entries[key] = value
+
+    @staticmethod
+    def getOwnMetadata(key: str, target: Any) -> Any:
+        """
+        Return the metadata defined on `target` itself.
+
+        Args:
+            key: The metadata key.
+            target: The class or function to inspect.
+
+        Returns:
+            The stored value, or None when `target` has no such metadata.
+        """
+        try:
+            return _metadata[_unwrap(target)].get(key)
+        except (KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def getMetadata(key: str, target: Any) -> Any:
+        """
+        Return the metadata of `target`, falling back to what it inherits.
+
+        Classes inherit the metadata of their bases (in MRO order) and
+        functions decorated with `functools.wraps` see the metadata of the
+        function they wrap.
+
+        Args:
+            key: The metadata key.
+            target: The class or function to inspect.
+
+        Returns:
+            The first value found, or None.
+        """
+        target = _unwrap(target)
+        lineage = target.__mro__ if isclass(target) else (target,)
+        for link in lineage:
+            while link is not None:
+                try:
+                    entries = _metadata[link]
+                except (KeyError, TypeError):
+                    entries = None
+                if entries is not None and key in entries:
+                    return entries[key]
+                link = getattr(link, "__wrapped__", None)
+        return None
+
+    @staticmethod
+    def hasMetadata(key: str, target: Any) -> bool:
+        """
+        Check whether `target` defines or inherits metadata under `key`.
+
+        Args:
+            key: The metadata key.
+            target: The class or function to inspect.
+
+        Returns:
+            True if `getMetadata` would find a value, False otherwise.
+        """
+        return Reflect.getMetadata(key, target) is not None
+
+    @staticmethod
+    def deleteMetadata(key: str, target: Any) -> None:
+        """
+        Remove the metadata defined on `target` itself under `key`, if any.
+
+        Args:
+            key: The metadata key.
+            target: The class or function to update.
+        """
+        try:
+            _metadata[_unwrap(target)].pop(key, None)
+        except (KeyError, TypeError):
+            pass
+
     @staticmethod
     def getProperties(target: Any, predicate: Optional[FilterType] = None) -> List[Tuple[str, Any]]:
         """
         Return the members of `target` as (name, value) pairs.
 
+        Scans of classes are memoized per predicate and recomputed once an
+        attribute of the class or of one of its bases is added, removed or
+        replaced.
+
         Args:
             target: The object or module to inspect.
             predicate: Optional callable used to filter members (see `inspect.getmembers`).
@@ -111,9 +251,17 @@ class Reflect:
             A list of `(name, value)` tuples for each member. If `predicate` is provided,
             only members for which `predicate(value)` is True are returned.
         """
-        if predicate:
-            return getmembers(target, predicate)
-        return getmembers(target)
+        if not isclass(target):
+            return getmembers(target, predicate) if predicate else getmembers(target)
+
+        fingerprint = _fingerprint(target)
+        cached = _members.get(target)
+        if cached is None or cached[0] != fingerprint:
+            cached = _members[target] = (fingerprint, {})
+        members = cached[1].get(predicate)
+        if members is None:
+            members = cached[1][predicate] = getmembers(target, predicate) if predicate else getmembers(target)
+        return list(members)
 
     @staticmethod
     def getFunctions(target: Any) -> List[Tuple[str, Any]]:
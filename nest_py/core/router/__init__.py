@@ -0,0 +1,16 @@
+from nest_py.core.router.linear_router import LinearRouter, compile_path_pattern
+from nest_py.core.router.radix_router import RadixRouter
+from nest_py.core.router.route_compiler import compile_route, make_handler
+from nest_py.core.router.router_app import RouterApp
+from nest_py.core.router.streaming import StreamResponse
+
+
+__all__ = [
+    "LinearRouter",
+    "RadixRouter",
+    "RouterApp",
+    "StreamResponse",
+    "compile_path_pattern",
+    "compile_route",
+    "make_handler",
+]
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+from nest_py.core.constants import OffloadPolicy, ParamKind
+from nest_py.core.exceptions import BadRequestException, HttpException, PayloadTooLargeException
+from nest_py.core.router.encoding import ERROR_BODIES, encode_error, encode_json, error_body
+from nest_py.core.router.route_compiler import compile_route
+from nest_py.core.router.router_app import Resolver, bind_body, call_endpoint
+from nest_py.core.router.streaming import StreamResponse
+from nest_py.core.structures import DispatchPlan, RouteDefinition
+
+BATCH_PATH = "/_batch"
+SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+logger = logging.getLogger("nest_py.batch")
+
+
+def passthrough(body: bytes) -> bytes:
+    return body
+
+
+class BatchDispatcher:
+    """
+    Serve many logical calls in one HTTP request.
+
+    The body is a list of `{"method", "path", "body"}` sub-requests (the
+    path may carry a query string). Each one is matched against the route
+    table and dispatched in-process through its compiled plan: no HTTP
+    parsing, no ASGI round trip, and the guards see the outer request.
+    Runs of consecutive safe (GET/HEAD/OPTIONS) sub-requests are executed
+    concurrently, at most `max_concurrency` at a time; any other method
+    runs alone, in order, so writes keep their position in the batch.
+    Routes behind middleware are refused with 403: the middleware runs on
+    the ASGI exchange, which sub-requests do not have, and skipping it
+    would bypass whatever it enforces.
+
+    The response is the list of `{"status", "body"}` results in request
+    order, encoded once without re-parsing the sub-responses. A sub-request
+    raising anything but an `HttpException` is logged and answered with a
+    500 entry; the rest of the batch still runs.
+    """
+
+    def __init__(
+            self,
+            resolve: Resolver,
+            max_concurrency: int = 8,
+            max_requests: int = 50,
+            path: str = BATCH_PATH
+    ) -> None:
+        self._resolve = resolve
+        self._max_concurrency = max_concurrency
+        self._max_requests = max_requests
+        self.path = path
+        self._body_params: Dict[str, List[Any]] = {}
+
+    async def dispatch(self, requests: List[Dict[str, Any]]) -> bytes:
+        if not isinstance(requests, list):
+            raise BadRequestException("The batch body must be a list of sub-requests")
+        if len(requests) > self._max_requests:
+            raise PayloadTooLargeException(f"A batch accepts at most {self._max_requests} sub-requests")
+
+        results: List[Optional[Tuple[int, bytes]]] = [None] * len(requests)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def run(index: int, request: Any) -> None:
+            async with semaphore:
+                results[index] = await self.dispatch_one(request)
+
+        for stage in self.stages(requests):
+            if len(stage) == 1:
+                index = stage[0]
+                results[index] = await self.dispatch_one(requests[index])
+            else:
+                await asyncio.gather(*(run(index, requests[index]) for index in stage))
+
+        return b"[" + b",".join(
+            b'{"status":%d,"body":%s}' % (status, body) for status, body in results
+        ) + b"]"
+
+    @staticmethod
+    def stages(requests: List[Any]) -> List[List[int]]:
+        stages: List[List[int]] = []
+        concurrent = False
+        for index, request in enumerate(requests):
+            safe = isinstance(request, dict) and str(request.get("method", "GET")).upper() in SAFE_METHODS
+            if safe and concurrent:
+                stages[-1].append(index)
+            else:
+                stages.append([index])
+            concurrent = safe
+        return stages
+
+    async def dispatch_one(self, request: Any) -> Tuple[int, bytes]:
+        if not isinstance(request, dict) or not isinstance(request.get("path"), str):
+            return 400, error_body("Each sub-request needs a 'path'")
+
+        method = str(request.get("method", "GET")).upper()
+        path, _, query = request["path"].partition("?")
+        if path == self.path:
+            return 400, error_body("Batches cannot be nested")
+
+        match = self._resolve(method, path)
+        if match is None:
+            return 404, error_body("Not Found")
+        plan, params = match
+        if plan.is_stream:
+            return 400, error_body("Streaming routes cannot be batched")
+        if plan.media_type is not None:
+            return 400, error_body("Only JSON routes can be batched")
+        if plan.middleware:
+            return 403, error_body("Routes behind middleware cannot be batched")
+
+        try:
+            values: Dict[str, Any] = dict(parse_qsl(query))
+            values.update(params)
+            body_params = self.body_params(plan)
+            if body_params and request.get("body") is not None:
+                bind_body(body_params, values, request["body"])
+            kwargs = plan.build_kwargs(values)
+        except ValueError as error:
+            return 422, error_body(str(error))
+
+        try:
+            result = await call_endpoint(plan, kwargs)
+            if isinstance(result, StreamResponse):
+                await result.aclose()
+                return 400, error_body("Streaming routes cannot be batched")
+            body = plan.encoder(result) if plan.encoder is not None else encode_json(result)
+        except HttpException as error:
+            return error.status_code, encode_error(error)
+        except Exception:
+            logger.exception("Batched %s %s failed", method, path)
+            return 500, ERROR_BODIES[500]
+        return plan.metadata.get("kwargs", {}).get("status_code", 200), body
+
+    def body_params(self, plan: DispatchPlan) -> List[Any]:
+        body_params = self._body_params.get(plan.name)
+        if body_params is None:
+            body_params = self._body_params[plan.name] = [
+                param for param in plan.parameters if param.kind == ParamKind.BODY
+            ]
+        return body_params
+
+    def compile(self) -> DispatchPlan:
+        """Compile the batch endpoint into a plan served like any controller route."""
+        route = RouteDefinition(
+            handler=BatchDispatcher.dispatch,
+            metadata={"args": (self.path,), "kwargs": {"methods": ["POST"]}}
+        )
+        plan = compile_route(
+            BatchDispatcher,
+            self.dispatch,
+            route,
+            offload={"policy": OffloadPolicy.INLINE, "executor": None}
+        )
+        return plan._replace(encoder=passthrough)
@@ -0,0 +1,47 @@
+import json
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Any, Dict, Union
+from nest_py.core.exceptions import HttpException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_default(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def encode_json(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=encode_default)
+    return json.dumps(value, default=encode_default, separators=(",", ":")).encode()
+
+
+def parse_json(buffer: Union[bytes, bytearray]) -> Any:
+    if orjson is not None:
+        return orjson.loads(buffer)
+    return json.loads(buffer)
+
+
+@lru_cache(maxsize=512)
+def error_body(detail: str) -> bytes:
+    """`{"detail": ...}` body, cached so repeated errors are not re-encoded."""
+    return encode_json({"detail": detail})
+
+
+ERROR_BODIES: Dict[int, bytes] = {
+    status.value: error_body(status.phrase) for status in HTTPStatus if status.value >= 400
+}
+
+
+def encode_error(error: HttpException) -> bytes:
+    if isinstance(error.response, str):
+        return error_body(error.response)
+    return encode_json(error.get_response())
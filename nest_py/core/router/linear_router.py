@@ -0,0 +1,48 @@
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+from nest_py.core.structures import DispatchPlan
+
+PATH_SEGMENT_PATTERN = re.compile(r"{(\w+)(?::(\w+))?}")
+
+
+def compile_path_pattern(path: str) -> Pattern:
+    pattern, index = "", 0
+    for match in PATH_SEGMENT_PATTERN.finditer(path):
+        name, converter = match.groups()
+        group = f"(?P<{name}>.*)" if converter == "path" else f"(?P<{name}>[^/]+)"
+        pattern += re.escape(path[index:match.start()]) + group
+        index = match.end()
+    return re.compile(f"^{pattern}{re.escape(path[index:])}$")
+
+
+class LinearRouter:
+    """
+    Route table matched by scanning every route's regular expression in order.
+
+    This is the matching strategy of most web frameworks; it is kept as the
+    simplest router and as the baseline for the radix router benchmarks.
+    """
+
+    def __init__(self) -> None:
+        self._routes: List[Tuple[Pattern, Tuple[str, ...], DispatchPlan]] = []
+
+    def add(self, plan: DispatchPlan) -> None:
+        self._routes.append((compile_path_pattern(plan.path), plan.methods, plan))
+
+    def match(self, method: str, path: str) -> Optional[Tuple[DispatchPlan, Dict[str, str]]]:
+        for pattern, methods, plan in self._routes:
+            if method in methods:
+                matched = pattern.match(path)
+                if matched is not None:
+                    return plan, matched.groupdict()
+        return None
+
+    def allowed_methods(self, path: str) -> List[str]:
+        methods = set()
+        for pattern, route_methods, _ in self._routes:
+            if pattern.match(path) is not None:
+                methods.update(route_methods)
+        return sorted(methods)
+
+    def __len__(self) -> int:
+        return len(self._routes)
@@ -0,0 +1,210 @@
+import re
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+from nest_py.core.constants import ParamKind
+from nest_py.core.errors import NestPyError
+from nest_py.core.router.route_compiler import parse_bool
+from nest_py.core.router.router_app import Receive, RouterApp, Scope, Send
+from nest_py.core.structures import DispatchPlan
+
+PATH_SEGMENT_PATTERN = re.compile(r"^{(\w+)(?::(\w+))?}$")
+CATCH_ALL = "path"
+
+PATH_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": parse_bool,
+    "uuid": UUID,
+}
+
+Match = Tuple[DispatchPlan, Dict[str, Any]]
+
+
+class RadixNode:
+    __slots__ = ("static", "params", "catch_all", "handlers")
+
+    def __init__(self) -> None:
+        self.static: Dict[str, "RadixNode"] = {}
+        self.params: List[Tuple[str, Optional[Callable[[str], Any]], "RadixNode"]] = []
+        self.catch_all: Optional[Tuple[str, "RadixNode"]] = None
+        self.handlers: Dict[str, DispatchPlan] = {}
+
+    def param_child(self, name: str, converter: Optional[Callable[[str], Any]]) -> "RadixNode":
+        for param_name, param_converter, child in self.params:
+            if param_name == name and param_converter is converter:
+                return child
+        child = RadixNode()
+        self.params.append((name, converter, child))
+        return child
+
+
+class RadixRouter:
+    """
+    Route table compiled into a tree of path segments.
+
+    Static segments are resolved with one dict lookup per segment; dynamic
+    segments (`{id}`, `{id:int}`, `{rest:path}`) are tried after static ones,
+    and their converter is applied while matching so that `/users/{id:int}`
+    and `/users/{slug}` can coexist. Untyped path parameters take the
+    converter of the handler annotation. Matching cost depends on the depth of
+    the path instead of the number of routes.
+
+    Fully static paths are additionally kept in a flat dict, and paths are
+    first walked greedily without backtracking; the backtracking search only
+    runs when the greedy walk dead-ends or ends on a node without a handler
+    for the method, so `PUT /users/export` still reaches `PUT /users/{id}`
+    next to `GET /users/export`; a 405 is only answered when the path matches
+    routes of other methods alone.
+    """
+
+    def __init__(self) -> None:
+        self._root = RadixNode()
+        self._static: Dict[str, RadixNode] = {}
+        self._size = 0
+        self._app: Optional[RouterApp] = None
+
+    @staticmethod
+    def split(path: str) -> List[str]:
+        return path[1:].split("/") if path.startswith("/") else path.split("/")
+
+    def add(self, plan: DispatchPlan) -> None:
+        annotated = {
+            param.name: param.converter
+            for param in plan.parameters if param.kind == ParamKind.PATH
+        }
+        node = self._root
+        dynamic = False
+
+        for segment in self.split(plan.path):
+            matched = PATH_SEGMENT_PATTERN.match(segment)
+            if matched is None:
+                node = node.static.setdefault(segment, RadixNode())
+                continue
+
+            dynamic = True
+            name, converter_name = matched.groups()
+            if converter_name == CATCH_ALL:
+                if node.catch_all is None:
+                    node.catch_all = (name, RadixNode())
+                node = node.catch_all[1]
+                break
+
+            if converter_name and converter_name not in PATH_CONVERTERS:
+                raise NestPyError(f"Unknown path converter '{converter_name}' in route '{plan.path}'")
+            converter = PATH_CONVERTERS[converter_name] if converter_name else annotated.get(name)
+            node = node.param_child(name, converter)
+
+        for method in plan.methods:
+            node.handlers[method] = plan
+        if not dynamic:
+            self._static[plan.path] = node
+        self._size += 1
+
+    @staticmethod
+    def _accepts(node: RadixNode, method: Optional[str]) -> bool:
+        return method in node.handlers if method is not None else bool(node.handlers)
+
+    def _lookup(
+        self,
+        node: RadixNode,
+        segments: List[str],
+        index: int,
+        params: Dict[str, Any],
+        method: Optional[str]
+    ) -> Optional[RadixNode]:
+        if index == len(segments):
+            return node if self._accepts(node, method) else None
+
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            found = self._lookup(child, segments, index + 1, params, method)
+            if found is not None:
+                return found
+
+        if segment:
+            for name, converter, child in node.params:
+                try:
+                    value = converter(segment) if converter is not None else segment
+                except ValueError:
+                    continue
+                found = self._lookup(child, segments, index + 1, params, method)
+                if found is not None:
+                    params[name] = value
+                    return found
+
+        if node.catch_all is not None:
+            name, child = node.catch_all
+            if self._accepts(child, method):
+                params[name] = "/".join(segments[index:])
+                return child
+        return None
+
+    def _collect(self, node: RadixNode, segments: List[str], index: int, methods: Set[str]) -> None:
+        if index == len(segments):
+            methods.update(node.handlers)
+            return
+
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            self._collect(child, segments, index + 1, methods)
+        if segment:
+            for _, converter, child in node.params:
+                try:
+                    if converter is not None:
+                        converter(segment)
+                except ValueError:
+                    continue
+                self._collect(child, segments, index + 1, methods)
+        if node.catch_all is not None:
+            methods.update(node.catch_all[1].handlers)
+
+    def lookup(self, path: str, method: Optional[str] = None) -> Optional[Tuple[RadixNode, Dict[str, Any]]]:
+        """Find the most specific node for `path` that handles `method`, or any method when None."""
+        node = self._static.get(path)
+        if node is not None and (method in node.handlers if method is not None else node.handlers):
+            return node, {}
+
+        segments = self.split(path)
+        params: Dict[str, Any] = {}
+        node = self._root
+        for segment in segments:
+            child = node.static.get(segment)
+            if child is None:
+                if len(node.params) != 1 or not segment:
+                    break
+                name, converter, child = node.params[0]
+                try:
+                    params[name] = converter(segment) if converter is not None else segment
+                except ValueError:
+                    break
+            node = child
+        else:
+            if method in node.handlers if method is not None else node.handlers:
+                return node, params
+
+        params = {}
+        node = self._lookup(self._root, segments, 0, params, method)
+        return (node, params) if node is not None else None
+
+    def match(self, method: str, path: str) -> Optional[Match]:
+        found = self.lookup(path, method)
+        if found is None:
+            return None
+        node, params = found
+        return node.handlers[method], params
+
+    def allowed_methods(self, path: str) -> List[str]:
+        methods: Set[str] = set()
+        self._collect(self._root, self.split(path), 0, methods)
+        return sorted(methods)
+
+    def __len__(self) -> int:
+        return self._size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._app is None:
+            self._app = RouterApp(self.match, self.allowed_methods)
+        await self._app(scope, receive, send)
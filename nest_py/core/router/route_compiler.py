@@ -0,0 +1,201 @@
+import asyncio
+import re
+import types
+from concurrent.futures import Executor
+from functools import partial, wraps
+from inspect import Parameter, Signature
+from typing import Annotated, Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union, get_args, get_origin
+from nest_py.core.constants import MetadataKeys, OffloadPolicy, ParamKind, StreamMode
+from nest_py.core.interceptors.interceptor import NestInterceptor
+from nest_py.core.reflect import Reflect, IS_CLASS, IS_COROUTINE_FUNC, IS_ASYNC_GEN_FUNC, IS_GEN_FUNC
+from nest_py.core.pipes import PipeTransform
+from nest_py.core.router.encoding import encode_json
+from nest_py.core.router.pipeline import compile_pipeline, has_pipeline
+from nest_py.core.router.streaming import StreamResponse
+from nest_py.core.structures import DispatchPlan, ParameterPlan, RouteDefinition
+
+PATH_PARAM_PATTERN = re.compile(r"{(\w+)(?::\w+)?}")
+NONE_TYPE = type(None)
+
+
+def parse_bool(value: str) -> bool:
+    lowered = value.lower()
+    if lowered in ("true", "1", "yes", "on"):
+        return True
+    if lowered in ("false", "0", "no", "off"):
+        return False
+    raise ValueError(f"Invalid boolean value '{value}'")
+
+
+CONVERTERS: Dict[Any, Callable[[str], Any]] = {
+    int: int,
+    float: float,
+    str: str,
+    bool: parse_bool,
+}
+
+
+def resolve_converter(annotation: Any) -> Optional[Callable[[str], Any]]:
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not NONE_TYPE]
+        return resolve_converter(args[0]) if len(args) == 1 else None
+    return CONVERTERS.get(annotation)
+
+
+def is_pipe(value: Any) -> bool:
+    return isinstance(value, PipeTransform) or (IS_CLASS(value) and issubclass(value, PipeTransform))
+
+
+def split_annotated(annotation: Any) -> Tuple[Any, Tuple[Any, ...]]:
+    """Split `Annotated[T, pipe, ...]` into `T` and the pipes found in its metadata."""
+    if get_origin(annotation) is not Annotated:
+        return annotation, ()
+    base, *extras = get_args(annotation)
+    return base, tuple(extra for extra in extras if is_pipe(extra))
+
+
+def join_path(prefix: str, path: str) -> str:
+    return prefix + path if prefix else path or "/"
+
+
+def make_handler(
+        handler: Callable,
+        parameters: List[Parameter],
+        policy: str = OffloadPolicy.THREADPOOL,
+        executor: Optional[Executor] = None,
+        stream: Optional[Dict[str, Any]] = None
+) -> Callable:
+    """
+    Build the endpoint for a bound controller method.
+
+    Generator handlers (sync or async) get an endpoint returning a
+    `StreamResponse` instead of a collected result.
+    """
+    if IS_COROUTINE_FUNC(handler):
+        @wraps(handler)
+        async def generic_handler(**kwargs) -> Any:
+            return await handler(**kwargs)
+
+    elif IS_ASYNC_GEN_FUNC(handler) or IS_GEN_FUNC(handler):
+        stream = stream or {}
+        mode = stream.get("mode", StreamMode.RAW)
+        media_type = stream.get("media_type")
+        inline = policy == OffloadPolicy.INLINE
+
+        @wraps(handler)
+        async def generic_handler(**kwargs) -> Any:
+            return StreamResponse(handler(**kwargs), mode, media_type, executor, inline)
+
+    elif policy == OffloadPolicy.INLINE:
+        @wraps(handler)
+        async def generic_handler(**kwargs) -> Any:
+            return handler(**kwargs)
+
+    elif policy == OffloadPolicy.EXECUTOR:
+        @wraps(handler)
+        async def generic_handler(**kwargs) -> Any:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, partial(handler, **kwargs))
+
+    else:
+        @wraps(handler)
+        def generic_handler(**kwargs) -> Any:
+            return handler(**kwargs)
+
+    generic_handler.__signature__ = Signature(parameters=parameters)
+    return generic_handler
+
+
+def compile_parameters(
+        handler: Callable,
+        path: str
+) -> Tuple[Tuple[ParameterPlan, ...], List[Parameter]]:
+    path_params = set(PATH_PARAM_PATTERN.findall(path))
+    plans, parameters = [], []
+
+    for param in list(Reflect.getSignature(handler).parameters.values())[1:]:
+        annotation, pipes = split_annotated(param.annotation)
+        converter = resolve_converter(annotation)
+
+        if param.name in path_params:
+            kind = ParamKind.PATH
+        elif converter is not None or annotation is Parameter.empty:
+            kind = ParamKind.QUERY
+        else:
+            kind = ParamKind.BODY
+
+        plans.append(ParameterPlan(
+            name=param.name,
+            kind=kind,
+            annotation=annotation,
+            default=param.default,
+            required=param.default is Parameter.empty,
+            converter=converter,
+            pipes=pipes
+        ))
+        parameters.append(Parameter(
+            name=param.name,
+            kind=Parameter.KEYWORD_ONLY,
+            annotation=param.annotation,
+            default=param.default
+        ))
+
+    return tuple(plans), parameters
+
+
+def compile_route(
+        controller_class: Type[Any],
+        method: Callable,
+        route: RouteDefinition,
+        prefix: str = "",
+        offload: Optional[Dict[str, Any]] = None,
+        interceptors: Sequence[NestInterceptor] = (),
+        guards: Sequence[Any] = (),
+        pipes: Sequence[Any] = (),
+        filters: Sequence[Any] = (),
+        metrics: Optional[Any] = None
+) -> DispatchPlan:
+    """
+    Compile a route into a `DispatchPlan`.
+
+    All reflection happens here, once per route; the resulting plan holds the
+    bound controller method, the resolved parameters and the final endpoint,
+    already wrapped by the route's guards, interceptors, pipes and exception
+    filters. With `metrics` (see `Metrics`), the endpoint and the encoder
+    are instrumented as well.
+    """
+    offload = offload or {"policy": OffloadPolicy.THREADPOOL, "executor": None}
+    handler = route.handler
+    args = route.metadata.get("args", ())
+    path = join_path(prefix, args[0] if args else "/")
+
+    parameters, signature_params = compile_parameters(handler, path)
+    stream = Reflect.getMetadata(MetadataKeys.STREAM_METADATA, handler)
+    endpoint = make_handler(method, signature_params, offload["policy"], offload["executor"], stream)
+
+    plan = DispatchPlan(
+        name=f"{controller_class.__name__}.{handler.__name__}",
+        controller_class=controller_class,
+        handler=handler,
+        method=method,
+        path=path,
+        methods=tuple(route.metadata.get("kwargs", {}).get("methods", ())),
+        metadata=route.metadata,
+        parameters=parameters,
+        signature=endpoint.__signature__,
+        is_async=IS_COROUTINE_FUNC(endpoint),
+        endpoint=endpoint,
+        is_stream=IS_ASYNC_GEN_FUNC(method) or IS_GEN_FUNC(method),
+        encoder=Reflect.getMetadata(MetadataKeys.SERIALIZER_METADATA, handler)
+    )
+    if metrics is not None:
+        route_metrics = metrics.route(plan)
+        endpoint, authorize = compile_pipeline(plan, guards, interceptors, pipes, filters, route_metrics)
+        plan = plan._replace(endpoint=endpoint, authorize=authorize, is_async=True)
+        if not plan.is_stream:
+            plan = plan._replace(encoder=route_metrics.timed_encoder(plan.encoder or encode_json))
+    elif has_pipeline(plan, guards, interceptors, pipes, filters):
+        endpoint, authorize = compile_pipeline(plan, guards, interceptors, pipes, filters)
+        plan = plan._replace(endpoint=endpoint, authorize=authorize, is_async=True)
+    return plan
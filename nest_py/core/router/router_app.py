@@ -0,0 +1,302 @@
+import asyncio
+import contextvars
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl
+from nest_py.core.constants import ParamKind
+from nest_py.core.exceptions import HttpException
+from nest_py.core.execution_context import AUTHORIZED, HttpRequest, authorized_route, current_request
+from nest_py.core.middleware.middleware import compile_middleware
+from nest_py.core.router.encoding import ERROR_BODIES, encode_error, encode_json, error_body, parse_json
+from nest_py.core.router.streaming import StreamResponse
+from nest_py.core.structures import DispatchPlan, ParameterPlan
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+Resolver = Callable[[str, str], Optional[Tuple[DispatchPlan, Dict[str, Any]]]]
+
+JSON_CONTENT_TYPE = b"application/json"
+
+
+def validate_body(annotation: Any, value: Any) -> Any:
+    validate = getattr(annotation, "model_validate", None)
+    return validate(value) if validate is not None else value
+
+
+def validate_raw_body(annotation: Any, buffer: Union[bytes, bytearray]) -> Any:
+    validate_json = getattr(annotation, "model_validate_json", None)
+    if validate_json is not None:
+        return validate_json(buffer)
+    return parse_json(buffer) if buffer else None
+
+
+def content_length(scope: Scope) -> Optional[int]:
+    for name, value in scope.get("headers", ()):
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+async def read_body(receive: Receive, length: Optional[int] = None) -> Union[bytes, bytearray]:
+    """
+    Read the request body without concatenating chunks.
+
+    A single-chunk body is returned as received. Multi-chunk bodies are copied
+    once, through a `memoryview`, into a buffer preallocated from the
+    Content-Length header (or grown in place when it is missing).
+    """
+    message = await receive()
+    body = message.get("body", b"")
+    if not message.get("more_body", False):
+        return body
+
+    buffer = bytearray(length if length and length >= len(body) else len(body))
+    view = memoryview(buffer)
+    view[:len(body)] = body
+    offset = len(body)
+
+    while message.get("more_body", False):
+        message = await receive()
+        chunk = message.get("body", b"")
+        end = offset + len(chunk)
+        if end > len(buffer):
+            view.release()
+            buffer.extend(bytes(end - len(buffer)))
+            view = memoryview(buffer)
+        view[offset:end] = chunk
+        offset = end
+
+    view.release()
+    if offset < len(buffer):
+        del buffer[offset:]
+    return buffer
+
+
+async def send_json(send: Send, status: int, value: Any, headers: Optional[List[Tuple[bytes, bytes]]] = None) -> None:
+    await send_body(send, status, encode_json(value), headers)
+
+
+async def send_body(
+        send: Send,
+        status: int,
+        body: bytes,
+        headers: Optional[List[Tuple[bytes, bytes]]] = None,
+        content_type: bytes = JSON_CONTENT_TYPE
+) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())] + (headers or []),
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def wait_disconnect(receive: Receive) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def send_stream(send: Send, receive: Receive, status: int, response: StreamResponse) -> None:
+    """
+    Send a `StreamResponse` as a chunked body.
+
+    Each chunk is produced only after the previous `send` returned, so a
+    slow client pauses the generator through the server's flow control
+    instead of buffering. The generator is closed when the client
+    disconnects.
+    """
+    headers = [(b"content-type", response.media_type.encode())]
+    headers.extend((name.encode(), value.encode()) for name, value in response.headers.items())
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+
+    async def produce() -> None:
+        chunks = response.chunks()
+        try:
+            async for chunk in chunks:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        finally:
+            await chunks.aclose()
+        await send({"type": "http.response.body", "body": b""})
+
+    producer = asyncio.ensure_future(produce())
+    watcher = asyncio.ensure_future(wait_disconnect(receive))
+    try:
+        await asyncio.wait((producer, watcher), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in (producer, watcher):
+            task.cancel()
+        await asyncio.gather(producer, watcher, return_exceptions=True)
+    if producer.done() and not producer.cancelled() and producer.exception() is not None:
+        raise producer.exception()
+
+
+async def call_endpoint(plan: DispatchPlan, kwargs: Dict[str, Any]) -> Any:
+    if plan.is_async:
+        return await plan.endpoint(**kwargs)
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(None, partial(context.run, plan.endpoint, **kwargs))
+
+
+def bind_body(body_params: List[ParameterPlan], values: Dict[str, Any], payload: Any) -> None:
+    if len(body_params) == 1:
+        values[body_params[0].name] = validate_body(body_params[0].annotation, payload)
+    elif isinstance(payload, dict):
+        for param in body_params:
+            if param.name in payload:
+                values[param.name] = validate_body(param.annotation, payload[param.name])
+
+
+async def build_values(
+        plan: DispatchPlan,
+        scope: Scope,
+        receive: Receive,
+        params: Dict[str, Any]
+) -> Dict[str, Any]:
+    values: Dict[str, Any] = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+    values.update(params)
+
+    body_params = [param for param in plan.parameters if param.kind == ParamKind.BODY]
+    if body_params:
+        buffer = await read_body(receive, content_length(scope))
+        if len(body_params) == 1:
+            values[body_params[0].name] = validate_raw_body(body_params[0].annotation, buffer)
+            return values
+
+        bind_body(body_params, values, parse_json(buffer) if buffer else None)
+    return values
+
+
+class RouterApp:
+    """
+    Serve a route table as a single ASGI application.
+
+    Requests are matched with `resolve`, path/query/body values are bound
+    through the route's `DispatchPlan` and the result is returned as JSON.
+    Guards run through `plan.authorize` before the body is read, so rejected
+    callers never reach body validation; they see the path and query values
+    converted as the handler receives them.
+    `on_startup` and `on_shutdown` are awaited on the ASGI lifespan events.
+    """
+
+    def __init__(
+            self,
+            resolve: Resolver,
+            allowed_methods: Callable[[str], List[str]],
+            on_startup: Optional[Callable[[], Awaitable[None]]] = None,
+            on_shutdown: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> None:
+        self._resolve = resolve
+        self._allowed_methods = allowed_methods
+        self._on_startup = on_startup
+        self._on_shutdown = on_shutdown
+        self._chains: Dict[str, Callable[[Scope, Receive, Send], Awaitable[None]]] = {}
+
+    def add_route(self, plan: DispatchPlan) -> Optional[Callable[[Scope, Receive, Send], Awaitable[None]]]:
+        """Compile the middleware chain of `plan`; routes without middleware get none."""
+        if not plan.middleware:
+            return None
+        chain = self._chains[plan.name] = compile_middleware(plan.middleware, partial(self.dispatch_scope, plan))
+        return chain
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        path = scope["path"]
+        match = self._resolve(scope["method"], path)
+        if match is None:
+            allowed = self._allowed_methods(path)
+            if allowed:
+                await send_body(send, 405, ERROR_BODIES[405], [(b"allow", ", ".join(allowed).encode())])
+            else:
+                await send_body(send, 404, ERROR_BODIES[404])
+            return
+
+        token = current_request.set(HttpRequest(scope, receive))
+        try:
+            plan, params = match
+            if plan.middleware:
+                scope["path_params"] = params
+                chain = self._chains.get(plan.name) or self.add_route(plan)
+                await chain(scope, receive, send)
+            else:
+                await self.dispatch(plan, params, scope, receive, send)
+        finally:
+            current_request.reset(token)
+
+    async def dispatch_scope(self, plan: DispatchPlan, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.dispatch(plan, scope.get("path_params", {}), scope, receive, send)
+
+    async def dispatch(self, plan: DispatchPlan, params: Dict[str, Any], scope: Scope, receive: Receive, send: Send) -> None:
+        if plan.authorize is not None:
+            values: Dict[str, Any] = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+            values.update(params)
+            try:
+                values = plan.build_kwargs(values, skip=ParamKind.BODY)
+            except ValueError as error:
+                await send_body(send, 422, error_body(str(error)))
+                return
+            try:
+                outcome = await plan.authorize(**values)
+            except HttpException as error:
+                await send_body(send, error.status_code, encode_error(error))
+                return
+            if outcome is not AUTHORIZED:
+                await self.respond(plan, outcome, receive, send)
+                return
+
+        try:
+            kwargs = plan.build_kwargs(await build_values(plan, scope, receive, params))
+        except ValueError as error:
+            await send_body(send, 422, error_body(str(error)))
+            return
+
+        token = authorized_route.set(plan.name) if plan.authorize is not None else None
+        try:
+            result = await call_endpoint(plan, kwargs)
+        except HttpException as error:
+            await send_body(send, error.status_code, encode_error(error))
+            return
+        finally:
+            if token is not None:
+                authorized_route.reset(token)
+        await self.respond(plan, result, receive, send)
+
+    async def respond(self, plan: DispatchPlan, result: Any, receive: Receive, send: Send) -> None:
+        status = plan.metadata.get("kwargs", {}).get("status_code", 200)
+        if isinstance(result, StreamResponse):
+            await send_stream(send, receive, status, result)
+        elif plan.encoder is not None:
+            content_type = JSON_CONTENT_TYPE if plan.media_type is None else plan.media_type.encode()
+            await send_body(send, status, plan.encoder(result), content_type=content_type)
+        else:
+            await send_json(send, status, result)
+
+    async def lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    if self._on_startup is not None:
+                        await self._on_startup()
+                except Exception as error:
+                    await send({"type": "lifespan.startup.failed", "message": repr(error)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                try:
+                    if self._on_shutdown is not None:
+                        await self._on_shutdown()
+                except Exception as error:
+                    await send({"type": "lifespan.shutdown.failed", "message": repr(error)})
+                    return
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -0,0 +1,121 @@
+import asyncio
+import contextvars
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Union
+from nest_py.core.constants import StreamMode
+from nest_py.core.router.encoding import encode_json
+from nest_py.core.structures import ServerSentEvent
+
+DONE = object()
+
+MEDIA_TYPES: Dict[str, str] = {
+    StreamMode.RAW: "application/octet-stream",
+    StreamMode.NDJSON: "application/x-ndjson",
+    StreamMode.SSE: "text/event-stream",
+}
+
+
+def encode_raw(item: Any) -> bytes:
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        return bytes(item)
+    if isinstance(item, str):
+        return item.encode()
+    return encode_json(item)
+
+
+def encode_ndjson(item: Any) -> bytes:
+    return encode_json(item) + b"\n"
+
+
+def encode_sse(item: Any) -> bytes:
+    if not isinstance(item, ServerSentEvent):
+        item = ServerSentEvent(item)
+
+    lines = []
+    if item.event is not None:
+        lines.append(f"event: {item.event}")
+    if item.id is not None:
+        lines.append(f"id: {item.id}")
+    if item.retry is not None:
+        lines.append(f"retry: {item.retry}")
+
+    data = item.data
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode()
+    elif not isinstance(data, str):
+        data = encode_json(data).decode()
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+ENCODERS: Dict[str, Callable[[Any], bytes]] = {
+    StreamMode.RAW: encode_raw,
+    StreamMode.NDJSON: encode_ndjson,
+    StreamMode.SSE: encode_sse,
+}
+
+
+class StreamResponse:
+    """
+    Chunked response returned by the endpoint of a generator handler.
+
+    Items are encoded one at a time (raw bytes/text, NDJSON lines or SSE
+    events) while the transport consumes them, so the full payload is never
+    held in memory. Sync generators are advanced in `executor` (the default
+    thread pool unless the route is offloaded elsewhere) or inline.
+    """
+
+    __slots__ = ("iterator", "mode", "media_type", "headers", "executor", "inline")
+
+    def __init__(
+            self,
+            iterator: Union[Iterator[Any], AsyncIterator[Any]],
+            mode: str = StreamMode.RAW,
+            media_type: Optional[str] = None,
+            executor: Optional[Executor] = None,
+            inline: bool = False
+    ) -> None:
+        if mode not in ENCODERS:
+            raise ValueError(f"Unknown stream mode '{mode}'")
+        self.iterator = iterator
+        self.mode = mode
+        self.media_type = media_type or MEDIA_TYPES[mode]
+        self.headers: Dict[str, str] = {}
+        if mode == StreamMode.SSE:
+            self.headers = {"cache-control": "no-cache", "x-accel-buffering": "no"}
+        self.executor = executor
+        self.inline = inline
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        encode = ENCODERS[self.mode]
+        iterator = self.iterator
+        try:
+            if hasattr(iterator, "__anext__"):
+                async for item in iterator:
+                    yield encode(item)
+            elif self.inline:
+                for item in iterator:
+                    yield encode(item)
+            else:
+                loop = asyncio.get_running_loop()
+                step = partial(contextvars.copy_context().run, next, iterator, DONE)
+                while True:
+                    item = await loop.run_in_executor(self.executor, step)
+                    if item is DONE:
+                        break
+                    yield encode(item)
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+            return
+        close = getattr(self.iterator, "close", None)
+        if close is not None:
+            try:
+                close()
+            except ValueError:
+                pass
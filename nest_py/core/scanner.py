@@ -0,0 +1,111 @@
+import importlib
+import sys
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+from nest_py.core.errors import NestPyError
+from nest_py.core.structures import ModuleReport
+
+IMPORT_SEPARATOR = ":"
+
+
+class ModuleScanner:
+    """
+    Walks the `@module` graph starting at the root module.
+
+    Entries in `@module(imports=[...])` are either names of registered modules
+    or import references such as `"app.users.users_module:UsersModule"`. In
+    lazy mode, references whose Python module has not been imported yet are
+    kept pending until `load_pending()` is called.
+    """
+
+    def __init__(self, ctx_app: Any) -> None:
+        self._ctx_app = ctx_app
+        self._reports: Dict[str, ModuleReport] = {}
+        self._pending: List[str] = []
+
+    def import_reference(self, reference: str) -> Tuple[str, Optional[float]]:
+        source, _, name = reference.partition(IMPORT_SEPARATOR)
+        seconds = None
+
+        if source not in sys.modules:
+            start = perf_counter()
+            importlib.import_module(source)
+            seconds = perf_counter() - start
+
+        if not self._ctx_app.get_module(name):
+            raise NestPyError(f"'{reference}' does not refer to a class decorated with @module()")
+        return name, seconds
+
+    def scan(self, root: str, lazy: bool = False, import_seconds: Optional[float] = None) -> List[str]:
+        """
+        Register every module reachable from `root` and return the newly scanned names.
+
+        Raises:
+            NestPyError: If an imported module is not registered.
+        """
+        scanned = []
+        stack = [(root, import_seconds)]
+
+        while stack:
+            name, seconds = stack.pop()
+            if name in self._reports:
+                continue
+
+            entry = self._ctx_app.get_module(name)
+            if not entry:
+                raise NestPyError(f"Module '{name}' is not registered, is it decorated with @module()?")
+            self._reports[name] = self._report(entry, seconds)
+            scanned.append(name)
+
+            for reference in entry["imports"] or []:
+                if IMPORT_SEPARATOR not in reference:
+                    stack.append((reference, None))
+                elif lazy and reference.partition(IMPORT_SEPARATOR)[0] not in sys.modules:
+                    self._pending.append(reference)
+                else:
+                    stack.append(self.import_reference(reference))
+
+        return scanned
+
+    def load_pending(self) -> List[str]:
+        scanned = []
+        pending, self._pending = self._pending, []
+        for reference in pending:
+            name, seconds = self.import_reference(reference)
+            scanned += self.scan(name, import_seconds=seconds)
+        return scanned
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def _report(self, entry: Dict[str, Any], import_seconds: Optional[float]) -> ModuleReport:
+        source = entry["module_class"].__module__
+        return ModuleReport(
+            name=entry["name"],
+            source=source,
+            import_seconds=import_seconds,
+            registration_seconds=self._ctx_app.get_registration_costs().get(source, 0.0),
+            controllers=len(entry["controllers"] or []),
+            providers=len(entry["providers"] or []),
+            loaded=True
+        )
+
+    def get_reports(self) -> List[ModuleReport]:
+        reports = list(self._reports.values())
+        for reference in self._pending:
+            source, _, name = reference.partition(IMPORT_SEPARATOR)
+            reports.append(ModuleReport(name, source, None, 0.0, 0, 0, False))
+        return reports
+
+    def format_report(self) -> str:
+        lines = [f"{'module':<28} {'source':<36} {'import ms':>10} {'register ms':>12} {'ctrl':>5} {'prov':>5}"]
+        for report in self.get_reports():
+            if not report.loaded:
+                lines.append(f"{report.name:<28} {report.source:<36} {'(lazy)':>10}")
+                continue
+            imported = "-" if report.import_seconds is None else f"{report.import_seconds * 1000:.2f}"
+            lines.append(
+                f"{report.name:<28} {report.source:<36} {imported:>10} "
+                f"{report.registration_seconds * 1000:>12.3f} {report.controllers:>5} {report.providers:>5}"
+            )
+        return "\n".join(lines)
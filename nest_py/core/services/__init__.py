@@ -0,0 +1,10 @@
+from nest_py.core.services.cron import CronExpression
+from nest_py.core.services.process_pool import ProcessPool
+from nest_py.core.services.scheduler import Scheduler
+
+
+__all__ = [
+    "CronExpression",
+    "ProcessPool",
+    "Scheduler",
+]
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+from typing import FrozenSet, Tuple
+
+MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+FIELDS: Tuple[Tuple[int, int], ...] = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+SEARCH_LIMIT = timedelta(days=366 * 5)
+
+
+def parse_field(field: str, low: int, high: int) -> FrozenSet[int]:
+    values = set()
+    for part in field.split(","):
+        expression, _, step = part.partition("/")
+        if expression == "*":
+            start, end = low, high
+        elif "-" in expression:
+            start, end = (int(bound) for bound in expression.split("-", 1))
+        else:
+            start = end = int(expression)
+            if step:
+                end = high
+        if not low <= start <= end <= high:
+            raise ValueError(f"Cron field '{field}' is outside {low}-{high}")
+        values.update(range(start, end + 1, int(step) if step else 1))
+    return frozenset(values)
+
+
+class CronExpression:
+    """
+    Five-field cron expression (minute hour day-of-month month day-of-week).
+
+    Fields accept `*`, numbers, ranges, lists and `/step`; Sunday is 0 or 7
+    and the `@hourly`-style macros are supported. As in cron, when both day
+    fields are restricted a day matching either one fires; a day field
+    starting with `*` (`*/2` included) does not count as restricted.
+    """
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        fields = MACROS.get(expression.strip(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression '{expression}' must have 5 fields")
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            parse_field(field, low, high) for field, (low, high) in zip(fields, FIELDS)
+        )
+        self.weekdays = frozenset(day % 7 for day in weekdays)
+        self._any_day = fields[2].startswith("*")
+        self._any_weekday = fields[4].startswith("*")
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first matching minute strictly after `moment`."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + SEARCH_LIMIT
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression '{self.expression}' never fires")
@@ -0,0 +1,222 @@
+import asyncio
+import importlib
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from inspect import unwrap
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Set, Tuple
+from nest_py.core.structures import SharedBuffer
+
+SHARE_THRESHOLD = 1 << 20
+BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+_in_worker = False
+
+
+def share(value: Any, threshold: int) -> Any:
+    """Move a large buffer into shared memory; the receiver unlinks it in `restore`."""
+    if not isinstance(value, BUFFER_TYPES):
+        return value
+    view = memoryview(value).cast("B")
+    if view.nbytes < threshold:
+        return value
+    memory = SharedMemory(create=True, size=view.nbytes)
+    try:
+        memory.buf[:view.nbytes] = view
+    finally:
+        memory.close()
+    resource_tracker.unregister(memory._name, "shared_memory")
+    return SharedBuffer(memory.name, view.nbytes)
+
+
+def restore(value: Any) -> Any:
+    if not isinstance(value, SharedBuffer):
+        return value
+    memory = SharedMemory(name=value.name)
+    try:
+        return bytes(memory.buf[:value.size])
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def discard(value: Any) -> None:
+    """Unlink a segment made by `share` in case its receiver never restored it."""
+    if not isinstance(value, SharedBuffer):
+        return
+    try:
+        memory = SharedMemory(name=value.name)
+    except FileNotFoundError:
+        return
+    memory.close()
+    try:
+        memory.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def discard_result(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        discard(future.result())
+
+
+def initialize(modules: Tuple[str, ...]) -> None:
+    from nest_py.core.nestpy_application_context import NestPyApplicationContext
+
+    global _in_worker
+    _in_worker = True
+    for module in modules:
+        importlib.import_module(module)
+    NestPyApplicationContext().get_injector().refresh()
+
+
+def resolve_class(module: str, qualname: str) -> Any:
+    target = sys.modules.get(module) or importlib.import_module(module)
+    for name in qualname.split("."):
+        target = getattr(target, name)
+    return target
+
+
+def run_call(
+        module: str,
+        qualname: str,
+        name: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        threshold: int
+) -> Any:
+    from nest_py.core.nestpy_application_context import NestPyApplicationContext
+
+    ctx_app = NestPyApplicationContext()
+    cls = resolve_class(module, qualname)
+    registered = cls.__name__ in ctx_app.get_injectables() or ctx_app.get_controller(cls.__name__)
+    instance = ctx_app.get_injector().get(cls.__name__) if registered else cls()
+    args = tuple(restore(value) for value in args)
+    kwargs = {key: restore(value) for key, value in kwargs.items()}
+    return share(unwrap(getattr(cls, name))(instance, *args, **kwargs), threshold)
+
+
+def noop() -> int:
+    return os.getpid()
+
+
+class ProcessPool:
+    """
+    Managed `ProcessPoolExecutor` behind `@offload(executor="process")`.
+
+    Offloaded methods are called on the worker's own instance of their
+    class, resolved through the worker's injector (singleton providers and
+    controllers only), so only the arguments and the result are pickled.
+    Workers import the modules declaring offloaded methods when they start,
+    and `start()` spawns all of them before traffic arrives; with the fork
+    start method they also inherit the provider graph built by the parent.
+    Buffers (bytes, bytearray, memoryview) of at least `share_threshold`
+    bytes, as top-level arguments or as the result, are passed through
+    shared memory instead of the executor's pipe. The receiver unlinks a
+    segment once it has read it; the caller also unlinks its argument
+    segments when the call ends, in case the worker failed or the call was
+    cancelled first, and unlinks the result of a cancelled call once the
+    worker returns it.
+
+    `pending` counts calls submitted and not finished; the queue depth is
+    what exceeds the number of workers.
+    """
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            mp_context: Any = None,
+            share_threshold: int = SHARE_THRESHOLD
+    ) -> None:
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._modules: Set[str] = set()
+        self.used = False
+        self.configure(max_workers, mp_context, share_threshold)
+        self.pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+
+    def configure(
+            self,
+            max_workers: Optional[int] = None,
+            mp_context: Any = None,
+            share_threshold: int = SHARE_THRESHOLD
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._mp_context = mp_context
+        self._share_threshold = share_threshold
+
+    def register(self, module: str) -> None:
+        self.used = True
+        if module != "__main__":
+            self._modules.add(module)
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self.pending - self.max_workers)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self.max_workers,
+                mp_context=self._mp_context,
+                initializer=initialize,
+                initargs=(tuple(sorted(self._modules)),)
+            )
+        return self._executor
+
+    async def start(self) -> None:
+        """Spawn and initialize every worker."""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(executor, noop) for _ in range(self.max_workers)))
+
+    async def call(self, instance: Any, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        cls = type(instance)
+        if _in_worker:
+            return unwrap(getattr(cls, name))(instance, *args, **kwargs)
+
+        threshold = self._share_threshold
+        shared_args = tuple(share(value, threshold) for value in args)
+        shared_kwargs = {key: share(value, threshold) for key, value in kwargs.items()}
+        future: Optional[Future] = None
+        self.submitted += 1
+        self.pending += 1
+        try:
+            future = self._get_executor().submit(
+                run_call, cls.__module__, cls.__qualname__, name, shared_args, shared_kwargs, threshold
+            )
+            result = await asyncio.wrap_future(future)
+        except BaseException:
+            self.failed += 1
+            if future is not None:
+                future.add_done_callback(discard_result)
+            raise
+        finally:
+            self.pending -= 1
+            for value in shared_args + tuple(shared_kwargs.values()):
+                discard(value)
+        self.completed += 1
+        return restore(result)
+
+    def collect(self) -> List[str]:
+        """Prometheus lines for `Metrics`."""
+        return [
+            "# TYPE nestpy_offload_pending gauge",
+            f'nestpy_offload_pending{{pool="process"}} {self.pending}',
+            "# TYPE nestpy_offload_queue_depth gauge",
+            f'nestpy_offload_queue_depth{{pool="process"}} {self.queue_depth}',
+            "# TYPE nestpy_offload_workers gauge",
+            f'nestpy_offload_workers{{pool="process"}} {self.max_workers}',
+            "# TYPE nestpy_offload_calls_total counter",
+            f'nestpy_offload_calls_total{{pool="process",outcome="completed"}} {self.completed}',
+            f'nestpy_offload_calls_total{{pool="process",outcome="failed"}} {self.failed}',
+        ]
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
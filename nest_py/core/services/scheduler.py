@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import os
+import random
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+from nest_py.core.constants import JobKind, MetadataKeys, OffloadPolicy
+from nest_py.core.reflect import Reflect, IS_COROUTINE_FUNC
+from nest_py.core.services.cron import CronExpression
+from nest_py.core.structures import ScheduledJob
+from nest_py.core.supervisor import PRIMARY_WORKER_ENV
+
+logger = logging.getLogger("nest_py.scheduler")
+
+Job = Tuple[Any, str, ScheduledJob]
+
+
+class Scheduler:
+    """
+    Runs the `@interval`, `@timeout` and `@cron` methods of singleton providers
+    and controllers.
+
+    `start()` is called by `NestPyApplication.startup()` once the startup
+    hooks have run, and `stop()` by `close()` before the shutdown hooks, which
+    cancels pending ticks and the jobs still running. Ticks follow a fixed
+    rate: a tick is not delayed by the previous run, it is skipped while that
+    run is still going unless the job allows `overlap`. Jobs sharing a
+    `group` run at most `set_group_limit(group, n)` at a time.
+
+    Async methods run on the event loop; sync methods run in the default
+    thread pool, inline with `executor="inline"`, or in the `ProcessPool`
+    with `executor="process"`. Failures are logged on `nest_py.scheduler`
+    and do not stop the job. Under `WorkerSupervisor`, only the primary
+    worker of each generation runs jobs.
+    """
+
+    def __init__(self, ctx_app: Any) -> None:
+        self._ctx_app = ctx_app
+        self._limits: Dict[str, int] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._loops: List[asyncio.Task] = []
+        self._runs: Set[asyncio.Task] = set()
+        self._active: Dict[Tuple[int, str], int] = {}
+        self.skipped = 0
+        self.failed = 0
+
+    def set_group_limit(self, group: str, max_concurrency: int) -> "Scheduler":
+        if max_concurrency < 1:
+            raise ValueError("A job group needs a limit of at least 1")
+        self._limits[group] = max_concurrency
+        self._semaphores.pop(group, None)
+        return self
+
+    @property
+    def running(self) -> bool:
+        return bool(self._loops)
+
+    def jobs(self) -> List[Job]:
+        """Return `(instance, method name, job)` for every scheduled method instantiated so far."""
+        injector = self._ctx_app.get_injector()
+        instances = injector.get_instances()
+        jobs = []
+        for name in injector.get_order():
+            instance = instances.get(name)
+            if instance is None:
+                continue
+            for attr, function in Reflect.getFunctions(type(instance)):
+                for job in Reflect.getMetadata(MetadataKeys.SCHEDULE_METADATA, function) or ():
+                    jobs.append((instance, attr, job))
+        return jobs
+
+    def start(self) -> int:
+        """Schedule every job on the running loop and return how many were started."""
+        if self._loops or os.environ.get(PRIMARY_WORKER_ENV, "1") != "1":
+            return 0
+        self._loops = [asyncio.ensure_future(self._schedule(*job)) for job in self.jobs()]
+        return len(self._loops)
+
+    async def stop(self) -> None:
+        tasks = self._loops + list(self._runs)
+        self._loops = []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _semaphore(self, group: Optional[str]) -> Optional[asyncio.Semaphore]:
+        if group is None or group not in self._limits:
+            return None
+        semaphore = self._semaphores.get(group)
+        if semaphore is None:
+            semaphore = self._semaphores[group] = asyncio.Semaphore(self._limits[group])
+        return semaphore
+
+    async def _schedule(self, instance: Any, name: str, job: ScheduledJob) -> None:
+        expression = CronExpression(job.cron) if job.kind == JobKind.CRON else None
+        while True:
+            if expression is not None:
+                now = datetime.now()
+                try:
+                    delay = (expression.next_after(now) - now).total_seconds()
+                except ValueError:
+                    logger.exception("Stopped %s.%s", type(instance).__name__, name)
+                    return
+            else:
+                delay = job.every
+            if job.jitter:
+                delay += random.uniform(0, job.jitter)
+            await asyncio.sleep(delay)
+            self._launch(instance, name, job)
+            if job.kind == JobKind.TIMEOUT:
+                return
+
+    def _launch(self, instance: Any, name: str, job: ScheduledJob) -> None:
+        key = (id(instance), name)
+        if key in self._active and not job.overlap:
+            self.skipped += 1
+            logger.debug("Skipped %s.%s: the previous run has not finished", type(instance).__name__, name)
+            return
+        self._active[key] = self._active.get(key, 0) + 1
+        task = asyncio.ensure_future(self._run(instance, name, job))
+        self._runs.add(task)
+        task.add_done_callback(lambda _: self._finish(task, key))
+
+    def _finish(self, task: asyncio.Task, key: Tuple[int, str]) -> None:
+        self._runs.discard(task)
+        if self._active[key] == 1:
+            del self._active[key]
+        else:
+            self._active[key] -= 1
+
+    async def _run(self, instance: Any, name: str, job: ScheduledJob) -> None:
+        try:
+            semaphore = self._semaphore(job.group)
+            if semaphore is None:
+                await self._execute(instance, name, job)
+            else:
+                async with semaphore:
+                    await self._execute(instance, name, job)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failed += 1
+            logger.exception("Scheduled job %s.%s failed", type(instance).__name__, name)
+
+    async def _execute(self, instance: Any, name: str, job: ScheduledJob) -> Any:
+        if job.policy == OffloadPolicy.PROCESS:
+            return await self._ctx_app.get_process_pool().call(instance, name, (), {})
+        method = getattr(instance, name)
+        if IS_COROUTINE_FUNC(method):
+            return await method()
+        if job.policy == OffloadPolicy.INLINE:
+            return method()
+        return await asyncio.get_running_loop().run_in_executor(None, method)
@@ -1,6 +1,128 @@
-from typing import NamedTuple, Callable, Any, Dict
+from inspect import Signature
+from typing import NamedTuple, Callable, Any, Dict, Mapping, Optional, Tuple, Type
 
 
 class RouteDefinition(NamedTuple):
     handler: Callable[..., Any]
     metadata: Dict[str, Any]
+
+
+class ParameterPlan(NamedTuple):
+    name: str
+    kind: str
+    annotation: Any
+    default: Any
+    required: bool
+    converter: Optional[Callable[[Any], Any]]
+    pipes: Tuple[Any, ...] = ()
+
+
+class ArgumentMetadata(NamedTuple):
+    kind: str
+    annotation: Any
+    name: str
+
+
+class DispatchPlan(NamedTuple):
+    name: str
+    controller_class: Type[Any]
+    handler: Callable[..., Any]
+    method: Callable[..., Any]
+    path: str
+    methods: Tuple[str, ...]
+    metadata: Dict[str, Any]
+    parameters: Tuple[ParameterPlan, ...]
+    signature: Signature
+    is_async: bool
+    endpoint: Callable[..., Any]
+    is_stream: bool = False
+    encoder: Optional[Callable[[Any], bytes]] = None
+    middleware: Tuple[Any, ...] = ()
+    media_type: Optional[str] = None
+    authorize: Optional[Callable[..., Any]] = None
+
+    def build_kwargs(self, values: Mapping[str, Any], skip: Optional[str] = None) -> Dict[str, Any]:
+        kwargs = {}
+        for param in self.parameters:
+            if param.kind == skip:
+                continue
+            if param.name in values:
+                value = values[param.name]
+                if param.converter is not None and isinstance(value, str):
+                    value = param.converter(value)
+                kwargs[param.name] = value
+            elif param.required:
+                raise ValueError(f"Missing required parameter '{param.name}'")
+            else:
+                kwargs[param.name] = param.default
+        return kwargs
+
+
+class ProviderPlan(NamedTuple):
+    name: str
+    provider_class: Type[Any]
+    deps: Tuple[Tuple[str, str], ...]
+    scope: str
+    pool_size: int
+
+
+class HookNode(NamedTuple):
+    name: str
+    instance: Any
+    deps: Tuple[str, ...]
+
+
+class DiscoveredRoute(NamedTuple):
+    handler: str
+    methods: Tuple[str, ...]
+    path: str
+    lineno: int
+
+
+class DiscoveredClass(NamedTuple):
+    kind: str
+    name: str
+    module: str
+    lineno: int
+    prefix: str = ""
+    routes: Tuple[DiscoveredRoute, ...] = ()
+    imports: Tuple[str, ...] = ()
+    controllers: Tuple[str, ...] = ()
+    providers: Tuple[str, ...] = ()
+    sources: Tuple[str, ...] = ()
+
+    @property
+    def key(self) -> str:
+        return f"{self.module}:{self.name}"
+
+
+class ScheduledJob(NamedTuple):
+    kind: str
+    every: float = 0.0
+    cron: Optional[str] = None
+    jitter: float = 0.0
+    overlap: bool = False
+    group: Optional[str] = None
+    policy: Optional[str] = None
+
+
+class SharedBuffer(NamedTuple):
+    name: str
+    size: int
+
+
+class ModuleReport(NamedTuple):
+    name: str
+    source: str
+    import_seconds: Optional[float]
+    registration_seconds: float
+    controllers: int
+    providers: int
+    loaded: bool
+
+
+class ServerSentEvent(NamedTuple):
+    data: Any
+    event: Optional[str] = None
+    id: Optional[str] = None
+    retry: Optional[int] = None
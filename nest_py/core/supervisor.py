@@ -0,0 +1,330 @@
+import gc
+import logging
+import os
+import random
+import signal
+import socket
+import struct
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from nest_py.core.errors import NestPyError
+
+POLL_INTERVAL = 0.2
+EARLY_EXIT_SECONDS = 5.0
+MAX_RESPAWN_DELAY = 30.0
+SUPERVISOR_OPTIONS = ("max_requests", "max_requests_jitter", "graceful_timeout", "reuse_port", "app_factory")
+READY_MESSAGE = struct.Struct("=i")
+
+logger = logging.getLogger("nest_py.supervisor")
+PRIMARY_WORKER_ENV = "NESTPY_PRIMARY_WORKER"
+
+
+def create_socket(host: str, port: int, reuse_port: bool = False, backlog: int = 2048) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        if not hasattr(socket, "SO_REUSEPORT"):
+            raise NestPyError("SO_REUSEPORT is not supported on this platform")
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class WorkerSupervisor:
+    """
+    Pre-fork master process running `workers` uvicorn workers.
+
+    The application (controllers, providers and compiled routes) is built in
+    the master before forking and the heap is moved to the permanent GC
+    generation, so workers share those pages copy-on-write. Workers either
+    inherit one listening socket, or bind their own with SO_REUSEPORT and let
+    the kernel balance connections.
+
+    Signals handled by the master:
+        SIGTERM/SIGINT: stop accepting, let workers drain in-flight requests
+            for up to `graceful_timeout` seconds, then kill stragglers.
+        SIGHUP: start a new generation of workers (rebuilding the application
+            with `app_factory` when given) and gracefully stop the old one
+            once every new worker has finished its startup and is serving,
+            so the socket never stops accepting. If the new workers are not
+            all up within `graceful_timeout` seconds, they are stopped and
+            the old generation keeps serving.
+        SIGTTIN/SIGTTOU: add or remove one worker (never the primary one).
+
+    Reloads and stopping workers never block the master: it keeps reaping
+    and respawning while stopped workers drain, and kills them once
+    `graceful_timeout` has passed.
+
+    Workers exit by themselves after `max_requests` (plus a random jitter so
+    they do not all recycle at once) and are replaced by the master. A
+    worker failing within `EARLY_EXIT_SECONDS` of being forked has its
+    traceback logged, and respawns are delayed exponentially (up to
+    `MAX_RESPAWN_DELAY` seconds) until a worker stays up.
+
+    One worker is the primary one (`NESTPY_PRIMARY_WORKER` is "1" in its
+    environment, "0" in the others) and is the only one running the
+    scheduled jobs; when it exits, its replacement takes over. A new
+    generation starts without a primary: once the old primary has exited, a
+    fresh primary worker is forked and one non-primary worker is retired, so
+    jobs never run in two generations at once.
+    """
+
+    def __init__(
+            self,
+            app: Any,
+            host: str,
+            port: Union[str, int],
+            workers: int,
+            max_requests: Optional[int] = None,
+            max_requests_jitter: int = 0,
+            graceful_timeout: float = 30.0,
+            reuse_port: bool = False,
+            app_factory: Optional[Callable[[], Any]] = None,
+            **server_options: Any
+    ) -> None:
+        if not hasattr(os, "fork"):
+            raise NestPyError("Multi-process mode requires os.fork (POSIX only)")
+        self._app = app
+        self._host = host
+        self._port = int(port)
+        self._workers = workers
+        self._max_requests = max_requests
+        self._max_requests_jitter = max_requests_jitter
+        self._graceful_timeout = graceful_timeout
+        self._reuse_port = reuse_port
+        self._app_factory = app_factory
+        self._server_options = server_options
+        self._socket: Optional[socket.socket] = None
+        self._children: Dict[int, int] = {}
+        self._generation = 0
+        self._spawned: Dict[int, float] = {}
+        self._ready: Set[int] = set()
+        self._ready_pipe: Optional[int] = None
+        self._ready_notify: Optional[int] = None
+        self._failures = 0
+        self._respawn_at = 0.0
+        self._primary: Optional[int] = None
+        self._draining: Dict[int, float] = {}
+        self._reloading: Optional[Tuple[float, List[int], List[int], Tuple[Any, int]]] = None
+        self._signals: List[int] = []
+        self._running = False
+
+    def run(self) -> None:
+        if not self._reuse_port:
+            self._socket = create_socket(self._host, self._port)
+        self._ready_pipe, self._ready_notify = os.pipe()
+        os.set_blocking(self._ready_pipe, False)
+
+        self._install_signals()
+        self._running = True
+        self._spawn_generation()
+
+        try:
+            while self._running:
+                self._reap()
+                self._read_ready()
+                self._handle_signals()
+                if self._running:
+                    self._check_reload()
+                    self._check_draining()
+                    self._maintain()
+                    time.sleep(POLL_INTERVAL)
+        finally:
+            self._stop_workers(list(self._children))
+            if self._socket is not None:
+                self._socket.close()
+            os.close(self._ready_pipe)
+            os.close(self._ready_notify)
+
+    def _install_signals(self) -> None:
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGTTIN, signal.SIGTTOU):
+            signal.signal(sig, lambda signum, _: self._signals.append(signum))
+
+    def _handle_signals(self) -> None:
+        while self._signals:
+            sig = self._signals.pop(0)
+            if sig in (signal.SIGTERM, signal.SIGINT):
+                self._running = False
+            elif sig == signal.SIGHUP:
+                self._reload()
+            elif sig == signal.SIGTTIN:
+                self._workers += 1
+            elif sig == signal.SIGTTOU and self._workers > 1:
+                self._workers -= 1
+                self._drain_workers([pid for pid in self._current() if pid != self._primary][:1])
+
+    def _reload(self) -> None:
+        if self._reloading is not None:
+            logger.warning("Ignoring SIGHUP, the previous reload has not finished")
+            return
+        previous = (self._app, self._generation)
+        if self._app_factory is not None:
+            self._app = self._app_factory()
+        old = [pid for pid in self._children if pid not in self._draining]
+        self._spawn_generation()
+        self._reloading = (time.monotonic() + self._graceful_timeout, old, self._current(), previous)
+
+    def _check_reload(self) -> None:
+        if self._reloading is None:
+            return
+        deadline, old, new, previous = self._reloading
+        if all(pid in self._ready for pid in new):
+            self._reloading = None
+            self._drain_workers(old)
+        elif any(pid not in self._children for pid in new) or time.monotonic() >= deadline:
+            logger.error("New workers did not start within %ss, keeping the previous generation", self._graceful_timeout)
+            self._reloading = None
+            self._drain_workers(self._current())
+            self._app, self._generation = previous
+
+    def _current(self) -> List[int]:
+        return [
+            pid for pid, generation in self._children.items()
+            if generation == self._generation and pid not in self._draining
+        ]
+
+    def _read_ready(self) -> None:
+        try:
+            data = os.read(self._ready_pipe, READY_MESSAGE.size * 64)
+        except BlockingIOError:
+            return
+        for (pid,) in READY_MESSAGE.iter_unpack(data):
+            if pid in self._children:
+                self._ready.add(pid)
+
+    def _spawn_generation(self) -> None:
+        self._generation += 1
+        gc.collect()
+        gc.freeze()
+        for _ in range(self._workers):
+            self._spawn()
+
+    def _maintain(self) -> None:
+        if time.monotonic() < self._respawn_at:
+            return
+        current = self._current()
+        if self._primary not in self._children and len(current) >= self._workers and self._reloading is None:
+            self._spawn()
+            self._drain_workers(current[:1])
+            return
+        for _ in range(self._workers - len(current)):
+            self._spawn()
+
+    def _spawn(self) -> None:
+        primary = self._primary not in self._children
+        pid = os.fork()
+        if pid:
+            self._children[pid] = self._generation
+            self._spawned[pid] = time.monotonic()
+            if primary:
+                self._primary = pid
+            return
+
+        os.environ[PRIMARY_WORKER_ENV] = "1" if primary else "0"
+
+        code = 0
+        try:
+            self._run_worker()
+        except BaseException:
+            logger.exception("Worker %d failed", os.getpid())
+            code = 1
+        finally:
+            logging.shutdown()
+            os._exit(code)
+
+    def _run_worker(self) -> None:
+        import uvicorn
+
+        for sig in (signal.SIGHUP, signal.SIGTTIN, signal.SIGTTOU):
+            signal.signal(sig, signal.SIG_IGN)
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, signal.SIG_DFL)
+
+        sock = self._socket or create_socket(self._host, self._port, reuse_port=True)
+        limit = None
+        if self._max_requests:
+            limit = self._max_requests + random.randint(0, self._max_requests_jitter)
+
+        config = uvicorn.Config(
+            self._app,
+            limit_max_requests=limit,
+            timeout_graceful_shutdown=self._graceful_timeout,
+            **self._server_options
+        )
+        notify = self._ready_notify
+
+        class Server(uvicorn.Server):
+            async def startup(self, sockets: Optional[List[socket.socket]] = None) -> None:
+                await super().startup(sockets=sockets)
+                if self.started:
+                    os.write(notify, READY_MESSAGE.pack(os.getpid()))
+
+        Server(config).run(sockets=[sock])
+
+    def _reap(self) -> None:
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                return
+            if pid == 0:
+                return
+            self._children.pop(pid, None)
+            self._ready.discard(pid)
+            uptime = time.monotonic() - self._spawned.pop(pid, 0.0)
+            if self._draining.pop(pid, None) is not None:
+                continue
+            if os.waitstatus_to_exitcode(status) != 0 and uptime < EARLY_EXIT_SECONDS and self._running:
+                self._failures += 1
+                delay = min(MAX_RESPAWN_DELAY, POLL_INTERVAL * 2 ** self._failures)
+                self._respawn_at = time.monotonic() + delay
+                logger.warning("Worker %d exited after %.1fs, respawning in %.1fs", pid, uptime, delay)
+            elif uptime >= EARLY_EXIT_SECONDS:
+                self._failures = 0
+
+    def _drain_workers(self, pids: List[int]) -> None:
+        deadline = time.monotonic() + self._graceful_timeout
+        for pid in pids:
+            self._draining[pid] = deadline
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _check_draining(self) -> None:
+        now = time.monotonic()
+        for pid, deadline in list(self._draining.items()):
+            if now >= deadline:
+                logger.warning("Worker %d did not exit within %ss, killing it", pid, self._graceful_timeout)
+                self._draining[pid] = float("inf")
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+    def _stop_workers(self, pids: List[int]) -> None:
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        deadline = time.monotonic() + self._graceful_timeout
+        while any(pid in self._children for pid in pids) and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(POLL_INTERVAL / 4)
+
+        for pid in pids:
+            if pid in self._children:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                    os.waitpid(pid, 0)
+                except (ProcessLookupError, ChildProcessError):
+                    pass
+                self._children.pop(pid, None)
+                self._spawned.pop(pid, None)
+                self._ready.discard(pid)
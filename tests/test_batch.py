@@ -0,0 +1,109 @@
+import asyncio
+import json
+import unittest
+from typing import Dict
+from nest_py.core.exceptions import BadRequestException, NotFoundException, PayloadTooLargeException
+from nest_py.core.router import RadixRouter, compile_route
+from nest_py.core.router.batch import BatchDispatcher
+from nest_py.core.structures import RouteDefinition
+
+
+class ItemsController:
+    def __init__(self):
+        self.events = []
+        self.items = {1: "one"}
+
+    async def find(self, id: int):
+        self.events.append(("start", id))
+        await asyncio.sleep(0.01)
+        self.events.append(("end", id))
+        if id not in self.items:
+            raise NotFoundException(f"Item {id} not found")
+        return {"id": id, "name": self.items[id]}
+
+    async def create(self, item: Dict[str, str]):
+        self.events.append(("create", item["name"]))
+        self.items[len(self.items) + 1] = item["name"]
+        return {"id": len(self.items)}
+
+    async def crash(self):
+        raise RuntimeError("boom")
+
+
+def build(controller, **middleware):
+    router = RadixRouter()
+    for method, path, name in (
+        ("GET", "/items/{id}", "find"),
+        ("POST", "/items", "create"),
+        ("GET", "/crash", "crash"),
+    ):
+        route = RouteDefinition(handler=getattr(ItemsController, name), metadata={"args": (path,), "kwargs": {"methods": [method]}})
+        plan = compile_route(ItemsController, getattr(controller, name), route)
+        router.add(plan._replace(middleware=middleware.get(name, ())))
+    return BatchDispatcher(router.match, max_concurrency=4, max_requests=6)
+
+
+async def dispatch(batch, requests):
+    return json.loads(await batch.dispatch(requests))
+
+
+class BatchDispatcherTest(unittest.IsolatedAsyncioTestCase):
+    async def test_answers_in_request_order(self):
+        batch = build(ItemsController())
+        results = await dispatch(batch, [
+            {"path": "/items/1"},
+            {"method": "POST", "path": "/items", "body": {"name": "two"}},
+            {"path": "/items/2?verbose=1"},
+        ])
+        self.assertEqual(results, [
+            {"status": 200, "body": {"id": 1, "name": "one"}},
+            {"status": 200, "body": {"id": 2}},
+            {"status": 200, "body": {"id": 2, "name": "two"}},
+        ])
+
+    async def test_reads_run_concurrently_and_writes_alone(self):
+        controller = ItemsController()
+        await build(controller).dispatch([
+            {"path": "/items/1"},
+            {"path": "/items/1"},
+            {"method": "POST", "path": "/items", "body": {"name": "two"}},
+            {"path": "/items/2"},
+        ])
+        self.assertEqual(controller.events, [
+            ("start", 1), ("start", 1), ("end", 1), ("end", 1),
+            ("create", "two"),
+            ("start", 2), ("end", 2),
+        ])
+
+    async def test_groups_consecutive_safe_requests(self):
+        requests = [{"method": "GET"}, {"method": "head"}, {"method": "POST"}, {}, "bad", {"method": "OPTIONS"}]
+        self.assertEqual(BatchDispatcher.stages(requests), [[0, 1], [2], [3], [4], [5]])
+
+    async def test_reports_failures_per_entry(self):
+        batch = build(ItemsController(), find=(object(),))
+        with self.assertLogs("nest_py.batch", "ERROR"):
+            results = await dispatch(batch, [
+                {"path": "/missing"},
+                {"method": "POST", "path": "/items"},
+                {"path": "/crash"},
+                {"path": "/_batch"},
+                {"method": "GET"},
+                {"path": "/items/1"},
+            ])
+        self.assertEqual([result["status"] for result in results], [404, 422, 500, 400, 400, 403])
+
+    async def test_http_exceptions_keep_their_status(self):
+        results = await dispatch(build(ItemsController()), [{"path": "/items/9"}, {"path": "/items/1"}])
+        self.assertEqual([result["status"] for result in results], [404, 200])
+        self.assertEqual(results[0]["body"], {"detail": "Item 9 not found"})
+
+    async def test_validates_the_batch(self):
+        batch = build(ItemsController())
+        with self.assertRaises(BadRequestException):
+            await batch.dispatch({"path": "/items/1"})
+        with self.assertRaises(PayloadTooLargeException):
+            await batch.dispatch([{"path": "/items/1"}] * 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
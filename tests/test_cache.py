@@ -0,0 +1,121 @@
+import asyncio
+import unittest
+from unittest import mock
+from nest_py.core.execution_context import ExecutionContext
+from nest_py.core.interceptors import CacheInterceptor, MemoryCache, SharedCache
+from nest_py.core.router import compile_route
+from nest_py.core.structures import RouteDefinition
+
+
+class ItemsController:
+
+    def find(self, id: int):
+        return id
+
+
+def context(method="GET", **kwargs):
+    route = RouteDefinition(handler=ItemsController.find, metadata={"args": ("/items/{id}",), "kwargs": {"methods": [method]}})
+    plan = compile_route(ItemsController, ItemsController().find, route)
+    return ExecutionContext(plan, {"id": 1, **kwargs})
+
+
+class Handler:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+class CacheInterceptorTest(unittest.IsolatedAsyncioTestCase):
+    async def test_caches_results_per_arguments(self):
+        cache, handler = CacheInterceptor(), Handler("one", "two")
+        handler.release.set()
+        self.assertEqual(await cache.intercept(context(id=1), handler), "one")
+        self.assertEqual(await cache.intercept(context(id=1), handler), "one")
+        self.assertEqual(await cache.intercept(context(id=2), handler), "two")
+        self.assertEqual(handler.calls, 2)
+
+    async def test_only_caches_get_and_head_routes(self):
+        cache, handler = CacheInterceptor(), Handler("one", "two")
+        handler.release.set()
+        await cache.intercept(context("POST"), handler)
+        self.assertEqual(await cache.intercept(context("POST"), handler), "two")
+
+    async def test_coalesces_concurrent_misses(self):
+        cache, handler = CacheInterceptor(), Handler("value")
+        calls = [asyncio.ensure_future(cache.intercept(context(), handler)) for _ in range(5)]
+        await asyncio.sleep(0)
+        handler.release.set()
+        self.assertEqual(await asyncio.gather(*calls), ["value"] * 5)
+        self.assertEqual(handler.calls, 1)
+
+    async def test_entries_expire_after_their_ttl(self):
+        cache, handler = CacheInterceptor(ttl=10), Handler("old", "new")
+        handler.release.set()
+        with mock.patch("time.monotonic", return_value=100.0):
+            self.assertEqual(await cache.intercept(context(), handler), "old")
+        with mock.patch("time.monotonic", return_value=109.0):
+            self.assertEqual(await cache.intercept(context(), handler), "old")
+        with mock.patch("time.monotonic", return_value=110.0):
+            self.assertEqual(await cache.intercept(context(), handler), "new")
+
+    async def test_waiters_take_over_a_cancelled_call(self):
+        cache, handler = CacheInterceptor(), Handler("value")
+        leader = asyncio.ensure_future(cache.intercept(context(), handler))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(cache.intercept(context(), handler))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        handler.release.set()
+        self.assertEqual(await follower, "value")
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(handler.calls, 2)
+
+    async def test_waiters_retry_after_a_failed_call(self):
+        cache, handler = CacheInterceptor(), Handler(RuntimeError("boom"), "value")
+        calls = [asyncio.ensure_future(cache.intercept(context(), handler)) for _ in range(3)]
+        await asyncio.sleep(0)
+        handler.release.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        self.assertIsInstance(results[0], RuntimeError)
+        self.assertEqual(results[1:], ["value", "value"])
+        self.assertEqual(handler.calls, 2)
+
+    async def test_invalidate(self):
+        cache, handler = CacheInterceptor(), Handler("one", "two")
+        handler.release.set()
+        await cache.intercept(context(), handler)
+        await cache.invalidate()
+        self.assertEqual(await cache.intercept(context(), handler), "two")
+
+
+class BackendTest(unittest.IsolatedAsyncioTestCase):
+    async def test_memory_cache_evicts_the_least_recently_used(self):
+        cache = MemoryCache(max_size=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(await cache.get("a"), 1)
+        self.assertIsNot(await cache.get("b"), 2)
+
+    async def test_shared_cache_returns_copies(self):
+        cache, value = SharedCache(), {"items": [1]}
+        await cache.set("key", value)
+        copy = await cache.get("key")
+        self.assertEqual(copy, value)
+        self.assertIsNot(copy, value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from datetime import datetime
+from nest_py.core.services.cron import CronExpression
+
+
+def next_after(expression: str, *moment: int) -> datetime:
+    return CronExpression(expression).next_after(datetime(*moment))
+
+
+class CronExpressionTest(unittest.TestCase):
+    def test_next_minute_is_strictly_after(self):
+        self.assertEqual(next_after("30 9 * * *", 2026, 10, 16, 9, 30), datetime(2026, 10, 17, 9, 30))
+        self.assertEqual(next_after("* * * * *", 2026, 10, 16, 9, 30, 59), datetime(2026, 10, 16, 9, 31))
+
+    def test_steps_ranges_and_lists(self):
+        self.assertEqual(next_after("*/15 * * * *", 2026, 10, 16, 10, 7), datetime(2026, 10, 16, 10, 15))
+        self.assertEqual(next_after("5/20 * * * *", 2026, 10, 16, 10, 26), datetime(2026, 10, 16, 10, 45))
+        self.assertEqual(next_after("0 9-17/4 * * *", 2026, 10, 16, 13, 0), datetime(2026, 10, 16, 17, 0))
+        self.assertEqual(next_after("0 8,20 * * *", 2026, 10, 16, 21, 0), datetime(2026, 10, 17, 8, 0))
+
+    def test_month_rollover(self):
+        self.assertEqual(next_after("30 9 1 * *", 2026, 1, 31, 10, 0), datetime(2026, 2, 1, 9, 30))
+        self.assertEqual(next_after("0 0 31 * *", 2026, 4, 1, 0, 0), datetime(2026, 5, 31, 0, 0))
+
+    def test_year_rollover(self):
+        self.assertEqual(next_after("* * * * *", 2026, 12, 31, 23, 59), datetime(2027, 1, 1, 0, 0))
+        self.assertEqual(next_after("0 0 1 1 *", 2026, 6, 1, 0, 0), datetime(2027, 1, 1, 0, 0))
+        self.assertEqual(next_after("0 0 29 2 *", 2026, 3, 1, 0, 0), datetime(2028, 2, 29, 0, 0))
+
+    def test_weekdays(self):
+        # 2026-10-16 is a Friday; Sunday is both 0 and 7.
+        self.assertEqual(next_after("30 9 * * 1-5", 2026, 10, 16, 10, 0), datetime(2026, 10, 19, 9, 30))
+        self.assertEqual(next_after("0 0 * * 0", 2026, 10, 16, 0, 0), datetime(2026, 10, 18, 0, 0))
+        self.assertEqual(next_after("0 0 * * 7", 2026, 10, 16, 0, 0), datetime(2026, 10, 18, 0, 0))
+
+    def test_restricted_day_fields_match_either(self):
+        # The 13th or any Friday: Friday the 23rd comes before Friday the 13th of November.
+        self.assertEqual(next_after("0 0 13 * 5", 2026, 10, 16, 0, 0), datetime(2026, 10, 23, 0, 0))
+        # The 1st or any Monday: Sunday November 1st comes before Monday the 2nd.
+        self.assertEqual(next_after("0 0 1 * 1", 2026, 10, 27, 0, 0), datetime(2026, 11, 1, 0, 0))
+
+    def test_wildcard_day_field_requires_the_other(self):
+        self.assertEqual(next_after("0 0 * 11 1", 2026, 10, 16, 0, 0), datetime(2026, 11, 2, 0, 0))
+        self.assertEqual(next_after("0 0 13 * *", 2026, 10, 16, 0, 0), datetime(2026, 11, 13, 0, 0))
+
+    def test_stepped_wildcard_day_field_requires_the_other(self):
+        # Vixie cron treats "*/2" as unrestricted: only the odd days that are Mondays fire,
+        # and only the 1sts falling on a Sunday, Wednesday or Saturday.
+        self.assertEqual(next_after("0 0 */2 * 1", 2026, 10, 16, 0, 0), datetime(2026, 10, 19, 0, 0))
+        self.assertEqual(next_after("0 0 1 * */3", 2026, 10, 16, 0, 0), datetime(2026, 11, 1, 0, 0))
+
+    def test_macros(self):
+        self.assertEqual(next_after("@daily", 2026, 10, 16, 9, 0), datetime(2026, 10, 17, 0, 0))
+        self.assertEqual(next_after("@hourly", 2026, 10, 16, 9, 0), datetime(2026, 10, 16, 10, 0))
+        self.assertEqual(next_after("@weekly", 2026, 10, 16, 9, 0), datetime(2026, 10, 18, 0, 0))
+
+    def test_invalid_expressions(self):
+        for expression in ("* * * *", "60 * * * *", "* 24 * * *", "* * 0 * *", "* * * 13 *", "5-1 * * * *"):
+            with self.subTest(expression=expression):
+                self.assertRaises(ValueError, CronExpression, expression)
+
+    def test_expression_never_firing(self):
+        self.assertRaises(ValueError, next_after, "0 0 31 2 *", 2026, 1, 1, 0, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
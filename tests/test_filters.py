@@ -0,0 +1,80 @@
+import unittest
+from nest_py.common import catch
+from nest_py.core.exceptions import ExceptionFilter, HttpException, NotFoundException, compile_filters
+
+
+class Named(ExceptionFilter):
+    def __init__(self, name):
+        self.name = name
+
+    def catch(self, exception, context):
+        return self.name
+
+
+@catch(KeyError)
+class KeyErrors(Named):
+    pass
+
+
+@catch(LookupError, ValueError)
+class Lookups(Named):
+    pass
+
+
+class Everything(Named):
+    pass
+
+
+class Translate(ExceptionFilter):
+    async def catch(self, exception, context):
+        return NotFoundException(str(exception))
+
+
+class MissingKey(KeyError):
+    pass
+
+
+async def handled(handle, exception):
+    return await handle(exception, None)
+
+
+class CompileFiltersTest(unittest.IsolatedAsyncioTestCase):
+    async def test_no_filters_compile_to_nothing(self):
+        self.assertIsNone(compile_filters(()))
+
+    async def test_first_matching_filter_wins(self):
+        handle = compile_filters((Lookups("handler"), KeyErrors("controller"), Everything("global")))
+        self.assertEqual(await handled(handle, KeyError("a")), "handler")
+        self.assertEqual(await handled(handle, IndexError()), "handler")
+        self.assertEqual(await handled(handle, ValueError()), "handler")
+        self.assertEqual(await handled(handle, RuntimeError()), "global")
+
+    async def test_subclasses_follow_the_same_priority(self):
+        handle = compile_filters((Everything("handler"), KeyErrors("controller")))
+        for _ in range(2):
+            self.assertEqual(await handled(handle, KeyError("a")), "handler")
+            self.assertEqual(await handled(handle, MissingKey("a")), "handler")
+
+    async def test_specific_filters_declared_first_take_precedence(self):
+        handle = compile_filters((KeyErrors("handler"), Lookups("controller")))
+        self.assertEqual(await handled(handle, MissingKey("a")), "handler")
+        self.assertEqual(await handled(handle, IndexError()), "controller")
+
+    async def test_unhandled_exceptions_propagate(self):
+        handle = compile_filters((KeyErrors("handler"),))
+        error = RuntimeError("boom")
+        for _ in range(2):
+            with self.assertRaises(RuntimeError) as caught:
+                await handled(handle, error)
+            self.assertIs(caught.exception, error)
+
+    async def test_returned_http_exceptions_are_raised(self):
+        handle = compile_filters((Translate(),))
+        with self.assertRaises(HttpException) as caught:
+            await handled(handle, KeyError("user"))
+        self.assertEqual(caught.exception.status_code, 404)
+        self.assertIsInstance(caught.exception.__cause__, KeyError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import unittest
+from typing import Dict
+from nest_py.core.exceptions import ForbiddenException
+from nest_py.core.execution_context import ExecutionContext
+from nest_py.core.guards import CanActivate, compile_guards
+from nest_py.core.router import RadixRouter, compile_route
+from nest_py.core.structures import RouteDefinition
+
+
+class Recorder(CanActivate):
+    def __init__(self, allow=True):
+        self.allow = allow
+        self.seen = []
+
+    def can_activate(self, context):
+        self.seen.append(dict(context.kwargs))
+        return self.allow
+
+
+class Independent(CanActivate):
+    independent = True
+
+    def __init__(self, allow, delay=0.0):
+        self.allow = allow
+        self.delay = delay
+        self.finished = False
+
+    async def can_activate(self, context):
+        await asyncio.sleep(self.delay)
+        self.finished = True
+        return self.allow
+
+
+class OrdersController:
+
+    def create(self, uid: int, body: Dict[str, int], page: int = 1, tag: str = "all"):
+        return {"uid": uid, "page": page, "tag": tag, "body": body}
+
+
+def guarded_router(guard):
+    route = RouteDefinition(handler=OrdersController.create, metadata={"args": ("/orders/{uid}",), "kwargs": {"methods": ["POST"]}})
+    plan = compile_route(OrdersController, OrdersController().create, route, guards=(guard,))
+    router = RadixRouter()
+    router.add(plan)
+    return router, plan
+
+
+async def request(app, path, query=b"", body=b'{"a": 1}'):
+    received, sent = [], []
+
+    async def receive():
+        received.append(True)
+        return {"type": "http.request", "body": body}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": path, "query_string": query, "headers": []}
+    await app(scope, receive, send)
+    return sent[0]["status"], json.loads(sent[1]["body"]), bool(received)
+
+
+class AuthorizeTest(unittest.IsolatedAsyncioTestCase):
+    async def test_rejects_before_reading_the_body(self):
+        router, _ = guarded_router(Recorder(allow=False))
+        status, body, read = await request(router, "/orders/7", body=b"not json")
+        self.assertEqual((status, read), (403, False))
+        self.assertEqual(body, {"detail": "Forbidden resource"})
+
+    async def test_guards_run_once_and_see_converted_values(self):
+        guard = Recorder()
+        router, _ = guarded_router(guard)
+        status, body, _ = await request(router, "/orders/7", query=b"page=2")
+        self.assertEqual(status, 200)
+        self.assertEqual(body, {"uid": 7, "page": 2, "tag": "all", "body": {"a": 1}})
+        self.assertEqual(guard.seen, [{"uid": 7, "page": 2, "tag": "all"}])
+
+    async def test_both_adapters_hand_guards_the_same_values(self):
+        guard = Recorder()
+        router, plan = guarded_router(guard)
+        await request(router, "/orders/7", query=b"page=2")
+        await plan.endpoint(uid=7, body={"a": 1}, page=2, tag="all")
+        routed, direct = guard.seen
+        self.assertEqual(routed, {name: direct[name] for name in routed})
+
+    async def test_invalid_query_values_never_reach_the_guards(self):
+        guard = Recorder()
+        router, _ = guarded_router(guard)
+        status, _, read = await request(router, "/orders/7", query=b"page=two")
+        self.assertEqual((status, read, guard.seen), (422, False, []))
+
+
+class CompileGuardsTest(unittest.IsolatedAsyncioTestCase):
+    async def test_no_guards_compile_to_nothing(self):
+        self.assertIsNone(compile_guards(()))
+
+    async def test_first_failing_guard_stops_the_chain(self):
+        first, second = Recorder(allow=False), Recorder()
+        with self.assertRaises(ForbiddenException):
+            await compile_guards((first, second))(ExecutionContext(None, {}))
+        self.assertEqual((len(first.seen), second.seen), (1, []))
+
+    async def test_independent_guards_cancel_the_rest_on_failure(self):
+        slow, failing = Independent(True, delay=10), Independent(False)
+        with self.assertRaises(ForbiddenException):
+            await asyncio.wait_for(compile_guards((slow, failing))(ExecutionContext(None, {})), 1)
+        self.assertTrue(failing.finished)
+        self.assertFalse(slow.finished)
+
+
+if __name__ == "__main__":
+    unittest.main()
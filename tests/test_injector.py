@@ -0,0 +1,129 @@
+import unittest
+from typing import Any, Dict
+from nest_py.core.constants import Scope
+from nest_py.core.errors import CircularDependencyError, InvalidScopeError, UnknownDependencyError
+from nest_py.core.injector import Injector, RequestScope
+from nest_py.core.reflect import Reflect
+
+
+class Registry:
+    def __init__(self, *classes: Any, **options: Dict[str, Any]) -> None:
+        self._injectables: Dict[str, Any] = {}
+        for cls in classes:
+            self.provide(cls, **options.get(cls.__name__, {}))
+
+    def provide(self, cls: Any, scope: str = Scope.SINGLETON, pool_size: int = 0) -> None:
+        self._injectables[cls.__name__] = {
+            "injectable_class": cls,
+            "deps": Reflect.getSignature(cls),
+            "scope": scope,
+            "pool_size": pool_size,
+        }
+
+    def get_injectables(self) -> Dict[str, Any]:
+        return self._injectables
+
+    def get_controllers(self) -> Dict[str, Any]:
+        return {}
+
+
+class Config:
+    pass
+
+
+class Database:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Cache:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Users:
+    def __init__(self, database: Database, cache: Cache) -> None:
+        self.database = database
+        self.cache = cache
+
+
+class First:
+    def __init__(self, second: "Second") -> None: ...
+
+
+class Second:
+    def __init__(self, third: "Third") -> None: ...
+
+
+class Third:
+    def __init__(self, first: "First") -> None: ...
+
+
+class Needy:
+    def __init__(self, missing: "Missing") -> None: ...
+
+
+class Optional_:
+    def __init__(self, missing: "Missing" = None) -> None:
+        self.missing = missing
+
+
+class InjectorTest(unittest.TestCase):
+    def test_orders_providers_after_their_dependencies(self):
+        order = Injector(Registry(Users, Cache, Database, Config)).compile()
+        self.assertEqual(sorted(order), ["Cache", "Config", "Database", "Users"])
+        for provider, dependencies in (("Users", ("Database", "Cache")), ("Database", ("Config",)), ("Cache", ("Config",))):
+            for dependency in dependencies:
+                self.assertLess(order.index(dependency), order.index(provider))
+
+    def test_singletons_are_shared(self):
+        injector = Injector(Registry(Users, Cache, Database, Config))
+        instances = injector.instantiate()
+        users = instances["Users"]
+        self.assertIs(users.database.config, users.cache.config)
+        self.assertIs(injector.get(Users), users)
+
+    def test_detects_cycles_with_their_path(self):
+        with self.assertRaises(CircularDependencyError) as caught:
+            Injector(Registry(First, Second, Third)).compile()
+        path = caught.exception.path
+        self.assertEqual(path[0], path[-1])
+        self.assertEqual(set(path), {"First", "Second", "Third"})
+        self.assertEqual(len(path), 4)
+
+    def test_reports_unknown_dependencies(self):
+        with self.assertRaises(UnknownDependencyError) as caught:
+            Injector(Registry(Needy)).compile()
+        self.assertEqual((caught.exception.provider, caught.exception.parameter), ("Needy", "missing"))
+
+    def test_optional_unknown_dependency_keeps_its_default(self):
+        self.assertIsNone(Injector(Registry(Optional_)).get(Optional_).missing)
+
+    def test_refresh_extends_the_graph(self):
+        registry = Registry(Config)
+        injector = Injector(registry)
+        config = injector.get(Config)
+        registry.provide(Database)
+        injector.refresh()
+        self.assertIs(injector.get(Database).config, config)
+
+    def test_request_scope_is_promoted_to_dependents(self):
+        injector = Injector(Registry(Config, Database, Users, Cache, Database={"scope": Scope.REQUEST}))
+        injector.compile()
+        self.assertEqual(injector.get_plan(Users).scope, Scope.REQUEST)
+        self.assertEqual(injector.get_plan(Cache).scope, Scope.SINGLETON)
+        self.assertRaises(InvalidScopeError, injector.get, Users)
+
+        first, second = RequestScope(), RequestScope()
+        users = injector.resolve(Users, first)
+        self.assertIs(injector.resolve(Database, first), users.database)
+        self.assertIsNot(injector.resolve(Database, second), users.database)
+        self.assertIs(users.cache, injector.get(Cache))
+
+    def test_transient_providers_are_created_every_time(self):
+        injector = Injector(Registry(Config, Config={"scope": Scope.TRANSIENT}))
+        self.assertIsNot(injector.resolve(Config), injector.resolve(Config))
+
+
+if __name__ == "__main__":
+    unittest.main()
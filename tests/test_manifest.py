@@ -0,0 +1,105 @@
+import importlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from nest_py.core import NestPyApplicationContext
+from nest_py.core.manifest import MANIFEST_ENV, MANIFEST_PATH, MANIFEST_VERSION, Manifest, file_stamp, write_manifest
+
+SOURCE = "class UsersController:\n    def find(self):\n        return []\n"
+
+
+class ManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "manifest_fixture.py")
+        with open(self.path, "w") as source:
+            source.write(SOURCE)
+        sys.path.insert(0, self.directory.name)
+        self.addCleanup(sys.path.remove, self.directory.name)
+        self.addCleanup(sys.modules.pop, "manifest_fixture", None)
+        self.module = importlib.import_module("manifest_fixture")
+
+    def manifest(self, **overrides):
+        data = {
+            "version": MANIFEST_VERSION,
+            "python": list(sys.version_info[:2]),
+            "sources": {"manifest_fixture": file_stamp(self.path)},
+            "controllers": {
+                "UsersController": {
+                    "module": "manifest_fixture",
+                    "qualname": "UsersController",
+                    "sources": ["manifest_fixture"],
+                    "routes": [{"handler": "find", "metadata": {}}],
+                    "params": {},
+                }
+            },
+        }
+        data.update(overrides)
+        return write_manifest(data, os.path.join(self.directory.name, MANIFEST_PATH))
+
+    def test_serves_entries_of_unchanged_sources(self):
+        manifest = Manifest.load(self.manifest())
+        self.assertEqual(manifest.get_route_handlers(self.module.UsersController), ["find"])
+        self.assertEqual(manifest.stale_sources, [])
+
+    def test_touched_source_with_the_same_content_is_fresh(self):
+        path = self.manifest()
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+        self.assertEqual(Manifest.load(path).get_route_handlers(self.module.UsersController), ["find"])
+
+    def test_edited_source_is_stale(self):
+        path = self.manifest()
+        with open(self.path, "a") as source:
+            source.write("\n# edited\n")
+        manifest = Manifest.load(path)
+        self.assertIsNone(manifest.get_route_handlers(self.module.UsersController))
+        self.assertEqual(manifest.stale_sources, ["manifest_fixture"])
+
+    def test_moved_source_is_stale(self):
+        stamp = dict(file_stamp(self.path), path=os.path.join(self.directory.name, "elsewhere.py"))
+        manifest = Manifest.load(self.manifest(sources={"manifest_fixture": stamp}))
+        self.assertIsNone(manifest.get_route_handlers(self.module.UsersController))
+
+    def test_rejects_other_versions_and_broken_files(self):
+        self.assertIsNone(Manifest.load(self.manifest(version=MANIFEST_VERSION + 1)))
+        self.assertIsNone(Manifest.load(self.manifest(python=[2, 7])))
+        self.assertIsNone(Manifest.load(os.path.join(self.directory.name, "missing.json")))
+        path = self.manifest()
+        with open(path, "w") as output:
+            output.write("{")
+        self.assertIsNone(Manifest.load(path))
+
+    def test_round_trips_through_json(self):
+        with open(self.manifest()) as source:
+            self.assertEqual(json.load(source)["controllers"]["UsersController"]["routes"][0]["handler"], "find")
+
+
+class ContextManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.ctx_app = NestPyApplicationContext()
+        self.addCleanup(self.ctx_app._settings.pop, "manifest", None)
+        self.ctx_app._settings.pop("manifest", None)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        cwd = os.getcwd()
+        os.chdir(directory.name)
+        self.addCleanup(os.chdir, cwd)
+        write_manifest({"version": MANIFEST_VERSION, "python": list(sys.version_info[:2]), "sources": {}})
+
+    def test_falls_back_to_the_default_path(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop(MANIFEST_ENV, None)
+            self.assertIsInstance(self.ctx_app.get_manifest(), Manifest)
+
+    def test_empty_variable_disables_the_manifest(self):
+        with mock.patch.dict(os.environ, {MANIFEST_ENV: ""}):
+            self.assertIsNone(self.ctx_app.get_manifest())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import asyncio
+import unittest
+from nest_py.common.pipes import ValidationPipe
+from nest_py.core.constants import ParamKind
+from nest_py.core.exceptions import BadRequestException
+from nest_py.core.pipes import PipeTransform, compile_argument_pipes, trusted
+from nest_py.core.pipes.pipe import trusted_call
+from nest_py.core.structures import ParameterPlan
+
+try:
+    import pydantic
+except ImportError:
+    pydantic = None
+
+
+class Append(PipeTransform):
+    def __init__(self, suffix):
+        self.suffix = suffix
+
+    def transform(self, value, metadata):
+        return f"{value}{self.suffix}"
+
+
+class AsyncUpper(PipeTransform):
+    async def transform(self, value, metadata):
+        await asyncio.sleep(0)
+        return value.upper()
+
+
+def param(name, annotation=str, pipes=(), kind=ParamKind.QUERY):
+    return ParameterPlan(name, kind, annotation, None, True, None, pipes)
+
+
+class ArgumentPipesTest(unittest.IsolatedAsyncioTestCase):
+    async def test_no_pipes_compile_to_nothing(self):
+        self.assertIsNone(compile_argument_pipes((param("name"),)))
+
+    async def test_route_pipes_run_before_parameter_pipes(self):
+        apply = compile_argument_pipes((param("name", pipes=(Append("!"),)), param("other")), (Append("-"),))
+        kwargs = {"name": "a", "other": "b"}
+        await apply(kwargs)
+        self.assertEqual(kwargs, {"name": "a-!", "other": "b-"})
+
+    async def test_awaits_async_pipes(self):
+        apply = compile_argument_pipes((param("name", pipes=(AsyncUpper, Append("!"))),))
+        kwargs = {"name": "a"}
+        await apply(kwargs)
+        self.assertEqual(kwargs, {"name": "A!"})
+
+    async def test_trusted_calls_skip_every_pipe(self):
+        apply = compile_argument_pipes((param("name"),), (Append("!"),))
+        kwargs = {"name": "a"}
+        with trusted():
+            await apply(kwargs)
+        self.assertEqual(kwargs, {"name": "a"})
+        self.assertFalse(trusted_call.get())
+        await apply(kwargs)
+        self.assertEqual(kwargs, {"name": "a!"})
+
+    async def test_trusted_blocks_nest(self):
+        with trusted():
+            with trusted():
+                self.assertTrue(trusted_call.get())
+            self.assertTrue(trusted_call.get())
+        self.assertFalse(trusted_call.get())
+
+
+@unittest.skipIf(pydantic is None, "pydantic is not installed")
+class ValidationPipeTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        class User(pydantic.BaseModel):
+            name: str
+            age: int
+
+        self.User = User
+
+    async def test_validates_and_coerces(self):
+        apply = compile_argument_pipes((param("user", self.User, kind=ParamKind.BODY),), (ValidationPipe(),))
+        kwargs = {"user": {"name": "ada", "age": "36"}}
+        await apply(kwargs)
+        self.assertEqual(kwargs["user"], self.User(name="ada", age=36))
+
+    async def test_passes_validated_instances_through(self):
+        user = self.User(name="ada", age=36)
+        apply = compile_argument_pipes((param("user", self.User, kind=ParamKind.BODY),), (ValidationPipe(),))
+        kwargs = {"user": user}
+        await apply(kwargs)
+        self.assertIs(kwargs["user"], user)
+
+    async def test_rejects_invalid_values(self):
+        apply = compile_argument_pipes((param("age", int),), (ValidationPipe(strict=True),))
+        with self.assertRaises(BadRequestException):
+            await apply({"age": "36"})
+
+
+if __name__ == "__main__":
+    unittest.main()
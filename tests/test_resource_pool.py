@@ -0,0 +1,112 @@
+import asyncio
+import unittest
+from unittest import mock
+from nest_py.common.services import InMemoryPool, ResourcePool
+from nest_py.core.errors import NestPyError, PoolTimeoutError
+
+CLOCK = "nest_py.common.services.resource_pool.monotonic"
+
+
+class Resources:
+    def __init__(self, healthy=True):
+        self.opened = 0
+        self.closed = []
+        self.healthy = healthy
+        self.close_errors = 0
+
+    def open(self):
+        self.opened += 1
+        return self.opened
+
+    def close(self, resource):
+        if self.close_errors:
+            self.close_errors -= 1
+            raise OSError("close failed")
+        self.closed.append(resource)
+
+    def check(self, resource):
+        if isinstance(self.healthy, Exception):
+            raise self.healthy
+        return self.healthy
+
+
+def pool(resources, **options):
+    return ResourcePool(resources.open, resources.close, resources.check, **options)
+
+
+class ResourcePoolTest(unittest.IsolatedAsyncioTestCase):
+    async def test_reuses_the_most_recent_resource(self):
+        resources = Resources()
+        resource_pool = pool(resources)
+        first, second = await resource_pool.acquire(), await resource_pool.acquire()
+        await resource_pool.release(first)
+        await resource_pool.release(second)
+        self.assertEqual(await resource_pool.acquire(), second)
+        self.assertEqual((resource_pool.size, resource_pool.idle), (2, 1))
+
+    async def test_times_out_when_exhausted(self):
+        resource_pool = pool(Resources(), max_size=1, acquire_timeout=0.01)
+        async with resource_pool.lease():
+            with self.assertRaises(PoolTimeoutError):
+                await resource_pool.acquire()
+        self.assertEqual(await resource_pool.acquire(), 1)
+
+    async def test_replaces_resources_failing_their_check(self):
+        resources = Resources(healthy=False)
+        resource_pool = pool(resources, check_after=10)
+        with mock.patch(CLOCK, return_value=0.0):
+            await resource_pool.release(await resource_pool.acquire())
+        with mock.patch(CLOCK, return_value=20.0):
+            self.assertEqual(await resource_pool.acquire(), 2)
+        self.assertEqual((resources.closed, resource_pool.size), ([1], 1))
+
+    async def test_discards_resources_whose_check_raises(self):
+        resources = Resources(healthy=RuntimeError("check failed"))
+        resource_pool = pool(resources, max_size=1, check_after=10, acquire_timeout=0.01)
+        with mock.patch(CLOCK, return_value=0.0):
+            await resource_pool.release(await resource_pool.acquire())
+        with mock.patch(CLOCK, return_value=20.0), self.assertRaises(RuntimeError):
+            await resource_pool.acquire()
+        self.assertEqual((resources.closed, resource_pool.size), ([1], 0))
+        self.assertEqual(await resource_pool.acquire(), 2)
+
+    async def test_evicts_idle_resources_down_to_min_size(self):
+        resources = Resources()
+        resource_pool = pool(resources, min_size=1, max_idle=10)
+        with mock.patch(CLOCK, return_value=0.0):
+            leases = [await resource_pool.acquire() for _ in range(3)]
+            for resource in leases:
+                await resource_pool.release(resource)
+        with mock.patch(CLOCK, return_value=5.0):
+            self.assertEqual(await resource_pool.evict(), 0)
+        with mock.patch(CLOCK, return_value=20.0):
+            self.assertEqual(await resource_pool.evict(), 2)
+        self.assertEqual((resources.closed, resource_pool.size), ([1, 2], 1))
+
+    async def test_reaper_survives_failing_closes(self):
+        resources = Resources()
+        resources.close_errors = 1
+        resource_pool = pool(resources, max_idle=0.02)
+        await resource_pool.on_module_init()
+        for resource in [await resource_pool.acquire() for _ in range(2)]:
+            await resource_pool.release(resource)
+        with self.assertLogs("nest_py.pool", "ERROR"):
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.05)
+        self.assertEqual((resources.closed, resource_pool.size), ([2], 0))
+        await resource_pool.on_module_destroy()
+
+    async def test_close_refuses_new_leases(self):
+        resource_pool = InMemoryPool(min_size=2)
+        await resource_pool.fill()
+        async with resource_pool.lease() as connection:
+            await connection.set("key", "value")
+            await resource_pool.close()
+        self.assertTrue(connection.closed)
+        self.assertEqual((resource_pool.size, resource_pool.data), (0, {"key": "value"}))
+        with self.assertRaises(NestPyError):
+            await resource_pool.acquire()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+from uuid import UUID
+from nest_py.core.errors import NestPyError
+from nest_py.core.router import LinearRouter, RadixRouter, compile_route
+from nest_py.core.structures import RouteDefinition
+
+
+class UsersController:
+
+    def by_id(self, id: int):
+        return id
+
+    def by_name(self, name: str):
+        return name
+
+    def files(self, rest: str):
+        return rest
+
+    def plain(self):
+        return None
+
+
+def plan(method, path, handler=UsersController.plain):
+    route = RouteDefinition(handler=handler, metadata={"args": (path,), "kwargs": {"methods": [method]}})
+    return compile_route(UsersController, getattr(UsersController(), handler.__name__), route)
+
+
+def router(*plans, router_class=RadixRouter):
+    table = router_class()
+    for compiled in plans:
+        table.add(compiled)
+    return table
+
+
+class RadixRouterTest(unittest.TestCase):
+    def test_static_segments_take_precedence(self):
+        param, static = plan("GET", "/users/{name}", UsersController.by_name), plan("GET", "/users/me")
+        for table in (router(param, static), router(static, param)):
+            self.assertEqual(table.match("GET", "/users/me"), (static, {}))
+            self.assertEqual(table.match("GET", "/users/ada"), (param, {"name": "ada"}))
+
+    def test_falls_back_to_params_for_other_methods(self):
+        export, update = plan("GET", "/users/export"), plan("PUT", "/users/{name}", UsersController.by_name)
+        table = router(export, update)
+        self.assertEqual(table.match("PUT", "/users/export"), (update, {"name": "export"}))
+        self.assertEqual(table.match("GET", "/users/export"), (export, {}))
+        self.assertEqual(table.allowed_methods("/users/export"), ["GET", "PUT"])
+
+    def test_backtracks_out_of_dead_ends(self):
+        deep, shallow = plan("GET", "/a/b/c"), plan("GET", "/a/{name}/d", UsersController.by_name)
+        table = router(deep, shallow)
+        self.assertEqual(table.match("GET", "/a/b/d"), (shallow, {"name": "b"}))
+
+    def test_applies_converters(self):
+        number = plan("GET", "/items/{id:int}", UsersController.by_id)
+        name = plan("GET", "/items/{name}", UsersController.by_name)
+        token = plan("GET", "/tokens/{name:uuid}", UsersController.by_name)
+        table = router(number, name, token)
+        self.assertEqual(table.match("GET", "/items/42"), (number, {"id": 42}))
+        self.assertEqual(table.match("GET", "/items/forty-two"), (name, {"name": "forty-two"}))
+        uuid = "12345678-1234-5678-1234-567812345678"
+        self.assertEqual(table.match("GET", f"/tokens/{uuid}"), (token, {"name": UUID(uuid)}))
+        self.assertIsNone(table.match("GET", "/tokens/nope"))
+
+    def test_untyped_params_use_the_annotation(self):
+        table = router(plan("GET", "/items/{id}", UsersController.by_id))
+        self.assertEqual(table.match("GET", "/items/7")[1], {"id": 7})
+        self.assertIsNone(table.match("GET", "/items/seven"))
+
+    def test_catch_all_takes_the_rest_of_the_path(self):
+        files = plan("GET", "/files/{rest:path}", UsersController.files)
+        table = router(files)
+        self.assertEqual(table.match("GET", "/files/a/b/c.txt"), (files, {"rest": "a/b/c.txt"}))
+
+    def test_unknown_converter_names_the_route(self):
+        with self.assertRaises(NestPyError) as caught:
+            router(plan("GET", "/items/{name:slug}", UsersController.by_name))
+        self.assertIn("/items/{name:slug}", str(caught.exception))
+
+    def test_distinguishes_405_from_404(self):
+        table = router(plan("GET", "/users"), plan("POST", "/users"), plan("DELETE", "/users/{id:int}", UsersController.by_id))
+        self.assertIsNone(table.match("PUT", "/users"))
+        self.assertEqual(table.allowed_methods("/users"), ["GET", "POST"])
+        self.assertEqual(table.allowed_methods("/users/1"), ["DELETE"])
+        self.assertEqual(table.allowed_methods("/users/one"), [])
+        self.assertEqual(table.allowed_methods("/missing"), [])
+        self.assertEqual(len(table), 3)
+
+    def test_agrees_with_the_linear_router(self):
+        plans = [
+            plan("GET", "/users/me"),
+            plan("GET", "/users/{name}", UsersController.by_name),
+            plan("PUT", "/users/{name}", UsersController.by_name),
+            plan("GET", "/users/{name}/posts/{rest}", UsersController.by_name),
+            plan("POST", "/users"),
+            plan("GET", "/files/{rest:path}", UsersController.files),
+        ]
+        radix, linear = router(*plans), router(*plans, router_class=LinearRouter)
+        requests = [
+            (method, path)
+            for method in ("GET", "PUT", "POST", "DELETE")
+            for path in ("/users", "/users/me", "/users/ada", "/users/ada/posts/1", "/files/a/b", "/files/", "/nope", "/users/")
+        ]
+        for method, path in requests:
+            with self.subTest(method=method, path=path):
+                self.assertEqual(radix.match(method, path), linear.match(method, path))
+                self.assertEqual(radix.allowed_methods(path), linear.allowed_methods(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
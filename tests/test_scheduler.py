@@ -0,0 +1,172 @@
+import asyncio
+import unittest
+from typing import Any, Dict, List
+from nest_py.common import cron, interval, timeout
+from nest_py.common.decorators.core.schedule import schedule
+from nest_py.core.services import Scheduler
+from nest_py.core.structures import ScheduledJob
+
+
+class Injector:
+    def __init__(self, instances: Dict[str, Any]) -> None:
+        self._instances = instances
+
+    def get_instances(self) -> Dict[str, Any]:
+        return self._instances
+
+    def get_order(self) -> List[str]:
+        return list(self._instances)
+
+
+class Context:
+    def __init__(self, **instances: Any) -> None:
+        self._injector = Injector(instances)
+
+    def get_injector(self) -> Injector:
+        return self._injector
+
+
+class Concurrency:
+    def __init__(self) -> None:
+        self.runs = 0
+        self.current = 0
+        self.peak = 0
+
+    async def run(self, seconds: float) -> None:
+        self.runs += 1
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self.current -= 1
+
+
+class SchedulerTest(unittest.IsolatedAsyncioTestCase):
+    async def run_scheduler(self, scheduler: Scheduler, seconds: float) -> None:
+        scheduler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            await scheduler.stop()
+
+    async def test_collects_decorated_methods(self):
+        class Jobs:
+            @interval(60)
+            async def every_minute(self): ...
+
+            @timeout(5)
+            @cron("@daily")
+            def twice(self): ...
+
+            def plain(self): ...
+
+        jobs = Scheduler(Context(Jobs=Jobs())).jobs()
+        self.assertEqual(sorted((name, job.kind) for _, name, job in jobs), [
+            ("every_minute", "interval"), ("twice", "cron"), ("twice", "timeout"),
+        ])
+
+    async def test_skips_ticks_while_running(self):
+        tracker = Concurrency()
+
+        class Jobs:
+            @interval(0.02)
+            async def slow(self):
+                await tracker.run(0.15)
+
+        scheduler = Scheduler(Context(Jobs=Jobs()))
+        await self.run_scheduler(scheduler, 0.4)
+        self.assertEqual(tracker.peak, 1)
+        self.assertGreater(scheduler.skipped, 0)
+        self.assertLessEqual(tracker.runs, 3)
+
+    async def test_overlap_allows_concurrent_runs(self):
+        tracker = Concurrency()
+
+        class Jobs:
+            @interval(0.02, overlap=True)
+            async def slow(self):
+                await tracker.run(0.15)
+
+        scheduler = Scheduler(Context(Jobs=Jobs()))
+        await self.run_scheduler(scheduler, 0.3)
+        self.assertGreater(tracker.peak, 1)
+        self.assertEqual(scheduler.skipped, 0)
+
+    async def test_group_limit_caps_concurrency(self):
+        tracker = Concurrency()
+
+        class Jobs:
+            @interval(0.01, overlap=True, group="reports")
+            async def first(self):
+                await tracker.run(0.05)
+
+            @interval(0.01, overlap=True, group="reports")
+            async def second(self):
+                await tracker.run(0.05)
+
+        scheduler = Scheduler(Context(Jobs=Jobs())).set_group_limit("reports", 2)
+        await self.run_scheduler(scheduler, 0.3)
+        self.assertEqual(tracker.peak, 2)
+        self.assertGreater(tracker.runs, 2)
+
+    async def test_failures_are_counted_and_do_not_stop_the_job(self):
+        calls = []
+
+        class Jobs:
+            @interval(0.02)
+            def fail(self):
+                calls.append(1)
+                raise RuntimeError("failed")
+
+        scheduler = Scheduler(Context(Jobs=Jobs()))
+        with self.assertLogs("nest_py.scheduler", "ERROR"):
+            await self.run_scheduler(scheduler, 0.15)
+        self.assertGreater(len(calls), 1)
+        self.assertEqual(scheduler.failed, len(calls))
+
+    async def test_timeout_runs_once(self):
+        calls = []
+
+        class Jobs:
+            @timeout(0.01)
+            async def once(self):
+                calls.append(1)
+
+        await self.run_scheduler(Scheduler(Context(Jobs=Jobs())), 0.1)
+        self.assertEqual(calls, [1])
+
+    async def test_stop_cancels_running_jobs(self):
+        cancelled = []
+
+        class Jobs:
+            @timeout(0)
+            async def long(self):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(1)
+                    raise
+
+        await self.run_scheduler(Scheduler(Context(Jobs=Jobs())), 0.05)
+        self.assertEqual(cancelled, [1])
+
+    async def test_cron_that_never_fires_ends_its_loop(self):
+        class Jobs:
+            @schedule(ScheduledJob("cron", cron="0 0 31 2 *"))
+            async def never(self): ...
+
+        scheduler = Scheduler(Context(Jobs=Jobs()))
+        with self.assertLogs("nest_py.scheduler", "ERROR"):
+            scheduler.start()
+            await asyncio.sleep(0.05)
+        self.assertTrue(all(task.done() for task in scheduler._loops))
+        await scheduler.stop()
+
+    def test_cron_rejects_expressions_that_never_fire(self):
+        self.assertRaises(ValueError, cron, "0 0 31 2 *")
+        self.assertRaises(ValueError, cron, "0 0 * *")
+
+
+if __name__ == "__main__":
+    unittest.main()